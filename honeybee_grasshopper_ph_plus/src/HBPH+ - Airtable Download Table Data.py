@@ -53,6 +53,22 @@ https://airtable.com/app2huKgwyKrnMRbp/tblaqehqmP6xfOPUP/viwpz3Fm16Fq8X38i?block
             
         _download: (bool) Set True to download the data from the 
             specified database and table.
+
+        _use_mirror: (bool) Optional. Default=False. Set True to keep a local copy 
+            (mirror) of the table, and on each download only fetch the records which 
+            have been added / changed / deleted since the last download. If a column 
+            is renamed or deleted in AirTable, delete the mirror file (its path is 
+            shown in the component's messages) to download the whole table again.
+
+        _fields: (List[str]) Optional. The names of the fields (columns) to download. 
+            Use the exact AirTable field names (case-sensitive). Leave empty to 
+            download all of the fields.
+
+        _filter_formula: (str) Optional. An AirTable formula: only the records for 
+            which it is true are downloaded. ie: "{TYPE} = 'Mineral Wool'"
+
+        _view: (str) Optional. The name or ID of an AirTable view: only the records 
+            shown in that view are downloaded, in the view's order.
             
     Returns:
         
@@ -89,5 +105,9 @@ gh_compo_interface = gh_compo_io.GHCompo_AirTableDownloadTableData(
     _base_id_number, 
     _table_id_number,
     _download,
+    _use_mirror,
+    _fields,
+    _filter_formula,
+    _view,
     )
 records_ = gh_compo_interface.run()
\ No newline at end of file
@@ -40,7 +40,7 @@ EM January 25, 2024
 "ID: int"
 - - - 
             will case the "Height" and "Width" attributes to float types, but will cast the 
-            "ID" attribute as an int. 
+            "ID" attribute as an int. An empty value in a typed column is read as None.
         
     Returns:
         objects_: The list of new Objects created from the CSV file.
@@ -37,6 +37,10 @@ EM July 5, 2026
 
         _download: (bool) Set True to download the aperture types from the project.
 
+        _snapshot: (PHNavSnapshot) Optional. A snapshot from 'PH-Nav Get Snapshot'. If
+            given, the aperture types are read from the snapshot (no download) and the
+            '_project_number', '_version' and '_download' inputs are ignored.
+
     Returns:
         window_types_: (CustomCollection[WindowUnitType]) The Honeybee-PH window-unit
             types (geometry), keyed by type-name. Wire to 'HBPH+ - Create Window Geometry'.
@@ -89,5 +93,6 @@ gh_compo_interface = gh_compo_io.GHCompo_PHNavV1GetApertures(
     "http://localhost:8000/api/v1/gh" if DEV else "",
     _token,
     _download,
+    _snapshot,
     )
 window_types_, constructions_, json_, last_modified_ = gh_compo_interface.run()
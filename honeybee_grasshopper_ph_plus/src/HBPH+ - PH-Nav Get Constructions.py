@@ -37,6 +37,10 @@ EM July 5, 2026
 
         _download: (bool) Set True to download the assemblies from the project.
 
+        _snapshot: (PHNavSnapshot) Optional. A snapshot from 'PH-Nav Get Snapshot'. If
+            given, the assemblies are read from the snapshot (no download) and the
+            '_project_number', '_version' and '_download' inputs are ignored.
+
     Returns:
         constructions_: (CustomCollection[OpaqueConstruction]) The Honeybee-Energy
             Constructions built from the assemblies on the PH-Navigator project, keyed
@@ -87,5 +91,6 @@ gh_compo_interface = gh_compo_io.GHCompo_PHNavV1GetConstructions(
     "http://localhost:8000/api/v1/gh" if DEV else "",
     _token,
     _download,
+    _snapshot,
     )
 constructions_, last_modified_, json_ = gh_compo_interface.run()
@@ -52,6 +52,14 @@ EM July 5, 2026
 
         _download: (bool) Set True to download the table from the project.
 
+        _snapshot: (PHNavSnapshot) Optional. A snapshot from 'PH-Nav Get Snapshot'. If
+            given, the table are read from the snapshot (no download) and the
+            '_project_number', '_version' and '_download' inputs are ignored.
+
+        _full_json: (bool) Optional. Default=True. Set False to skip building the full
+            'json_' text, which can be slow for a large table. The 'json_preview_'
+            output is always available.
+
     Returns:
         records_: (list[TableRecord]) One 'TableRecord' per row: 'id' + the typed
             built-in columns + a 'custom_values' bag + a 'custom_links' bag. Dict-like
@@ -69,10 +77,13 @@ EM July 5, 2026
         table_name_: (str) The resolved table name (feeds 'PH-Nav Organize Table').
 
         json_: (str) The raw downloaded table data, as a formatted JSON string
-            (handy for debugging).
+            (handy for debugging). Empty if '_full_json' is False.
 
         last_modified_: (str) The save-timestamp of the downloaded version (for
             freshness / change-detection).
+
+        json_preview_: (TablePreview) A quick preview of 'json_': the JSON text is
+            only built when it is displayed, and shows only the first 100 records.
 """
 
 import scriptcontext as sc
@@ -115,5 +126,7 @@ gh_compo_interface = gh_compo_io.GHCompo_PHNavV1GetTable(
     "http://localhost:8000/api/v1/gh" if DEV else "",
     _token,
     _download,
+    _snapshot,
+    _full_json,
     )
-records_, record_collection_, field_defs_, table_name_, json_, last_modified_ = gh_compo_interface.run()
+records_, record_collection_, field_defs_, table_name_, json_, last_modified_, json_preview_ = gh_compo_interface.run()
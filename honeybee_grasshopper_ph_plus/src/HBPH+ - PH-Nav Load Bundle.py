@@ -0,0 +1,78 @@
+#
+# Honeybee-PH: A Plugin for adding Passive-House data to LadybugTools Honeybee-Energy Models
+#
+# This component is part of the PH-Tools toolkit <https://github.com/PH-Tools>.
+#
+# Copyright (c) 2022, PH-Tools and bldgtyp, llc <phtools@bldgtyp.com>
+# Honeybee-PH is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# Honeybee-PH is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <https://github.com/PH-Tools/honeybee_ph/blob/main/LICENSE>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Load a PH-Navigator snapshot from a bundle file saved by 'PH-Nav Save Bundle'. Wire the
+'snapshot_' output into the '_snapshot' input of 'PH-Nav Get Constructions', 'PH-Nav Get
+Apertures' or 'PH-Nav Get Table' to build their objects from the bundle, with no network
+access at all.
+-
+EM October 19, 2026
+    Args:
+        _file_path: (str) The bundle file to load (a '.phnav.json.gz' file).
+
+    Returns:
+        snapshot_: (PHNavSnapshot) The routes saved in the bundle, all at the same version.
+            Wire to the '_snapshot' input of the other 'PH-Nav Get ...' components.
+
+        routes_: (list[str]) The names of the routes in the bundle.
+
+        version_id_: (str) The 'version_id' every route in the bundle was read at.
+
+        last_modified_: (str) The save-timestamp of the bundled version.
+"""
+
+import scriptcontext as sc
+import Rhino as rh
+import rhinoscriptsyntax as rs
+import ghpythonlib.components as ghc
+import Grasshopper as gh
+
+try:
+    from honeybee_ph_plus_rhino import gh_compo_io
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_ph_plus_rhino:\n\t{}'.format(e))
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError('\nFailed to import ph_gh_component_io:\n\t{}'.format(e))
+
+
+# ------------------------------------------------------------------------------
+import honeybee_ph_plus_rhino._component_info_
+reload(honeybee_ph_plus_rhino._component_info_)
+ghenv.Component.Name = "HBPH+ - PH-Nav Load Bundle"
+DEV = honeybee_ph_plus_rhino._component_info_.set_component_params(ghenv, dev=False)
+if DEV:
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1 import bundle_load as gh_compo_io
+    reload(gh_compo_io)
+
+# ------------------------------------------------------------------------------
+# -- GH Interface
+IGH = gh_io.IGH( ghdoc, ghenv, sc, rh, rs, ghc, gh )
+
+# ------------------------------------------------------------------------------
+gh_compo_interface = gh_compo_io.GHCompo_PHNavV1LoadBundle(
+    IGH,
+    _file_path,
+    )
+snapshot_, routes_, version_id_, last_modified_ = gh_compo_interface.run()
@@ -0,0 +1,79 @@
+#
+# Honeybee-PH: A Plugin for adding Passive-House data to LadybugTools Honeybee-Energy Models
+#
+# This component is part of the PH-Tools toolkit <https://github.com/PH-Tools>.
+#
+# Copyright (c) 2022, PH-Tools and bldgtyp, llc <phtools@bldgtyp.com>
+# Honeybee-PH is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# Honeybee-PH is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <https://github.com/PH-Tools/honeybee_ph/blob/main/LICENSE>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Save a PH-Navigator snapshot (from 'PH-Nav Get Snapshot') to a single compressed bundle
+file on this computer. Load the bundle again with 'PH-Nav Load Bundle' to work with the
+project's data offline, or on a slow connection, without downloading it again. The
+bundle holds every route in the snapshot, all at the snapshot's saved version.
+-
+EM October 19, 2026
+    Args:
+        _snapshot: (PHNavSnapshot) The snapshot to save, from 'PH-Nav Get Snapshot'.
+
+        _file_path: (str) Optional. The bundle file to write (ie: 'C:/bundles/2524.phnav.json.gz').
+            Leave empty to save to the default folder (next to the PH-Navigator download
+            cache, in the Honeybee simulation folder), named by project number and version.
+
+        _save: (bool) Set True to write the bundle file. An existing file is overwritten.
+
+    Returns:
+        file_path_: (str) The path of the saved bundle file.
+"""
+
+import scriptcontext as sc
+import Rhino as rh
+import rhinoscriptsyntax as rs
+import ghpythonlib.components as ghc
+import Grasshopper as gh
+
+try:
+    from honeybee_ph_plus_rhino import gh_compo_io
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_ph_plus_rhino:\n\t{}'.format(e))
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError('\nFailed to import ph_gh_component_io:\n\t{}'.format(e))
+
+
+# ------------------------------------------------------------------------------
+import honeybee_ph_plus_rhino._component_info_
+reload(honeybee_ph_plus_rhino._component_info_)
+ghenv.Component.Name = "HBPH+ - PH-Nav Save Bundle"
+DEV = honeybee_ph_plus_rhino._component_info_.set_component_params(ghenv, dev=False)
+if DEV:
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1 import bundle_save as gh_compo_io
+    reload(gh_compo_io)
+
+# ------------------------------------------------------------------------------
+# -- GH Interface
+IGH = gh_io.IGH( ghdoc, ghenv, sc, rh, rs, ghc, gh )
+
+# ------------------------------------------------------------------------------
+gh_compo_interface = gh_compo_io.GHCompo_PHNavV1SaveBundle(
+    IGH,
+    _snapshot,
+    _file_path,
+    _save,
+    )
+file_path_ = gh_compo_interface.run()
@@ -0,0 +1,92 @@
+#
+# Honeybee-PH: A Plugin for adding Passive-House data to LadybugTools Honeybee-Energy Models
+# 
+# This component is part of the PH-Tools toolkit <https://github.com/PH-Tools>.
+# 
+# Copyright (c) 2022, PH-Tools and bldgtyp, llc <phtools@bldgtyp.com> 
+# Honeybee-PH is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# Honeybee-PH is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <https://github.com/PH-Tools/honeybee_ph/blob/main/LICENSE>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Find the items in a Custom-Collection by the value of one of their attributes: the items
+whose attribute is equal to one of the _equals values, or is between _min and _max, or
+starts with the _prefix text. The collection keeps an index of the attribute values (built
+on the first query), so later queries on the same collection do not loop over all its items.
+-
+EM October 19, 2026
+    Args:
+
+        _collection: (CustomCollection) The collection to find the items in.
+
+        _attribute: (str) The name of the item attribute to query (ie: "TYPE").
+
+        _equals: (list[Any]) Find the items whose attribute is equal to any of these values.
+
+        _min: (Any) Optional. Find the items whose attribute is this value or more. Use
+            numbers for number attributes and text for text attributes.
+
+        _max: (Any) Optional. Find the items whose attribute is this value or less.
+
+        _prefix: (str) Find the items whose (text) attribute starts with this text.
+
+    Returns:
+
+        keys_: (list[str]) The keys of the items found. In value order for a _min / _max
+            or _prefix query, in key order for an _equals query.
+
+        items_: (list[Any]) The items found, one for each of the keys_.
+"""
+
+import scriptcontext as sc
+import Rhino as rh
+import rhinoscriptsyntax as rs
+import ghpythonlib.components as ghc
+import Grasshopper as gh
+
+try:
+    from honeybee_ph_plus_rhino import gh_compo_io
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_ph_rhino:\n\t{}'.format(e))
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError('\nFailed to import ph_gh_component_io:\n\t{}'.format(e))
+
+
+# ------------------------------------------------------------------------------
+import honeybee_ph_plus_rhino._component_info_
+reload(honeybee_ph_plus_rhino._component_info_)
+ghenv.Component.Name = "HBPH+ - Query Custom Collection"
+DEV = honeybee_ph_plus_rhino._component_info_.set_component_params(ghenv, dev=False)
+if DEV:
+    from honeybee_ph_plus_rhino.gh_compo_io.collections import query_collection as gh_compo_io
+    reload(gh_compo_io)
+
+# ------------------------------------------------------------------------------
+# -- GH Interface
+IGH = gh_io.IGH( ghdoc, ghenv, sc, rh, rs, ghc, gh )
+
+# ------------------------------------------------------------------------------
+gh_compo_interface = gh_compo_io.GHCompo_QueryCustomCollection(
+    IGH,
+    _collection,
+    _attribute,
+    _equals,
+    _min,
+    _max,
+    _prefix,
+)
+keys_, items_ = gh_compo_interface.run()
\ No newline at end of file
@@ -0,0 +1,90 @@
+#
+# Honeybee-PH: A Plugin for adding Passive-House data to LadybugTools Honeybee-Energy Models
+# 
+# This component is part of the PH-Tools toolkit <https://github.com/PH-Tools>.
+# 
+# Copyright (c) 2022, PH-Tools and bldgtyp, llc <phtools@bldgtyp.com> 
+# Honeybee-PH is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# Honeybee-PH is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <https://github.com/PH-Tools/honeybee_ph/blob/main/LICENSE>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Set many items on a Custom-Collection at once: from parallel lists of keys and items,
+and / or by merging in other Custom-Collections. This is much faster than a chain of
+'Set Item In Custom Collection' components. The input collection is not changed.
+-
+EM October 19, 2026
+    Args:
+
+        _collection: (CustomCollection) Optional. The base collection to add the items to.
+            Leave empty to start from a new, empty collection.
+
+        _keys: (list[str]) The keys to use for storing the _items.
+
+        _items: (list[Any]) The items to store, one for each of the _keys.
+
+        _collections: (list[CustomCollection]) Optional. Other collections to merge in. Their
+            items are set first (in order), then the _keys / _items.
+
+        _on_conflict: (str) Default="replace". What to do when a key is already set (in the
+            base collection, or earlier in the new items):
+            - "replace": The new item replaces the old one (the last one wins).
+            - "keep": The old item is kept (the first one wins).
+            - "error": Nothing is set, and the conflicting keys are listed in an error.
+
+    Returns:
+
+        collection_: (CustomCollection) The collection with all of the items set.
+"""
+
+import scriptcontext as sc
+import Rhino as rh
+import rhinoscriptsyntax as rs
+import ghpythonlib.components as ghc
+import Grasshopper as gh
+
+try:
+    from honeybee_ph_plus_rhino import gh_compo_io
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_ph_rhino:\n\t{}'.format(e))
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError('\nFailed to import ph_gh_component_io:\n\t{}'.format(e))
+
+
+# ------------------------------------------------------------------------------
+import honeybee_ph_plus_rhino._component_info_
+reload(honeybee_ph_plus_rhino._component_info_)
+ghenv.Component.Name = "HBPH+ - Set Items In Custom Collection"
+DEV = honeybee_ph_plus_rhino._component_info_.set_component_params(ghenv, dev=False)
+if DEV:
+    from honeybee_ph_plus_rhino.gh_compo_io.collections import set_items_in_collection as gh_compo_io
+    reload(gh_compo_io)
+
+# ------------------------------------------------------------------------------
+# -- GH Interface
+IGH = gh_io.IGH( ghdoc, ghenv, sc, rh, rs, ghc, gh )
+
+# ------------------------------------------------------------------------------
+gh_compo_interface = gh_compo_io.GHCompo_SetItemsInCustomCollection(
+    IGH,
+    _collection,
+    _keys,
+    _items,
+    _collections,
+    _on_conflict,
+)
+collection_ = gh_compo_interface.run()
\ No newline at end of file
@@ -41,6 +41,18 @@ COMPONENT_PARAMS = {
         "Category": CATEGORY,
         "SubCategory": 1,
     },
+    "HBPH+ - Set Items In Custom Collection": {
+        "NickName": "Set Items In Collection",
+        "Message": RELEASE_VERSION,
+        "Category": CATEGORY,
+        "SubCategory": 1,
+    },
+    "HBPH+ - Query Custom Collection": {
+        "NickName": "Query Collection",
+        "Message": RELEASE_VERSION,
+        "Category": CATEGORY,
+        "SubCategory": 1,
+    },
     # -- GH-PY
     "HBPH+ - Get Object Attributes": {
         "NickName": "Get Attributes",
@@ -279,6 +291,24 @@ COMPONENT_PARAMS = {
         "Category": CATEGORY,
         "SubCategory": 4,
     },
+    "HBPH+ - PH-Nav Get Snapshot": {
+        "NickName": "PH-Nav Get Snapshot",
+        "Message": RELEASE_VERSION,
+        "Category": CATEGORY,
+        "SubCategory": 4,
+    },
+    "HBPH+ - PH-Nav Save Bundle": {
+        "NickName": "PH-Nav Save Bundle",
+        "Message": RELEASE_VERSION,
+        "Category": CATEGORY,
+        "SubCategory": 4,
+    },
+    "HBPH+ - PH-Nav Load Bundle": {
+        "NickName": "PH-Nav Load Bundle",
+        "Message": RELEASE_VERSION,
+        "Category": CATEGORY,
+        "SubCategory": 4,
+    },
     # -- Reporting / PDF
     "HBPH+ - Report Envelope Data": {
         "NickName": "Report Envelope",
@@ -0,0 +1 @@
+"""A stub Airtable server, and checks / timing benchmarks for the Airtable client and mirror."""
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Check and time `AirtableClient` downloads against the local stub Airtable server.
+
+Run from the repository root (CPython, with the plugin's packages installed):
+
+    python -m honeybee_ph_plus_rhino.gh_compo_io.airtable.benchmark.run_benchmarks [options]
+
+Options:
+    * --records (int): The number of records in the stub table. Default=5000
+    * --latency (float): The stub server's response time, in seconds per request. Default=0.25
+    * --work (float): The time the caller spends on each page (decode / build), in seconds. Default=0.0
+
+The client is given a `PythonTransport` through its `_transport` hook. First, the
+checks run against a zero-latency stub:
+
+    * paging: every record, in order, one request per 100 records;
+    * retries: a 429 and a 503 are retried; a 5xx which does not go away, and a
+      401, raise `AirtableError` (the 401 with no retry);
+    * the trailing-offset fast path: the next page's `offset` is read from the end
+      of each page body, without decoding the page (a record field named 'offset'
+      must not be mistaken for it, so the last page, which has no `offset`, is decoded).
+
+Then the download of the whole table is timed with the stub's latency: the client
+(next page downloaded while the caller works on the current one) against a plain
+sequential download (one page at a time, decoded before the next request).
+
+The script exits with code 1 if any check fails.
+"""
+
+import argparse
+import json
+import sys
+import time
+import timeit
+
+from honeybee_ph_plus_rhino.gh_compo_io.airtable.benchmark.stub_server import (
+    BASE_ID,
+    TABLE_ID,
+    TOKEN,
+    StubServer,
+    make_records,
+)
+from honeybee_ph_plus_rhino.gh_compo_io.airtable.client import AirtableClient, AirtableError, _next_offset
+from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.transport import PythonTransport
+
+
+def make_client(_stub: StubServer, _token: str = TOKEN, _fast: bool = True) -> AirtableClient:
+    """Return a client for the stub's table. `_fast`: no rate-limit spacing and near-zero retry waits."""
+    client = AirtableClient(_token, BASE_ID, TABLE_ID, _transport=PythonTransport())
+    client.URL_BASE = _stub.url_base
+    if _fast:
+        client.MIN_REQUEST_INTERVAL_S = 0.0
+        client.RATE_LIMIT_WAIT_S = 0.01
+        client.RETRY_BACKOFF_S = 0.001
+    return client
+
+
+def check_paging(_stub: StubServer) -> list[str]:
+    """Return a message for each failure to download the whole table, in order, one page per request."""
+    failures = []
+    num_requests = len(_stub.state.requests)
+    records = make_client(_stub).list_records()
+    num_pages = -(-len(_stub.state.records) // AirtableClient.PAGE_SIZE)
+
+    if records != _stub.state.records:
+        failures.append(f"paging: got {len(records)} records, expected {len(_stub.state.records)} (in order)")
+    if len(_stub.state.requests) - num_requests != num_pages:
+        failures.append(f"paging: {len(_stub.state.requests) - num_requests} requests for {num_pages} pages")
+    return failures
+
+
+def check_retries(_stub: StubServer) -> list[str]:
+    """Return a message for each failure to retry (or not retry) a failed request."""
+    failures = []
+
+    # -- A 429 (rate-limited), then a 503: both retried, then the download completes
+    _stub.state.fail = [429, 503]
+    num_requests = len(_stub.state.requests)
+    try:
+        records = make_client(_stub).list_records()
+    except AirtableError as e:
+        failures.append(f"retries: 429 + 503 were not retried: {e}")
+    else:
+        num_pages = -(-len(_stub.state.records) // AirtableClient.PAGE_SIZE)
+        if records != _stub.state.records:
+            failures.append("retries: wrong records after 429 + 503")
+        if len(_stub.state.requests) - num_requests != num_pages + 2:
+            failures.append(f"retries: {len(_stub.state.requests) - num_requests} requests, expected {num_pages + 2}")
+
+    # -- A 5xx which does not go away: give up after MAX_RETRIES
+    _stub.state.fail = [500] * (AirtableClient.MAX_RETRIES + 1)
+    num_requests = len(_stub.state.requests)
+    try:
+        make_client(_stub).list_records()
+        failures.append("retries: a lasting 500 did not raise AirtableError")
+    except AirtableError:
+        if len(_stub.state.requests) - num_requests != AirtableClient.MAX_RETRIES + 1:
+            failures.append(f"retries: gave up after {len(_stub.state.requests) - num_requests} requests")
+    _stub.state.fail = []
+
+    # -- A 401: raised at once, never retried
+    num_requests = len(_stub.state.requests)
+    try:
+        make_client(_stub, "bad-token").list_records()
+        failures.append("retries: a 401 did not raise AirtableError")
+    except AirtableError:
+        if len(_stub.state.requests) - num_requests != 1:
+            failures.append(f"retries: a 401 was sent {len(_stub.state.requests) - num_requests} times")
+    return failures
+
+
+def check_trailing_offset(_stub: StubServer) -> tuple[list[str], dict[str, float]]:
+    """Check that each page's `offset` is read from the end of its body, without decoding the page.
+
+    Returns the failure messages, and the time to read the offsets of all the
+    pages that way vs. with a full `json.loads` of each page.
+    """
+    failures = []
+    client = make_client(_stub)
+    headers = {"Authorization": f"Bearer {TOKEN}"}
+
+    bodies = []
+    offset = None
+    while True:
+        body = client.transport.get(client._page_url([], offset), headers).body
+        bodies.append(body)
+        offset = json.loads(body).get("offset")
+        if not offset:
+            break
+
+    for i, body in enumerate(bodies):
+        fast_offset, decoded_page = _next_offset(body)
+        # -- The last page has no `offset`, but its records' 'offset' fields do: that page
+        # -- is decoded (once: the decoded page is handed on), every other page is not.
+        if decoded_page is not None and i < len(bodies) - 1:
+            failures.append(f"trailing offset: page {i} was decoded to find its offset")
+        if fast_offset != json.loads(body).get("offset"):
+            failures.append(f"trailing offset: page {i} offset {fast_offset!r} is wrong")
+
+    timings = {
+        "trailing_offset": min(timeit.repeat(lambda: [_next_offset(b) for b in bodies], number=1, repeat=5)),
+        "json_loads": min(timeit.repeat(lambda: [json.loads(b).get("offset") for b in bodies], number=1, repeat=5)),
+    }
+    return failures, timings
+
+
+def sequential_download(_stub: StubServer, _work: float) -> int:
+    """The download without the client: one page at a time, each decoded (and worked on) before the next request."""
+    transport = PythonTransport()
+    headers = {"Authorization": f"Bearer {TOKEN}"}
+    client = make_client(_stub)
+    num_records, offset = 0, None
+    while True:
+        page = json.loads(transport.get(client._page_url([], offset), headers).body)
+        num_records += len(page["records"])
+        time.sleep(_work)
+        offset = page.get("offset")
+        if not offset:
+            return num_records
+
+
+def client_download(_stub: StubServer, _work: float) -> int:
+    """The download with the client (rate-limit spacing on): the next page downloads while the caller works."""
+    num_records = 0
+    for page in make_client(_stub, _fast=False).iter_pages():
+        num_records += len(page["records"])
+        time.sleep(_work)
+    return num_records
+
+
+def time_download(_stub: StubServer, _func, _work: float) -> tuple[float, int, int]:
+    """Return the time, the number of requests and the number of connections of one download."""
+    state = _stub.state
+    num_requests, connections = len(state.requests), set(state.connections)
+    start = time.perf_counter()
+    num_records = _func(_stub, _work)
+    seconds = time.perf_counter() - start
+    if num_records != len(state.records):
+        raise AssertionError(f"{_func.__name__} got {num_records} records, expected {len(state.records)}")
+    return seconds, len(state.requests) - num_requests, len(state.connections - connections)
+
+
+def resolve_arguments(_args: list[str]) -> argparse.Namespace:
+    """Get all the script arguments."""
+    parser = argparse.ArgumentParser(description="Check and time AirtableClient downloads against a stub server.")
+    parser.add_argument("--records", type=int, default=5_000)
+    parser.add_argument("--latency", type=float, default=0.25)
+    parser.add_argument("--work", type=float, default=0.0)
+    return parser.parse_args(_args)
+
+
+if __name__ == "__main__":
+    args = resolve_arguments(sys.argv[1:])
+    records = make_records(args.records)
+
+    failures: list[str] = []
+    with StubServer(records) as stub:
+        failures += check_paging(stub)
+        failures += check_retries(stub)
+        offset_failures, offset_timings = check_trailing_offset(stub)
+        failures += offset_failures
+    print(f"Checks: paging, retries, trailing offset ({args.records:,} records)")
+    print(
+        f"  read the offsets of every page: {offset_timings['trailing_offset'] * 1_000:.2f} ms "
+        f"(full json.loads: {offset_timings['json_loads'] * 1_000:.2f} ms)"
+    )
+
+    print(f"Download timing: {args.records:,} records, {args.latency:.2f} s / request, {args.work:.2f} s work / page")
+    with StubServer(records, args.latency) as stub:
+        for name, func in (("sequential", sequential_download), ("AirtableClient", client_download)):
+            seconds, num_requests, num_connections = time_download(stub, func, args.work)
+            print(f"  {name:<15} {seconds:>7.2f} s  {num_requests:>4} requests  {num_connections:>4} connections")
+
+    if failures:
+        print("FAILED:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("All checks passed.")
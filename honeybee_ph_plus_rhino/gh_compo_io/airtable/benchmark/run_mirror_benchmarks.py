@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Check and time `AirtableMirror` syncs (cold pull, warm syncs) against the local stub Airtable server.
+
+Run from the repository root (CPython, with the plugin's packages installed):
+
+    python -m honeybee_ph_plus_rhino.gh_compo_io.airtable.benchmark.run_mirror_benchmarks [options]
+
+Options:
+    * --records (int): The number of records in the stub table. Default=5000
+    * --latency (float): The stub server's response time, in seconds per request. Default=0.1
+    * --per-kb (float): The stub server's extra response time, in seconds per KB of body. Default=0.004
+
+Each step syncs a new mirror (as a new component solve does) into a temporary
+folder, then checks that the mirror holds exactly the stub table's records:
+
+    * a full download with no mirror (what Download Table Data does without `_use_mirror`);
+    * the cold pull (no mirror file yet);
+    * a warm sync with no changes;
+    * a warm sync after 2 records were modified, 1 added and 1 deleted;
+    * a warm sync in a new Rhino session (the mirror file is re-read, not the memo);
+    * a corrupt mirror file: a new cold pull;
+    * the mirror's id field deleted from the table (a 422 for `fields[]`): a new cold pull.
+
+The script exits with code 1 if any mirror does not match the table.
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+
+from honeybee_ph_plus_rhino.gh_compo_io.airtable.benchmark.run_benchmarks import make_client
+from honeybee_ph_plus_rhino.gh_compo_io.airtable.benchmark.stub_server import StubServer, make_records
+from honeybee_ph_plus_rhino.gh_compo_io.airtable.mirror import AirtableMirror
+
+
+def check_mirror(_mirror: AirtableMirror, _stub: StubServer) -> list[str]:
+    """Return a message for each difference between the mirror and the stub table."""
+    failures = []
+    live = {r["id"]: r for r in _stub.state.records}
+    missing = set(live) - set(_mirror.records)
+    extra = set(_mirror.records) - set(live)
+    if missing or extra:
+        failures.append(f"{len(missing)} records missing from the mirror, {len(extra)} deleted records kept")
+    changed = [i for i, r in live.items() if i in _mirror.records and _mirror.records[i] != r]
+    if changed:
+        failures.append(f"{len(changed)} records out of date in the mirror, ie: {changed[0]}")
+    return failures
+
+
+def time_step(_stub: StubServer, _func) -> tuple[float, int, float]:
+    """Return the time, the number of requests and the KB downloaded of one step."""
+    state = _stub.state
+    num_requests, bytes_sent = len(state.requests), state.bytes_sent
+    start = time.perf_counter()
+    _func()
+    seconds = time.perf_counter() - start
+    return seconds, len(state.requests) - num_requests, (state.bytes_sent - bytes_sent) / 1024
+
+
+def resolve_arguments(_args: list[str]) -> argparse.Namespace:
+    """Get all the script arguments."""
+    parser = argparse.ArgumentParser(description="Check and time AirtableMirror syncs against a stub server.")
+    parser.add_argument("--records", type=int, default=5_000)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--per-kb", type=float, default=0.004)
+    return parser.parse_args(_args)
+
+
+if __name__ == "__main__":
+    args = resolve_arguments(sys.argv[1:])
+    records = make_records(args.records)
+    folder = tempfile.mkdtemp()
+    failures: list[str] = []
+
+    def new_mirror() -> AirtableMirror:
+        return AirtableMirror(make_client(stub, _fast=False), folder)
+
+    def change_table() -> None:
+        stub.state.modify(5, DENSITY=1)
+        stub.state.modify(17, NOTES="changed")
+        stub.state.add(make_records(args.records + 1)[-1])
+        stub.state.delete(3)
+
+    def new_session() -> None:
+        AirtableMirror.loaded.clear()
+
+    def corrupt_file() -> None:
+        new_session()
+        with open(new_mirror().path, "w", encoding="utf-8") as f:
+            f.write("not a mirror\n")
+
+    def delete_id_field() -> None:
+        mirror = new_mirror()
+        mirror.load()
+        id_field = mirror._id_field()
+        for record in stub.state.records:
+            record["fields"].pop(id_field, None)
+
+    steps = [
+        ("full download, no mirror", None, None),
+        ("cold pull", None, True),
+        ("warm sync, no changes", None, False),
+        ("warm sync, 2 mod / 1 add / 1 del", change_table, False),
+        ("warm sync, new session", new_session, False),
+        ("corrupt mirror file", corrupt_file, True),
+        ("id field deleted", delete_id_field, True),
+    ]
+
+    print(f"Airtable mirror: {args.records:,} records, {args.latency:.2f} s + {args.per_kb:.3f} s / KB per request")
+    try:
+        with StubServer(records, lambda num_bytes: args.latency + args.per_kb * num_bytes / 1024) as stub:
+            for name, before, expect_full_pull in steps:
+                if before is not None:
+                    before()
+                if expect_full_pull is None:
+                    client = make_client(stub, _fast=False)
+                    seconds, num_requests, kb = time_step(stub, client.list_records)
+                    print(f"  {name:<34} {seconds:>7.2f} s  {num_requests:>4} requests  {kb:>9,.0f} KB")
+                    continue
+
+                mirror = new_mirror()
+                seconds, num_requests, kb = time_step(stub, mirror.sync)
+                print(f"  {name:<34} {seconds:>7.2f} s  {num_requests:>4} requests  {kb:>9,.0f} KB")
+                failures += [f"{name}: {failure}" for failure in check_mirror(mirror, stub)]
+                if mirror.full_pull != expect_full_pull:
+                    failures.append(f"{name}: full_pull is {mirror.full_pull}, expected {expect_full_pull}")
+    finally:
+        new_session()
+        shutil.rmtree(folder, ignore_errors=True)
+
+    if failures:
+        print("FAILED:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("All mirrors match the table.")
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""A local stand-in for the Airtable list-records API, for the Airtable benchmarks.
+
+Serves one table of synthetic records the way Airtable does:
+
+- `pageSize` / `offset` paging, with `offset` as the LAST key of each page object;
+- `fields[]` projection (an unknown field name is a 422, like Airtable);
+- `filterByFormula`, for the two formula shapes the client sends:
+  `IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('...'))` and `{FIELD} = 'value'`;
+- a `Bearer` token check (401);
+- injected failures: each status code in `StubState.fail` is returned (once) by the
+  next request, ie: `[429, 503]`;
+- a latency per response: seconds, or a function of the body size in bytes.
+
+Every request, the bytes sent and the client connections are counted, so a
+benchmark can report what went over the wire.
+"""
+
+import calendar
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+from urllib.parse import parse_qs, urlparse
+
+TOKEN = "stub-token"
+BASE_ID = "appStubBase"
+TABLE_ID = "tblStubTable"
+
+_MODIFIED_SINCE = re.compile(r"IS_AFTER\(LAST_MODIFIED_TIME\(\), DATETIME_PARSE\('(.+)'\)\)$")
+_FIELD_EQUALS = re.compile(r"\{([^}]+)\}\s*=\s*'([^']*)'")
+
+
+def make_records(_num_records: int, _num_fields: int = 30, _seed: int = 1) -> list[dict]:
+    """Return synthetic Airtable records (`{"id", "createdTime", "fields"}`), like a material library.
+
+    Each record has a field named 'offset', so a client which looks for the page
+    `offset` anywhere but at the end of the page would be caught out.
+    """
+    rnd = random.Random(_seed)
+    records = []
+    for i in range(_num_records):
+        fields = {
+            "DISPLAY_NAME": f"Material {i:05d}",
+            "CONDUCTIVITY": rnd.random(),
+            "DENSITY": rnd.randint(10, 3000),
+            "NOTES": "some longish note text " * 3,
+            "offset": "a field called offset",
+        }
+        for j in range(_num_fields - len(fields)):
+            fields[f"FIELD_{j:02d}"] = f"value {i}/{j}"
+        records.append({"id": f"rec{i:08d}", "createdTime": "2024-01-01T00:00:00.000Z", "fields": fields})
+    return records
+
+
+class StubState:
+    """The table the stub serves, and the counts of what it has sent."""
+
+    def __init__(self, _records: list[dict], _latency: float | Callable[[int], float] = 0.0):
+        self.records = _records
+        self.latency = _latency
+        self.fail: list[int] = []
+        self.requests: list[str] = []
+        self.connections: set[tuple[str, int]] = set()
+        self.bytes_sent = 0
+        self.lock = threading.Lock()
+        # -- Every record was last modified a day ago
+        self.modified_at = {r["id"]: time.time() - 86_400 for r in _records}
+
+    def modify(self, _index: int, **_fields) -> None:
+        """Change the fields of one record (and its LAST_MODIFIED_TIME)."""
+        record = self.records[_index]
+        record["fields"].update(_fields)
+        self.modified_at[record["id"]] = time.time()
+
+    def add(self, _record: dict) -> None:
+        self.records.append(_record)
+        self.modified_at[_record["id"]] = time.time()
+
+    def delete(self, _index: int) -> dict:
+        return self.records.pop(_index)
+
+    def select(self, _formula: str | None) -> list[dict]:
+        """Return the records for which the (supported) formula is true."""
+        if not _formula:
+            return self.records
+        match = _MODIFIED_SINCE.search(_formula)
+        if match:
+            since = calendar.timegm(time.strptime(match.group(1), "%Y-%m-%dT%H:%M:%S.000Z"))
+            return [r for r in self.records if self.modified_at[r["id"]] > since]
+        terms = _FIELD_EQUALS.findall(_formula)
+        return [r for r in self.records if any(str(r["fields"].get(k)) == v for k, v in terms)]
+
+
+def _handler(_state: StubState) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # -- Keep-alive, so connection reuse shows in the counts
+
+        def log_message(self, *args):
+            pass  # -- Keep the benchmark output quiet
+
+        def do_GET(self):
+            with _state.lock:
+                _state.requests.append(self.path)
+                _state.connections.add(self.client_address)
+                fail = _state.fail.pop(0) if _state.fail else None
+
+            if self.headers.get("Authorization") != f"Bearer {TOKEN}":
+                return self._send(401, {"error": {"type": "AUTHENTICATION_REQUIRED"}})
+            if fail:
+                return self._send(fail, {"error": {"type": "STUB_INJECTED_FAILURE"}})
+
+            query = parse_qs(urlparse(self.path).query)
+            page_size = int(query.get("pageSize", ["100"])[0])
+            start = int(query.get("offset", ["itr0/"])[0].split("/")[0][3:] or 0)
+            records = _state.select(query.get("filterByFormula", [None])[0])
+
+            fields = query.get("fields[]")
+            if fields:
+                known = {k for r in _state.records for k in r["fields"]}
+                if not set(fields) <= known:
+                    return self._send(422, {"error": {"type": "UNKNOWN_FIELD_NAME"}})
+                records = [dict(r, fields={k: v for k, v in r["fields"].items() if k in fields}) for r in records]
+
+            page = {"records": records[start : start + page_size]}
+            if start + page_size < len(records):
+                page["offset"] = f"itr{start + page_size}/rec{start + page_size:08d}"
+            self._send(200, page)
+
+        def _send(self, _status: int, _body: dict) -> None:
+            body = json.dumps(_body).encode("utf-8")
+            with _state.lock:
+                _state.bytes_sent += len(body)
+            latency = _state.latency(len(body)) if callable(_state.latency) else _state.latency
+            if latency:
+                time.sleep(latency)
+            self.send_response(_status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+class StubServer:
+    """The stub API on a free local port, served from a background thread."""
+
+    def __init__(self, _records: list[dict], _latency: float | Callable[[int], float] = 0.0):
+        self.state = StubState(_records, _latency)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(self.state))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url_base(self) -> str:
+        """The URL to use as `AirtableClient.URL_BASE`."""
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v0"
+
+    def start(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
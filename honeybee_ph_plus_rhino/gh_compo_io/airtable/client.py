@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""A small Airtable REST client: list a table's records, page by page.
+
+Airtable returns at most 100 records per request, plus an `offset` token for the
+next page, so a large table takes many strictly-ordered requests. `AirtableClient`:
+
+- sends every request through the shared keep-alive HTTP transport (one
+  `System.Net.Http.HttpClient` for the session, also used by the PH-Navigator
+  components), instead of a new `WebClient` per page;
+- downloads ahead on a worker thread: the next page's `offset` is read from the
+  END of each response body (without decoding the whole page), so page N+1 is
+  already downloading while the caller decodes / uses page N;
+- keeps to Airtable's rate limit (5 requests / second per base), and retries a
+  rate-limited (429) request after `RATE_LIMIT_WAIT_S`, and a server error (5xx) or
+  a failed connection with an exponential backoff.
+"""
+
+import json
+import re
+import threading
+import time
+
+try:
+    from Queue import Full, Queue  # type: ignore
+except ImportError:
+    from queue import Full, Queue  # Python 3
+
+try:
+    from urllib import quote, urlencode  # type: ignore
+except ImportError:
+    from urllib.parse import quote, urlencode  # Python 3
+
+try:
+    from typing import Any, Iterator  # noqa: F401
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.transport import (
+        DotNetTransport,
+        HTTPResponse,
+        PHNavTransportError,
+    )
+except ImportError as e:
+    raise ImportError("\nFailed to import from honeybee_ph_plus_rhino {}".format(e))
+
+
+class AirtableError(Exception):
+    """An Airtable request failed (an HTTP error, or still failing after the retries)."""
+
+
+# -- Airtable puts `offset` LAST in the page object: `{"records": [...], "offset": "itr.../rec..."}`.
+# -- Anchored to the final closing brace, so a record field named 'offset' can never match.
+_TRAILING_OFFSET = re.compile(r'"offset"\s*:\s*"((?:[^"\\]|\\.)*)"\s*}\s*$')
+
+
+def _next_offset(_body):
+    # type: (str) -> tuple[str | None, dict | None]
+    """Return `(offset, page)`: the body's `offset` (None on the last page).
+
+    Read from the end of the body where possible; `page` is only decoded (and
+    returned, so it is not decoded twice) if the offset could be elsewhere.
+    """
+    match = _TRAILING_OFFSET.search(_body, max(0, len(_body) - 1024))
+    if match is not None:
+        return json.loads(u'"{}"'.format(match.group(1))), None
+    if '"offset"' not in _body:
+        return None, None
+    page = json.loads(_body)
+    return page.get("offset"), page
+
+
+def records_query(_fields=None, _formula=None, _view=None):
+    # type: (list[str] | None, str | None, str | None) -> list[tuple[str, str]]
+    """Return the list-records query params which shrink a download at the source.
+
+    Arguments:
+    ----------
+        * _fields: Only download these fields (exact Airtable field names).
+        * _formula: Only download the records for which this Airtable formula is true.
+        * _view: Only download the records in this view (name or id), in its order.
+    """
+    query = [("fields[]", field) for field in _fields or [] if field]
+    if _formula:
+        query.append(("filterByFormula", _formula))
+    if _view:
+        query.append(("view", _view))
+    return query
+
+
+class AirtableClient(object):
+    """Lists the records of one Airtable table."""
+
+    URL_BASE = "https://api.airtable.com/v0"
+    PAGE_SIZE = 100
+
+    # -- Airtable allows 5 requests / second per base, and blocks a base which goes
+    # -- over for 30 seconds.
+    MIN_REQUEST_INTERVAL_S = 0.2
+    RATE_LIMIT_WAIT_S = 30.0
+    RETRY_BACKOFF_S = 1.0
+    MAX_RETRIES = 4
+
+    # -- Pages downloaded ahead of the caller.
+    PREFETCH_PAGES = 2
+
+    def __init__(self, _token, _base_id, _table_id, _transport=None):
+        # type: (str, str, str, Any) -> None
+        if not _token:
+            raise ValueError("A token is required to download from AirTable.")
+        self.token = _token
+        self.base_id = _base_id
+        self.table_id = _table_id
+        self.transport = _transport or DotNetTransport()
+        self._last_request_time = 0.0
+
+    @property
+    def url(self):
+        # type: () -> str
+        return "{}/{}/{}".format(self.URL_BASE, quote(self.base_id, safe=""), quote(self.table_id, safe=""))
+
+    def _page_url(self, _query, _offset):
+        # type: (list[tuple[str, Any]], str | None) -> str
+        query = [("pageSize", self.PAGE_SIZE)] + [(k, self._encode(v)) for k, v in _query]
+        if _offset:
+            query.append(("offset", _offset))
+        return "{}?{}".format(self.url, urlencode(query))
+
+    @staticmethod
+    def _encode(_value):
+        # type: (Any) -> Any
+        try:
+            return _value.encode("utf-8")  # -- IronPython 2.7 `urlencode` needs bytes
+        except (AttributeError, UnicodeError):
+            return _value
+
+    def _throttle(self):
+        # type: () -> None
+        wait = self._last_request_time + self.MIN_REQUEST_INTERVAL_S - time.time()
+        if wait > 0:
+            time.sleep(wait)
+        self._last_request_time = time.time()
+
+    def _get(self, _url):
+        # type: (str) -> str
+        """GET one page's body, retrying a rate-limited / failed request."""
+        headers = {"Authorization": "Bearer {}".format(self.token)}
+        for attempt in range(self.MAX_RETRIES + 1):
+            self._throttle()
+            try:
+                response = self.transport.get(_url, headers)  # type: HTTPResponse
+            except PHNavTransportError as e:
+                error = "No response from Airtable: {}".format(e)
+                wait = self.RETRY_BACKOFF_S * 2**attempt
+            else:
+                if response.status == 200:
+                    return response.body
+                error = "Airtable returned HTTP {}: {}".format(response.status, (response.body or "")[:500])
+                if response.status == 429:
+                    wait = self.RATE_LIMIT_WAIT_S
+                elif response.status >= 500:
+                    wait = self.RETRY_BACKOFF_S * 2**attempt
+                else:
+                    raise AirtableError(error)  # -- ie: a bad token / table: retrying will not help.
+
+            if attempt < self.MAX_RETRIES:
+                time.sleep(wait)
+        raise AirtableError("{} (gave up after {} attempts)".format(error, self.MAX_RETRIES + 1))
+
+    def _download_pages(self, _query, _pages, _stop):
+        # type: (list[tuple[str, Any]], Queue, threading.Event) -> None
+        """Worker thread: download every page in order onto `_pages` as `(body, page | None)`.
+
+        Ends with a `None` item, or an exception if a request fails.
+        """
+
+        def put(_item):
+            while not _stop.is_set():
+                try:
+                    _pages.put(_item, timeout=0.1)
+                    return True
+                except Full:
+                    pass
+            return False
+
+        try:
+            offset = None
+            while True:
+                body = self._get(self._page_url(_query, offset))
+                offset, page = _next_offset(body)
+                if not put((body, page)):
+                    return
+                if not offset:
+                    break
+        except Exception as e:
+            put(e)
+            return
+        put(None)
+
+    def iter_pages(self, _query=None):
+        # type: (list[tuple[str, Any]] | None) -> Iterator[dict]
+        """Yield each decoded page (`{"records": [...], "offset": ...}`), in order.
+
+        `_query` is a list of extra `(name, value)` list-records parameters, ie:
+        `[("filterByFormula", "..."), ("fields[]", "Name")]`. The next page is downloaded
+        while the caller works on the current one. Raises `AirtableError` if a request fails.
+        """
+        pages = Queue(self.PREFETCH_PAGES)
+        stop = threading.Event()
+        worker = threading.Thread(target=self._download_pages, args=(list(_query or []), pages, stop))
+        worker.daemon = True
+        worker.start()
+        try:
+            while True:
+                item = pages.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                body, page = item
+                yield page if page is not None else json.loads(body)
+        finally:
+            stop.set()
+
+    def list_records(self, _query=None):
+        # type: (list[tuple[str, Any]] | None) -> list[dict]
+        """Return every record dict of the table (`{"id", "createdTime", "fields"}`), see `iter_pages()`."""
+        records = []
+        for page in self.iter_pages(_query):
+            records.extend(page.get("records", []))
+        return records
@@ -4,7 +4,7 @@
 """GHCompo Interface: HBPH+ - Airtable Create Constructions."""
 
 try:
-    from typing import Any, Dict, List
+    from typing import Any, Dict, FrozenSet, List, Tuple
 except ImportError:
     pass  # IronPython 2.7
 
@@ -46,14 +46,25 @@ class GHCompo_AirTableCreateConstructions(object):
         self.ep_mat_layers = _ep_mat_layers
         self.const_records = _const_records
 
+        # -- A record's field names -> its (sorted) layer field names
+        self.layer_columns = {}  # type: Dict[FrozenSet[str], List[str]]
+        # -- (name, layer IDs) -> the one OpaqueConstruction for every such record
+        self.unique_constructions = {}  # type: Dict[Tuple[str, ...], OpaqueConstruction]
+
+    def get_layer_columns(self, record):
+        # type: (TableRecord) -> List[str]
+        """Return the record's layer field names, in layer order. Found once per set of field names."""
+        field_names = frozenset(record.FIELDS.keys())
+        columns = self.layer_columns.get(field_names)
+        if columns is None:
+            columns = sorted(k for k in field_names if "LAYER" in k.upper())
+            self.layer_columns[field_names] = columns
+        return columns
+
     def get_layers(self, record):
         # type: (TableRecord) -> Dict[str, List[str]]
         """Get material layers from a record."""
-        layers = {}
-        for k, v in record.FIELDS.items():
-            if "LAYER" in k.upper():
-                layers[k] = v[0]
-        return layers
+        return {k: record.FIELDS[k][0] for k in self.get_layer_columns(record)}
 
     def create_hb_constructions(self, _name, _materials):
         # type: (str, List[EnergyMaterial]) -> OpaqueConstruction
@@ -84,14 +95,15 @@ class GHCompo_AirTableCreateConstructions(object):
         constructions_ = []
         for record in self.const_records:
             const_name = clean_ep_string(record.FIELDS[AT_COLUMN_NAMES["name"]])
-            layers = self.get_layers(record)
-
-            mats = []
-            for layer_name in sorted(layers):
-                layer = layers[layer_name]
-                mats.append(self.ep_mat_layers[layer])
-
-            const = self.create_hb_constructions(const_name, mats)
+            layer_ids = tuple(record.FIELDS[k][0] for k in self.get_layer_columns(record))
+
+            # -- Records with the same name and layers share one construction
+            key = (const_name,) + layer_ids
+            const = self.unique_constructions.get(key)
+            if const is None:
+                mats = [self.ep_mat_layers[layer_id] for layer_id in layer_ids]
+                const = self.create_hb_constructions(const_name, mats)
+                self.unique_constructions[key] = const
             constructions_.append(const)
 
         return constructions_
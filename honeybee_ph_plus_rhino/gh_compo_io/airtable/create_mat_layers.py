@@ -130,6 +130,11 @@ class GHCompo_AirTableCreateMaterialLayers(object):
         self.layer_records = _layer_records
         self.material_layers_collection = EpMaterialCollection()
 
+        # -- Material record ID -> (conductivity, density, specific-heat, color)
+        self.material_properties = {}  # type: Dict[str, Tuple[float, float, float, PhColor]]
+        # -- (name, thickness, material record ID) -> the one EnergyMaterial for every such layer
+        self.unique_materials = {}  # type: Dict[Tuple[str, float, str], EnergyMaterial]
+
     def clean_name(self, _in):
         # type: (str) -> str
         """Clean the name of the material. Strip whitespace, remove commas."""
@@ -206,9 +211,27 @@ class GHCompo_AirTableCreateMaterialLayers(object):
 
         return PhColor.from_argb(*[int(_) for _ in color_string.split(",")])
 
+    def get_material_properties(self, _layer_mat_id):
+        # type: (str) -> Tuple[float, float, float, PhColor]
+        """Return a material record's (conductivity, density, specific-heat, color), read once per material."""
+        properties = self.material_properties.get(_layer_mat_id)
+        if properties is None:
+            layer_mat = self.materials[_layer_mat_id]
+            properties = (
+                self._layer_conductivity_w_mk(layer_mat),
+                self._layer_density_kg_m3(layer_mat),
+                self._layer_specific_heat_capacity_J_kg_K(layer_mat),
+                self._layer_material_color_argb(layer_mat),
+            )
+            self.material_properties[_layer_mat_id] = properties
+        return properties
+
     def create_ep_material(self, _record):
         # type: (TableRecord) -> Optional[EnergyMaterial]
-        """Create the EnergyPlus Material Layers from the AirTable Data."""
+        """Create the EnergyPlus Material Layers from the AirTable Data.
+
+        Layers with the same name, thickness and material share one EnergyMaterial.
+        """
 
         # -- Pull out the Layer Data
         layer_data = _record.FIELDS
@@ -226,15 +249,19 @@ class GHCompo_AirTableCreateMaterialLayers(object):
 
         # -- Get the Layer's Material Data
         layer_mat_id = layer_mat_id_list[0]
-        layer_mat = self.materials[layer_mat_id]
+        key = (layer_name, layer_thickness_m, layer_mat_id)
+        hb_mat = self.unique_materials.get(key)
+        if hb_mat is not None:
+            return hb_mat
+        conductivity, density, specific_heat, color = self.get_material_properties(layer_mat_id)
 
         # -- Build the HB-Material
         hb_mat = EnergyMaterial(
             clean_ep_string(self.clean_name(layer_name)),
             layer_thickness_m,
-            self._layer_conductivity_w_mk(layer_mat),
-            self._layer_density_kg_m3(layer_mat),
-            self._layer_specific_heat_capacity_J_kg_K(layer_mat),
+            conductivity,
+            density,
+            specific_heat,
             self.ROUGHNESS,
             self.THERM_ABS,
             self.SOL_ABS,
@@ -243,8 +270,9 @@ class GHCompo_AirTableCreateMaterialLayers(object):
 
         # -- Set the Layer's Color
         mat_prop_ph = getattr(hb_mat.properties, "ph")  # type: EnergyMaterialPhProperties
-        mat_prop_ph.ph_color = self._layer_material_color_argb(layer_mat)
+        mat_prop_ph.ph_color = color
 
+        self.unique_materials[key] = hb_mat
         return hb_mat
 
     @property
@@ -269,4 +297,9 @@ class GHCompo_AirTableCreateMaterialLayers(object):
                 continue
             self.material_layers_collection[record.ID] = mat
 
+        self.IGH.remark(
+            "Built {} unique materials for {} layers.".format(
+                len(self.unique_materials), len(self.material_layers_collection)
+            )
+        )
         return self.material_layers_collection
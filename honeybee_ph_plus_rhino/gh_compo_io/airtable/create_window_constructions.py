@@ -4,7 +4,7 @@
 """GHCompo Interface: HBPH - Airtable Create Window Constructions."""
 
 try:
-    from typing import Any, Dict, List, Optional
+    from typing import Any, Dict, List, Optional, Tuple
 except ImportError:
     pass  # IronPython 2.7
 
@@ -71,6 +71,9 @@ class GHCompo_AirTableCreateWindowConstructions(object):
         self.hbph_frame_elements = {}  # type: Dict[str, PhWindowFrameElement]
         self.hbph_window_frames = {}  # type: Dict[str, PhWindowFrame]
 
+        # -- (frame name, glazing name, psi-install names T/R/B/L) -> (frame, U-w)
+        self.window_types = {}  # type: Dict[Tuple[str, ...], Tuple[PhWindowFrame, float]]
+
     @property
     def ready(self):
         # type: () -> bool
@@ -193,10 +196,13 @@ class GHCompo_AirTableCreateWindowConstructions(object):
 
         return hbph_frame_type
 
-    def create_new_hbph_window_material(self, _display_name, _hbph_frame, _hbph_glazing):
-        # type: (str, PhWindowFrame, PhWindowGlazing) -> EnergyWindowMaterialSimpleGlazSys
+    def create_new_hbph_window_material(self, _display_name, _hbph_frame, _hbph_glazing, _nfrc_u_factor=None):
+        # type: (str, PhWindowFrame, PhWindowGlazing, Optional[float]) -> EnergyWindowMaterialSimpleGlazSys
         """Create a new HB Simple Window Material and set the NFRC/HBmaterial properties"""
-        nfrc_u_factor = iso_10077_1.calculate_window_uw(_hbph_frame, _hbph_glazing)
+        if _nfrc_u_factor is None:
+            nfrc_u_factor = iso_10077_1.calculate_window_uw(_hbph_frame, _hbph_glazing)
+        else:
+            nfrc_u_factor = _nfrc_u_factor
         nfrc_shgc = _hbph_glazing.g_value
         t_vis = 0.6
         window_mat = EnergyWindowMaterialSimpleGlazSys(
@@ -232,6 +238,35 @@ class GHCompo_AirTableCreateWindowConstructions(object):
         """Return the Psi-Install-Name for the Window Unit by side (TOP, LEFT, RIGHT, BOTTOM)"""
         return _record.FIELDS.get("PSI-INSTALL-{}-NAME".format(_side), [""])[0]
 
+    def get_window_type(self, _record, _hbph_frame, _hbph_glazing):
+        # type: (TableRecord, PhWindowFrame, PhWindowGlazing) -> Tuple[PhWindowFrame, float]
+        """Return the (frame with the Psi-Install values set, U-w) for a Window Unit.
+
+        Built (frame duplicated, U-w calculated) only once per unique frame / glazing /
+        Psi-Install combination: the Window Units which share one also share the frame.
+        """
+        if self.psi_installs:
+            psi_install_names = tuple(
+                self._get_psi_install_name(_record, side) for side in ("TOP", "RIGHT", "BOTTOM", "LEFT")
+            )
+        else:
+            psi_install_names = ()
+        key = (_hbph_frame.display_name, _hbph_glazing.display_name) + psi_install_names
+
+        window_type = self.window_types.get(key)
+        if window_type is None:
+            hbph_frame = _hbph_frame
+            if psi_install_names:
+                hbph_frame = _hbph_frame.duplicate()
+                top, right, bottom, left = [self.psi_installs.get(name, 0.0) for name in psi_install_names]
+                hbph_frame.top.psi_install = top
+                hbph_frame.right.psi_install = right
+                hbph_frame.bottom.psi_install = bottom
+                hbph_frame.left.psi_install = left
+            window_type = (hbph_frame, iso_10077_1.calculate_window_uw(hbph_frame, _hbph_glazing))
+            self.window_types[key] = window_type
+        return window_type
+
     def create_new_hbph_window_construction(self, record):
         # type: (TableRecord) -> WindowConstruction
         """Return the new HB Window Construction"""
@@ -244,25 +279,12 @@ class GHCompo_AirTableCreateWindowConstructions(object):
 
         # # -----------------------------------------------------------------------------
         # -- Set the Psi-Install value on the Frame Elements
-        if self.psi_installs:
-            hbph_frame = hbph_frame.duplicate()
-            hbph_frame.top.psi_install = self.psi_installs.get(
-                self._get_psi_install_name(record, "TOP"), 0.0
-            )
-            hbph_frame.right.psi_install = self.psi_installs.get(
-                self._get_psi_install_name(record, "RIGHT"), 0.0
-            )
-            hbph_frame.bottom.psi_install = self.psi_installs.get(
-                self._get_psi_install_name(record, "BOTTOM"), 0.0
-            )
-            hbph_frame.left.psi_install = self.psi_installs.get(
-                self._get_psi_install_name(record, "LEFT"), 0.0
-            )
+        hbph_frame, nfrc_u_factor = self.get_window_type(record, hbph_frame, hbph_glazing)
 
         # # -----------------------------------------------------------------------------
         # -- Build the HB Window Material and Construction
         hbph_mat = self.create_new_hbph_window_material(
-            hbph_display_name, hbph_frame, hbph_glazing
+            hbph_display_name, hbph_frame, hbph_glazing, nfrc_u_factor
         )
         hb_win_construction = WindowConstruction(hbph_display_name, [hbph_mat])
 
@@ -298,4 +320,10 @@ class GHCompo_AirTableCreateWindowConstructions(object):
         for record in self.window_unit_records:
             window_constructions_.append(self.create_new_hbph_window_construction(record))
 
+        self.IGH.remark(
+            "Built {} window constructions from {} unique frame / glazing / Psi-Install combinations.".format(
+                len(window_constructions_), len(self.window_types)
+            )
+        )
+
         return window_constructions_
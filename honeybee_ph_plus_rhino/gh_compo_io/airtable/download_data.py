@@ -3,8 +3,6 @@
 
 """GHCompo Interface: HBPH - Airtable Download Table Data."""
 
-import json
-
 try:
     from typing import Any, Dict, ItemsView, KeysView, List, TypeVar
 
@@ -12,26 +10,53 @@ try:
 except ImportError:
     pass  # IronPython 2.7
 
-try:
-    import System.Net  # type: ignore
-except ImportError:
-    pass  # Outside Rhino
-
 try:
     from honeybee_ph_rhino import gh_io
 except ImportError:
     raise ImportError("Failed to import honeybee_ph_rhino")
 
+try:
+    from honeybee_ph_plus_rhino.gh_compo_io.airtable.client import AirtableClient, records_query
+    from honeybee_ph_plus_rhino.gh_compo_io.airtable.mirror import AirtableMirror
+except ImportError as e:
+    raise ImportError("\nFailed to import from honeybee_ph_plus_rhino {}".format(e))
+
+
+# -- The upper-cased field names, shared by all of the records (like interned attribute names)
+_FIELD_KEYS = {}  # type: Dict[str, str]
+
+
+def _field_key(_name):
+    # type: (str) -> str
+    try:
+        return _FIELD_KEYS[_name]
+    except KeyError:
+        key = _FIELD_KEYS[_name] = str(_name).upper()
+        return key
+
 
 class TableFields(object):
-    """A class for storing the fields of a single AirTable record."""
+    """A class for storing the fields of a single AirTable record.
+
+    Field names are upper-cased, and can be read as items (`fields["NAME"]`) or
+    as attributes (`fields.name`: None if the record has no such field).
+    """
+
+    __slots__ = ("_data",)
 
     def __init__(self, *args, **kwargs):
-        for k, v in kwargs.items():
-            setattr(self, str(k).upper(), v)
+        self._data = {_field_key(k): v for k, v in kwargs.items()}
+
+    @classmethod
+    def from_fields(cls, _fields):
+        # type: (Dict[str, Any]) -> TableFields
+        """Build from a record's `fields` dict (without unpacking it into keyword-args)."""
+        obj = cls.__new__(cls)
+        obj._data = {_field_key(k): v for k, v in _fields.items()}
+        return obj
 
     def __repr__(self):
-        return "AirtableFieldData({})".format(self.__dict__)
+        return "AirtableFieldData({})".format(self._data)
 
     def __str__(self):
         return self.__repr__()
@@ -41,31 +66,45 @@ class TableFields(object):
 
     def get(self, key, _default=None):
         # type: (str, Any) -> Any
-        return self.__dict__.get(str(key).upper(), _default)
+        return self._data.get(_field_key(key), _default)
 
     def __getitem__(self, key):
         # type: (str) -> Any
-        return self.__dict__[str(key).upper()]
+        return self._data[_field_key(key)]
 
     def __getattr__(self, key):
-        return self.__dict__.get(str(key).upper())
+        if key.startswith("_"):
+            raise AttributeError(key)  # -- ie: '_data' before it is set (copy / pickle)
+        return self._data.get(_field_key(key))
 
     def items(self):
         # type: () -> ItemsView
-        return self.__dict__.items()
+        return self._data.items()
 
     def keys(self):
         # type: () -> KeysView[str]
-        return self.__dict__.keys()
+        return self._data.keys()
 
 
 class TableRecord(object):
     """A single AirTable record data object."""
 
+    __slots__ = ("ID", "CREATEDTIME", "FIELDS")
+
     def __init__(self, *args, **kwargs):
         self.ID = kwargs.get("id", "")
         self.CREATEDTIME = kwargs.get("createdTime", "")
-        self.FIELDS = TableFields(**kwargs.get("fields", {}))
+        self.FIELDS = TableFields.from_fields(kwargs.get("fields", {}))
+
+    @classmethod
+    def from_dict(cls, _record):
+        # type: (Dict[str, Any]) -> TableRecord
+        """Build from a downloaded record dict (without unpacking it into keyword-args)."""
+        obj = cls.__new__(cls)
+        obj.ID = _record.get("id", "")
+        obj.CREATEDTIME = _record.get("createdTime", "")
+        obj.FIELDS = TableFields.from_fields(_record.get("fields", {}))
+        return obj
 
     @property
     def fields(self):
@@ -73,7 +112,9 @@ class TableRecord(object):
         return self.FIELDS
 
     def __repr__(self):
-        return "AirtableDownloadTableData({})".format(self.__dict__)
+        return "AirtableDownloadTableData({})".format(
+            {"ID": self.ID, "CREATEDTIME": self.CREATEDTIME, "FIELDS": self.FIELDS}
+        )
 
     def __str__(self):
         return self.__repr__()
@@ -87,13 +128,30 @@ class GHCompo_AirTableDownloadTableData(object):
     A class for downloading Airtable Data from a specific Base / Table
     """
 
-    def __init__(self, _IGH, _token, _base_id, _table_id, _get_records, *args, **kwargs):
-        # type: (gh_io.IGH, str, str, str, bool, *Any, **Any) -> None
+    def __init__(
+        self,
+        _IGH,
+        _token,
+        _base_id,
+        _table_id,
+        _get_records,
+        _use_mirror=False,
+        _fields=None,
+        _filter_formula=None,
+        _view=None,
+        _transport=None,
+        *args,
+        **kwargs
+    ):
+        # type: (gh_io.IGH, str, str, str, bool, bool, List[str] | None, str | None, str | None, Any, *Any, **Any) -> None
         self.IGH = _IGH
         self.TOKEN = _token
         self.AIRTABLE_BASE_ID = _base_id
         self.AIRTABLE_TABLE_NAME = _table_id
         self.get_records = _get_records
+        self.use_mirror = bool(_use_mirror)
+        self.query = records_query(_fields, _filter_formula, _view)
+        self.transport = _transport
 
     @property
     def ready(self):
@@ -110,59 +168,34 @@ class GHCompo_AirTableDownloadTableData(object):
 
     @property
     def url(self):
-        # URL for the AirTable API
-        _url = "https://api.airtable.com/v0/{}/{}".format(
-            self.AIRTABLE_BASE_ID, self.AIRTABLE_TABLE_NAME
-        )
+        # type: () -> str
+        """URL for the AirTable API."""
+        return self.client.url
 
-        try:
-            # TLS 1.2 is needed to download over https
-            System.Net.ServicePointManager.SecurityProtocol = (
-                System.Net.SecurityProtocolType.Tls12
-            )
-        except AttributeError:
-            # TLS 1.2 is not provided by MacOS .NET in Rhino 5
-            if _url.lower().startswith("https"):
-                self.IGH.error(
-                    "This system lacks the necessary security"
-                    " libraries to download over https."
-                )
-
-        return _url
-
-    def get_web_client(self, _offset="0"):
-        # type: (str) -> System.Net.WebClient
-        """Get a web client with Header and Query configuration for downloading data from AirTable."""
-
-        if not self.TOKEN:
-            raise ValueError("A token is required to download from AirTable.")
-
-        client = System.Net.WebClient()
-        client.Headers.Add("Authorization", "Bearer {}".format(self.TOKEN))
-        client.Headers.Add("Content-type", "application/json")
-        client.QueryString.Add("offset", _offset)
-
-        return client
+    @property
+    def client(self):
+        # type: () -> AirtableClient
+        return AirtableClient(self.TOKEN, self.AIRTABLE_BASE_ID, self.AIRTABLE_TABLE_NAME, self.transport)
 
     def download_data(self):
-        # type: (Any) -> List[Dict]
+        # type: () -> List[Dict]
         """Download data from AirTable.
 
         Since AirTable limits the number of records that can be downloaded
         in a single request, this method will download all records in the table
-        by making multiple requests using the 'offset' query parameter.
+        by making multiple requests using the 'offset' query parameter. Each page
+        is downloaded while the previous one is decoded (see `AirtableClient`).
+        Only the chosen fields / filtered records are downloaded (see `records_query`).
         """
-        records = []
-        offset = "0"
+        return self.client.list_records(self.query)
 
-        while offset != None:
-            client = self.get_web_client(offset)
-            response = client.DownloadString(self.url)
-            data = json.loads(response)
-            records.extend(data.get("records", []))
-            offset = data.get("offset", None)
-
-        return records
+    def sync_mirror(self):
+        # type: () -> List[TableRecord]
+        """Sync the table's local mirror (only the changes since the last sync are downloaded)."""
+        mirror = AirtableMirror(self.client, _query=self.query)
+        mirror.sync()
+        self.IGH.remark(mirror.report())
+        return [TableRecord.from_dict(record) for record in mirror.records.values()]
 
     def run(self):
         # type: () -> List[TableRecord]
@@ -170,11 +203,22 @@ class GHCompo_AirTableDownloadTableData(object):
         if not self.ready:
             return []
 
+        if self.use_mirror:
+            try:
+                return self.sync_mirror()
+            except Exception as e:
+                msg = "Failed to sync the AirTable mirror.\n{}".format(e)
+                self.IGH.warning(msg)
+                return []
+
+        records_ = []  # type: List[TableRecord]
         try:
-            response = self.download_data()
+            # -- Build each page's records while the next page downloads.
+            for page in self.client.iter_pages(self.query):
+                records_.extend(TableRecord.from_dict(record) for record in page.get("records", []))
         except Exception as e:
             msg = "Failed to download file from AirTable.\n{}".format(e)
             self.IGH.warning(msg)
             return []
 
-        return [TableRecord(**record) for record in response]
+        return records_
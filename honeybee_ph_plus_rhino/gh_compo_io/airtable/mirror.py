@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""A local, incrementally-synced mirror of one Airtable table.
+
+The records are kept in one JSON-lines file per (base, table) in the mirror folder::
+
+    {"format": "airtable-mirror", "format_version": 1, "base_id": ..., "table_id": ..., "synced_at": ...}
+    {"id": "rec...", "createdTime": "...", "fields": {...}}
+    {"id": "rec...", "createdTime": "...", "fields": {...}}
+    ...
+
+The first `sync()` downloads the whole table (a "cold" pull). After that, a sync
+downloads only:
+
+- the records modified since the last sync (`filterByFormula` on
+  `LAST_MODIFIED_TIME()`, re-checking the last `SYNC_OVERLAP_S` seconds in case the
+  local clock is ahead of Airtable's), and
+- the ids of all the records, with a single field each (`fields[]`), so that records
+  deleted in Airtable are deleted from the mirror too.
+
+A mirror of a projected / filtered download (see `client.records_query`) is a
+separate file, named with a digest of the query: its syncs apply the same `view` /
+`filterByFormula`, so records which no longer match are dropped like deleted ones.
+
+Airtable does not change a record's `LAST_MODIFIED_TIME()` when a FIELD is renamed
+or deleted: delete the mirror file (see `AirtableMirror.path`) to force a new cold
+pull after such a change.
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+
+try:
+    from typing import Any  # noqa: F401
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee_ph_plus_rhino.gh_compo_io.airtable.client import AirtableClient, AirtableError
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.response_cache import default_cache_folder
+except ImportError as e:
+    raise ImportError("\nFailed to import from honeybee_ph_plus_rhino {}".format(e))
+
+
+MIRROR_FORMAT = "airtable-mirror"
+MIRROR_FORMAT_VERSION = 1
+
+
+def default_mirror_folder():
+    # type: () -> str
+    """Return the default mirror folder (next to the PH-Navigator response cache folder)."""
+    return os.path.join(os.path.dirname(default_cache_folder()), "airtable_mirror")
+
+
+def _airtable_datetime(_timestamp):
+    # type: (float) -> str
+    """Return a unix timestamp as an Airtable (UTC, ISO 8601) date-time string."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(_timestamp))
+
+
+class AirtableMirror(object):
+    """The records of one Airtable table, mirrored to a local file and kept in sync.
+
+    The loaded records are also kept for the Rhino session (per mirror file), so a
+    sync only re-reads the file if it was changed by something else.
+    """
+
+    # -- Re-check records modified this long before the last sync (local vs. Airtable clock).
+    SYNC_OVERLAP_S = 300
+
+    # -- Mirror file path: ((mtime, size), synced_at, records)
+    loaded = {}  # type: dict[str, tuple[tuple[float, int], float, OrderedDict]]
+
+    def __init__(self, _client, _folder=None, _query=None):
+        # type: (AirtableClient, str | None, list[tuple[str, str]] | None) -> None
+        self.client = _client
+        self.folder = _folder or default_mirror_folder()
+        self.query = [[k, v] for k, v in _query or []]  # -- Lists, as read back from the JSON header
+        self.records = OrderedDict()  # type: OrderedDict[str, dict]
+        self.synced_at = None  # type: float | None
+
+        # -- The result of the last `sync()`
+        self.full_pull = False
+        self.changed = 0
+        self.deleted = 0
+
+    @property
+    def path(self):
+        # type: () -> str
+        name = re.sub(r"[^\w.-]", "_", u"{}_{}".format(self.client.base_id, self.client.table_id))
+        if self.query:
+            digest = hashlib.sha1(json.dumps(self.query, sort_keys=True).encode("utf-8")).hexdigest()
+            name = u"{}_{}".format(name, digest[:12])
+        return os.path.join(self.folder, u"{}.jsonl".format(name))
+
+    def _file_stat(self):
+        # type: () -> tuple[float, int] | None
+        try:
+            stat = os.stat(self.path)
+        except (IOError, OSError):
+            return None
+        return (stat.st_mtime, stat.st_size)
+
+    def load(self):
+        # type: () -> bool
+        """Load the mirror file. Returns False (and an empty mirror) if there is no valid mirror file."""
+        self.records, self.synced_at = OrderedDict(), None
+        stat = self._file_stat()
+        if stat is None:
+            return False
+
+        memo = self.loaded.get(self.path)
+        if memo is not None and memo[0] == stat:
+            self.synced_at, self.records = memo[1], memo[2]
+            return True
+
+        try:
+            with io.open(self.path, "r", encoding="utf-8") as f:
+                header = json.loads(f.readline())
+                if (
+                    header.get("format") != MIRROR_FORMAT
+                    or header.get("format_version") != MIRROR_FORMAT_VERSION
+                    or header.get("base_id") != self.client.base_id
+                    or header.get("table_id") != self.client.table_id
+                    or header.get("query", []) != self.query
+                ):
+                    return False
+                records = OrderedDict()
+                for line in f:
+                    record = json.loads(line)
+                    records[record["id"]] = record
+        except (IOError, OSError, ValueError, KeyError, AttributeError):
+            return False
+
+        self.synced_at, self.records = float(header["synced_at"]), records
+        self.loaded[self.path] = (stat, self.synced_at, self.records)
+        return True
+
+    def save(self):
+        # type: () -> None
+        """Write the mirror file (to a temp-file first, then moved into place). Raises `IOError` / `OSError`."""
+        if not os.path.isdir(self.folder):
+            os.makedirs(self.folder)
+
+        header = {
+            "format": MIRROR_FORMAT,
+            "format_version": MIRROR_FORMAT_VERSION,
+            "base_id": self.client.base_id,
+            "table_id": self.client.table_id,
+            "query": self.query,
+            "synced_at": self.synced_at,
+        }
+        tmp_path = u"{}.tmp".format(self.path)
+        with io.open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(u"{}\n".format(json.dumps(header)))
+            for record in self.records.values():
+                f.write(u"{}\n".format(json.dumps(record)))
+        # -- os.rename will not overwrite an existing file on Windows (no os.replace in 2.7)
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        os.rename(tmp_path, self.path)
+        self.loaded[self.path] = (self._file_stat(), self.synced_at, self.records)
+
+    def _id_field(self):
+        # type: () -> str | None
+        """Return the field found in the most mirrored records (the one to download with each id)."""
+        counts = {}  # type: dict[str, int]
+        for record in self.records.values():
+            for name in record.get("fields", {}):
+                counts[name] = counts.get(name, 0) + 1
+        if not counts:
+            return None
+        return min(counts, key=lambda name: (-counts[name], name))
+
+    def _pull(self):
+        # type: () -> None
+        """Download the whole table into the mirror."""
+        self.records = OrderedDict((r["id"], r) for r in self.client.list_records(self.query))
+        self.full_pull = True
+        self.changed = len(self.records)
+        self.deleted = 0
+
+    def _sync_changes(self, _id_field):
+        # type: (str) -> None
+        """Download the records changed since the last sync, and drop the deleted ones."""
+        since = _airtable_datetime(self.synced_at - self.SYNC_OVERLAP_S)
+        formula = u"IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('{}'))".format(since)
+        filters = [(k, v) for k, v in self.query if k != "fields[]"]
+        user_formula = dict(filters).pop("filterByFormula", None)
+        if user_formula:
+            formula = u"AND({}, {})".format(user_formula, formula)
+
+        fields = [(k, v) for k, v in self.query if k == "fields[]"]
+        others = [(k, v) for k, v in filters if k != "filterByFormula"]
+        changed = self.client.list_records(fields + others + [("filterByFormula", formula)])
+        live_ids = set(r["id"] for r in self.client.list_records(filters + [("fields[]", _id_field)]))
+
+        for record in changed:
+            self.records[record["id"]] = record
+        deleted = [record_id for record_id in self.records if record_id not in live_ids]
+        for record_id in deleted:
+            del self.records[record_id]
+
+        self.full_pull = False
+        self.changed = len(changed)
+        self.deleted = len(deleted)
+
+    def sync(self):
+        # type: () -> None
+        """Bring the mirror up to date with the Airtable table, and save it.
+
+        Raises `AirtableError` if the table cannot be downloaded, `IOError` / `OSError`
+        if the mirror file cannot be written.
+        """
+        started = time.time()
+        id_field = self._id_field() if self.load() else None
+        if id_field is None:
+            self._pull()
+        else:
+            try:
+                self._sync_changes(id_field)
+            except AirtableError:
+                # -- ie: the id field has been renamed / deleted since the last sync
+                self._pull()
+
+        if self.full_pull or self.changed or self.deleted:
+            self.synced_at = started
+            self.save()
+        # -- else: nothing to write. The next sync just checks from the older `synced_at`.
+
+    def report(self):
+        # type: () -> str
+        """A one-line summary of the last `sync()`."""
+        if self.full_pull:
+            return u"Downloaded all {} records into the Airtable mirror: {}".format(len(self.records), self.path)
+        return u"Airtable mirror synced: {} changed, {} deleted, {} records: {}".format(
+            self.changed, self.deleted, len(self.records), self.path
+        )
@@ -7,6 +7,12 @@ from honeybee_ph_plus_rhino.gh_compo_io.collections.create_new_collection import
 from honeybee_ph_plus_rhino.gh_compo_io.collections.get_item_from_collection import (
     GHCompo_GetFromCustomCollection,
 )
+from honeybee_ph_plus_rhino.gh_compo_io.collections.query_collection import (
+    GHCompo_QueryCustomCollection,
+)
 from honeybee_ph_plus_rhino.gh_compo_io.collections.set_item_in_collection import (
     GHCompo_SetInCustomCollection,
 )
+from honeybee_ph_plus_rhino.gh_compo_io.collections.set_items_in_collection import (
+    GHCompo_SetItemsInCustomCollection,
+)
@@ -0,0 +1 @@
+"""Synthetic CSV files, and memory / timing benchmarks for Create Objects From CSV."""
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Time Create Objects From CSV, and measure the memory of its objects, for a synthetic CSV file.
+
+Run from the repository root (CPython, with the plugin's packages installed):
+
+    python -m honeybee_ph_plus_rhino.gh_compo_io.collections.benchmark.run_csv_benchmarks read [options]
+    python -m honeybee_ph_plus_rhino.gh_compo_io.collections.benchmark.run_csv_benchmarks memory [options]
+
+`read` options:
+    * --rows (int): The number of rows in the CSV file. Default=200000
+    * --columns (int): The number of columns (int / float / text, in turn). Default=10
+    * --typed (int): The number of columns given a `_datatypes` cast (the others are text). Default=5
+
+Reads the file with the component (the stdlib `csv` reader, one cast function per
+column, one object per row as the file is read), and with the reader from before
+(`readlines`, a split on commas and an `eval` cast of each cell; kept below, as the
+reference). Reports the time, rows per second and the peak memory (`tracemalloc`,
+measured on a second read). Exits with code 1 if the objects' values differ.
+
+`memory` options:
+    * --rows (int): The number of rows in the CSV file. Default=100000
+    * --columns (int): The number of columns (int / float / text, in turn). Default=30
+
+The file is read twice for each header style (all identifiers, and half of the
+headers with a space, which cannot be slots): into the slotted `CustomRecord`
+types, and into dict-based `CustomObject` types (as before the record types).
+The memory held by the objects is measured with `tracemalloc`, as a total and per
+row, next to the memory of the cast values alone. Exits with code 1 if the two
+kinds of object do not hold the same values.
+"""
+
+import argparse
+import gc
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from itertools import zip_longest
+from pathlib import Path
+from typing import ClassVar
+
+from honeybee_ph_plus_rhino.gh_compo_io.collections.create_items_from_csv import GHCompo_CreateObjectsFromCSV
+
+COLUMN_TYPES = ("int", "float", "str")
+
+
+class Messages:
+    """Records the messages the component would add to the GH component."""
+
+    def __init__(self):
+        self.errors: list[str] = []
+        self.warnings: list[str] = []
+
+    def error(self, _message):
+        self.errors.append(_message)
+
+    def warning(self, _message):
+        self.warnings.append(_message)
+
+
+class DictObjectsFromCSV(GHCompo_CreateObjectsFromCSV):
+    """The component, making dict-based `CustomObject` types (as before the slotted record types)."""
+
+    def create_custom_object_type(self, _datatypes, _fields=()):
+        new_type = super().create_custom_object_type(_datatypes)
+        new_type.fields = tuple(_fields)
+        return new_type
+
+
+def column_names(_num_columns: int, _spaced: bool = False) -> list[str]:
+    """Return the header of the file. `_spaced`: every other header has a space (so it cannot be a slot)."""
+    names = []
+    for i in range(_num_columns):
+        kind = COLUMN_TYPES[i % len(COLUMN_TYPES)]
+        names.append(f"{kind} col {i:02d}" if _spaced and i % 2 else f"{kind.upper()}_COL_{i:02d}")
+    return names
+
+
+def datatypes(_headers: list[str]) -> list[str]:
+    """Return the component's `_datatypes` input ("KEY:type") for the int and float columns."""
+    return [f"{h}:{h.split('_')[0].split(' ')[0].lower()}" for h in _headers if not h.lower().startswith("str")]
+
+
+def write_csv(_file_path: Path, _headers: list[str], _num_rows: int, _seed: int = 1) -> Path:
+    """Write a CSV file with random int, float and text values in the columns."""
+    rnd = random.Random(_seed)
+    kinds = [h.lower().split("_")[0].split(" ")[0] for h in _headers]
+    with open(_file_path, "w", encoding="utf-8", newline="") as f:
+        f.write(",".join(_headers) + "\n")
+        for i in range(_num_rows):
+            values = []
+            for j, kind in enumerate(kinds):
+                if kind == "int":
+                    values.append(str(rnd.randint(0, 100_000)))
+                elif kind == "float":
+                    values.append(f"{rnd.uniform(0, 1000):.4f}")
+                else:
+                    values.append(f"room {i} / item {j}")
+            f.write(",".join(values) + "\n")
+    return _file_path
+
+
+def measure(_func, *_args) -> tuple[object, int]:
+    """Return the result of the function, and the memory (bytes) it still holds after it returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = _func(*_args)
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, held
+
+
+def read_objects(_component_type: type, _file_path: Path, _headers: list[str]) -> list:
+    component = _component_type(Messages(), str(_file_path), "Row", datatypes(_headers))
+    objects = component.run()
+    if component.IGH.errors or component.IGH.warnings:
+        raise RuntimeError(f"{_component_type.__name__}: {component.IGH.errors + component.IGH.warnings}")
+    return objects
+
+
+def read_values(_file_path: Path, _headers: list[str]) -> list[tuple]:
+    """The cast values of each row, as a tuple: the memory of the values alone (plus one small tuple per row)."""
+    component = GHCompo_CreateObjectsFromCSV(Messages(), str(_file_path), "Row", datatypes(_headers))
+    return [tuple(getattr(obj, f) for f in obj.fields) for obj in component.run()]
+
+
+def values_of(_obj) -> list:
+    return [getattr(_obj, field) for field in _obj.fields]
+
+
+# -----------------------------------------------------------------------------
+# -- The reader from before the csv module / cast functions: the reference output and timing.
+
+
+class LegacyObject:
+    """The object type from before: each value is cast with `eval`, by the name of its type."""
+
+    datatypes: ClassVar[dict[str, str]] = {}
+
+    def __init__(self, **kwargs):
+        for k, v in kwargs.items():
+            key = str(k).upper().strip().replace("\xcf", "").replace("\xbb", "").replace("\xbf", "")
+            data_type = self.datatypes.get(key, "str")
+            setattr(self, key, eval(f"{data_type}({str(v).strip()!r})"))
+
+
+def legacy_read(_file_path: Path, _datatypes: list[str]) -> list[LegacyObject]:
+    """Read the whole file, split each line on commas and make one object per line."""
+    component = GHCompo_CreateObjectsFromCSV(Messages(), str(_file_path), "Row", _datatypes)
+    object_type = type("Row", (LegacyObject,), {"datatypes": component.datatypes})
+    with open(_file_path) as csv_file:
+        data = list(csv_file.readlines())
+    headers = data[0].split(",")
+    return [object_type(**dict(zip_longest(headers, line.split(",")))) for line in data[1:]]
+
+
+def component_read(_file_path: Path, _datatypes: list[str]) -> list:
+    component = GHCompo_CreateObjectsFromCSV(Messages(), str(_file_path), "Row", _datatypes)
+    objects = component.run()
+    if component.IGH.errors or component.IGH.warnings:
+        raise RuntimeError(f"{component.IGH.errors + component.IGH.warnings}")
+    return objects
+
+
+def measure_peak(_func, *_args) -> int:
+    """Return the peak memory (bytes) used while the function runs, its result included."""
+    gc.collect()
+    tracemalloc.start()
+    _func(*_args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def read_benchmark(_args: argparse.Namespace) -> list[str]:
+    """Time the component's read against the reader from before. Return the failure messages."""
+    failures = []
+    print(f"Create Objects From CSV read: {_args.rows:,} rows x {_args.columns} columns, {_args.typed} typed")
+    with tempfile.TemporaryDirectory() as folder:
+        headers = column_names(_args.columns)
+        file_path = write_csv(Path(folder) / "rows.csv", headers, _args.rows)
+        types = datatypes(headers)[: _args.typed]
+
+        results = {}
+        for name, func in (("before", legacy_read), ("after", component_read)):
+            start = time.perf_counter()
+            objects = func(file_path, types)
+            seconds = time.perf_counter() - start
+            results[name] = [vars(obj) if name == "before" else obj.to_dict() for obj in objects[:1_000] + objects[-1:]]
+            del objects
+            peak = measure_peak(func, file_path, types)
+            print(f"  {name:<7} {seconds:>7.2f} s  {_args.rows / seconds:>9,.0f} rows/s  {peak / 1e6:>7.1f} MB peak")
+
+    if results["before"] != results["after"]:
+        failures.append("read: the objects do not hold the same values as the reader from before")
+    return failures
+
+
+def memory_benchmark(_args: argparse.Namespace) -> list[str]:
+    """Measure the memory of the slotted records against dict-based objects. Return the failure messages."""
+    failures = []
+    print(f"Create Objects From CSV memory: {_args.rows:,} rows x {_args.columns} columns (int / float / text)")
+    with tempfile.TemporaryDirectory() as folder:
+        for label, spaced in (("all identifiers", False), ("half with spaces", True)):
+            headers = column_names(_args.columns, spaced)
+            file_path = write_csv(Path(folder) / "rows.csv", headers, _args.rows)
+
+            values, values_bytes = measure(read_values, file_path, headers)
+            del values
+            print(
+                f"  {label:<17} {'value tuples':<13} {values_bytes / 1e6:>7.1f} MB  "
+                f"{values_bytes / _args.rows:>6,.0f} B/row"
+            )
+
+            results = {}
+            for name, component_type in (
+                ("dict objects", DictObjectsFromCSV),
+                ("slot records", GHCompo_CreateObjectsFromCSV),
+            ):
+                objects, held = measure(read_objects, component_type, file_path, headers)
+                print(f"  {label:<17} {name:<13} {held / 1e6:>7.1f} MB  {held / _args.rows:>6,.0f} B/row")
+                results[name] = [values_of(obj) for obj in objects[:1_000]] + [values_of(objects[-1])]
+                del objects
+
+            if results["dict objects"] != results["slot records"]:
+                failures.append(f"{label}: the slotted records do not hold the same values as the dict objects")
+    return failures
+
+
+def resolve_arguments(_args: list[str]) -> argparse.Namespace:
+    """Get all the script arguments."""
+    parser = argparse.ArgumentParser(description="Time / measure the objects made from a CSV file.")
+    benchmarks = parser.add_subparsers(dest="benchmark", required=True)
+
+    read = benchmarks.add_parser("read", help="Time the read, against the reader from before.")
+    read.add_argument("--rows", type=int, default=200_000)
+    read.add_argument("--columns", type=int, default=10)
+    read.add_argument("--typed", type=int, default=5)
+    read.set_defaults(func=read_benchmark)
+
+    memory = benchmarks.add_parser("memory", help="Measure the memory of the slotted records.")
+    memory.add_argument("--rows", type=int, default=100_000)
+    memory.add_argument("--columns", type=int, default=30)
+    memory.set_defaults(func=memory_benchmark)
+    return parser.parse_args(_args)
+
+
+if __name__ == "__main__":
+    args = resolve_arguments(sys.argv[1:])
+    failures = args.func(args)
+
+    if failures:
+        print("FAILED:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("The values match.")
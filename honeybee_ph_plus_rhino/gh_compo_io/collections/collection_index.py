@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Secondary indexes on the items of a CustomCollection: attribute value -> collection keys.
+
+- `HashIndex`: equality lookups (`TYPE == "ERV"`) in O(1).
+- `SortedIndex`: equality, range (`10 <= SIZE <= 20`) and text-prefix (`NAME` starts
+  with `"ERV-"`) lookups in O(log n).
+
+An index is built once over a collection (`CustomCollection.index`), and then kept up
+to date by each `collection[key] = item`. Items without the attribute (or with a None
+value) are not in the index. An index holds the attribute values the items had when
+they were set: it does not see later changes to the item objects themselves.
+"""
+
+from bisect import bisect_left, bisect_right
+from numbers import Number
+
+try:
+    from typing import Any, Iterable  # noqa: F401
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    TEXT_TYPES = (basestring,)  # type: ignore
+except NameError:
+    TEXT_TYPES = (str,)  # Python 3
+
+
+def attribute_value(_item, _attribute):
+    # type: (Any, str) -> Any
+    """Return the item's attribute value (or its value for the key, for a dict item), or None."""
+    value = getattr(_item, _attribute, None)
+    if value is None and isinstance(_item, dict):
+        value = _item.get(_attribute, None)
+    return value
+
+
+def value_kind(_value):
+    # type: (Any) -> Any
+    """Return what the value sorts as: "number" (bool, int, float), "text" or else its type."""
+    if isinstance(_value, Number):
+        return "number"
+    if isinstance(_value, TEXT_TYPES):
+        return "text"
+    return type(_value)
+
+
+class HashIndex(object):
+    """The keys of a collection's items, by the value of one of their attributes."""
+
+    def __init__(self, _attribute):
+        # type: (str) -> None
+        self.attribute = _attribute
+        self._keys = {}  # type: dict[Any, set[str]]
+        self._sorted_keys = {}  # type: dict[Any, list[str]] # -- Cache, per value
+
+    def build(self, _items):
+        # type: (Iterable[tuple[str, Any]]) -> None
+        """Index all of the `(key, item)` pairs."""
+        for key, item in _items:
+            self.add(key, item)
+
+    def add(self, _key, _item):
+        # type: (str, Any) -> None
+        value = attribute_value(_item, self.attribute)
+        if value is not None:
+            self._keys.setdefault(value, set()).add(_key)
+            self._sorted_keys.pop(value, None)
+
+    def remove(self, _key, _item):
+        # type: (str, Any) -> None
+        value = attribute_value(_item, self.attribute)
+        keys = self._keys.get(value) if value is not None else None
+        if keys is not None:
+            keys.discard(_key)
+            self._sorted_keys.pop(value, None)
+            if not keys:
+                del self._keys[value]
+
+    def equals(self, _values):
+        # type: (list[Any]) -> list[str]
+        """Return the keys (sorted) of the items whose attribute value is any of the `_values`."""
+        keys = []
+        for value in set(_values):
+            sorted_keys = self._sorted_keys.get(value)
+            if sorted_keys is None:
+                sorted_keys = self._sorted_keys[value] = sorted(self._keys.get(value, ()))
+            keys.extend(sorted_keys)
+        if len(_values) > 1:
+            keys.sort()  # -- Already sorted runs (an item has one value, so no duplicates)
+        return keys
+
+
+class SortedIndex(object):
+    """The keys of a collection's items, sorted by the value of one of their attributes.
+
+    Two parallel lists, sorted by (value, key). The values must all be of one kind
+    (all numbers, or all text): IronPython 2.7 would sort mixed values silently (all
+    numbers before all text), so a `ValueError` is raised instead.
+    """
+
+    def __init__(self, _attribute):
+        # type: (str) -> None
+        self.attribute = _attribute
+        self._values = []  # type: list[Any]
+        self._keys = []  # type: list[str]
+        self._kind = None  # type: Any # -- The kind of all the values, once there is one
+
+    def _check(self, _value, _key=None):
+        # type: (Any, str | None) -> None
+        """Raise a `ValueError` if the value is not of the same kind as the index's values."""
+        kind = value_kind(_value)
+        if self._kind is None:
+            self._kind = kind
+        elif kind != self._kind:
+            raise ValueError(
+                "Cannot sort the '{}' values: {!r}{} is not of the same kind as the others ({}).".format(
+                    self.attribute,
+                    _value,
+                    " (item '{}')".format(_key) if _key is not None else "",
+                    getattr(self._kind, "__name__", self._kind),
+                )
+            )
+
+    def build(self, _items):
+        # type: (Iterable[tuple[str, Any]]) -> None
+        """Index all of the `(key, item)` pairs (of a new index), with one sort instead of an insert for each."""
+        entries = []
+        for key, item in _items:
+            value = attribute_value(item, self.attribute)
+            if value is not None:
+                self._check(value, key)
+                entries.append((value, key))
+        entries.sort()
+        self._values = [value for value, _ in entries]
+        self._keys = [key for _, key in entries]
+
+    def _position(self, _value, _key):
+        # type: (Any, str) -> int
+        """Return the position of (value, key) in the lists (where it is, or would be inserted)."""
+        lo = bisect_left(self._values, _value)
+        hi = bisect_right(self._values, _value, lo)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._keys[mid] < _key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def add(self, _key, _item):
+        # type: (str, Any) -> None
+        value = attribute_value(_item, self.attribute)
+        if value is not None:
+            self._check(value, _key)
+            i = self._position(value, _key)
+            self._values.insert(i, value)
+            self._keys.insert(i, _key)
+
+    def remove(self, _key, _item):
+        # type: (str, Any) -> None
+        value = attribute_value(_item, self.attribute)
+        if value is None:
+            return
+        i = self._position(value, _key)
+        if i < len(self._keys) and self._keys[i] == _key and self._values[i] == value:
+            del self._values[i]
+            del self._keys[i]
+            if not self._values:
+                self._kind = None
+
+    def equals(self, _values):
+        # type: (Iterable[Any]) -> list[str]
+        """Return the keys (sorted) of the items whose attribute value is any of the `_values`."""
+        keys = set()
+        for value in _values:
+            keys.update(self._keys[bisect_left(self._values, value) : bisect_right(self._values, value)])
+        return sorted(keys)
+
+    def between(self, _min=None, _max=None):
+        # type: (Any, Any) -> list[str]
+        """Return the keys (in value order) of the items with `_min <= value <= _max`. None is no limit."""
+        for limit in (_min, _max):
+            if limit is not None and self._values:
+                self._check(limit)
+        lo = 0 if _min is None else bisect_left(self._values, _min)
+        hi = len(self._values) if _max is None else bisect_right(self._values, _max)
+        return self._keys[lo:hi]
+
+    def prefix(self, _prefix):
+        # type: (str) -> list[str]
+        """Return the keys (in value order) of the items whose text value starts with `_prefix`."""
+        if self._values:
+            self._check(_prefix)
+        i = bisect_left(self._values, _prefix)
+        j = i
+        while j < len(self._values) and self._values[j].startswith(_prefix):
+            j += 1
+        return self._keys[i:j]
@@ -3,15 +3,18 @@
 
 """GHCompo Interface: HBPH - Create Objects From CSV."""
 
+import csv
+import os
+import re
+import sys
+
 try:
-    from itertools import izip_longest  # type: ignore
+    import __builtin__ as builtins  # type: ignore
 except ImportError:
-    pass  # Python 3.x
-
-import os
+    import builtins  # Python 3.x
 
 try:
-    from typing import Dict, List, Optional
+    from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 except ImportError:
     pass  # IronPython 2.7
 
@@ -21,35 +24,62 @@ except ImportError:
     raise ImportError("Failed to import honeybee_ph_rhino")
 
 
-class CustomObject(object):
-    """A simple wrapper Object for input CSV data"""
+def cast_function(_data_type):
+    # type: (str) -> Callable[[str], Any]
+    """Return the built-in type to cast the text values to, from its name (ie: "float").
+
+    Raises a `ValueError` if the name is not a built-in type.
+    """
+    cast = getattr(builtins, str(_data_type).strip(), None)
+    if not isinstance(cast, type):
+        raise ValueError("'{}' is not a type name (ie: 'str', 'int', 'float').".format(_data_type))
+    return cast
+
+
+def empty_as_none(_cast):
+    # type: (Callable[[str], Any]) -> Callable[[str], Any]
+    """Return the cast, made to read an empty value as None (like a value missing from a short row).
+
+    A text (`str`) cast is returned as is: an empty text value stays "".
+    """
+    if _cast is str:
+        return _cast
+
+    def cast_or_none(_value):
+        return _cast(_value) if _value else None
+
+    return cast_or_none
+
+
+class _CustomObjectBase(object):
+    """The methods shared by CustomObject and CustomRecord. No `__dict__`: each subclass adds its own storage."""
+
+    __slots__ = ()
 
     # Optional types for casting input values
     datatypes = {}
 
+    # The (cleaned) attribute names, in column order. Set on the types made for a CSV file.
+    fields = ()  # type: tuple[str, ...]
+
     def __init__(self, *args, **kwargs):
         for k, v in kwargs.items():
             key = self.clean_key(k)
+            cast = empty_as_none(cast_function(self.datatypes.get(key, "str")))
+            setattr(self, key, cast(str(v).strip()))
 
-            try:
-                # -- Try and cast the value based on the user's type info
-                data_type = self.datatypes[key]
-            except KeyError:
-                data_type = "str"
-
-            value = eval("{}({!r})".format(data_type, str(v).strip()))
-            setattr(self, key, value)
-
-    def clean_key(self, _key):
+    @staticmethod
+    def clean_key(_key):
         # type: (str) -> str
-        return self.strip_characters(str(_key).upper().strip())
+        return _CustomObjectBase.strip_characters(str(_key).upper().strip())
 
-    def strip_characters(self, _key):
+    @staticmethod
+    def strip_characters(_key):
         """Remove non-unicode characters."""
         return _key.replace("\xcf", "").replace("\xbb", "").replace("\xbf", "")
 
     def __str__(self):
-        return "{}({})".format(self.__class__.__name__, vars(self))
+        return "{}({})".format(self.__class__.__name__, getattr(self, "__dict__", {}))
 
     def __repr__(self):
         return str(self)
@@ -58,6 +88,101 @@ class CustomObject(object):
         return str(self)
 
 
+class CustomObject(_CustomObjectBase):
+    """A simple wrapper Object for input CSV data"""
+
+    # -- No `__slots__`: the attributes are kept in the object's `__dict__`
+
+    @classmethod
+    def from_values(cls, _values):
+        # type: (Iterable[Any]) -> CustomObject
+        """Return a new object with the (already cast) values of the `fields`, in order."""
+        obj = cls.__new__(cls)
+        obj.__dict__.update(zip(cls.fields, _values))
+        return obj
+
+
+class CustomRecord(_CustomObjectBase):
+    """A CSV object which keeps its values in `__slots__`, with no per-object dict.
+
+    The record types made for a CSV file declare the header keys as their `__slots__`
+    (see `slot_names`), so each object holds one fixed-size array of values, like a
+    tuple, and has no `__dict__` or `__weakref__`. Only a record type with a header key
+    which cannot be a slot (ie: "ROOM NAME", with a space) also gets a `__dict__`, for
+    those keys. To set any other attribute, use `with_attribute`.
+    """
+
+    __slots__ = ()
+
+    # -- The subclass with a `__dict__` (made on first use by `extended_type`)
+    _extended = None  # type: Optional[type]
+
+    @classmethod
+    def extended_type(cls):
+        # type: () -> type
+        """Return the record type with the same slots, plus a `__dict__` for other attributes."""
+        if cls._extended is None:
+            cls._extended = type(cls.__name__, (cls,), {"__slots__": ("__dict__",)})
+        return cls._extended
+
+    @classmethod
+    def from_values(cls, _values):
+        # type: (Iterable[Any]) -> CustomRecord
+        """Return a new record with the (already cast) values of the `fields`, in order."""
+        obj = cls.__new__(cls)
+        for field, value in zip(cls.fields, _values):
+            setattr(obj, field, value)
+        return obj
+
+    def to_dict(self):
+        # type: () -> Dict[str, Any]
+        """Return the record's `{field: value}` (and any other attributes set on it)."""
+        d = {field: getattr(self, field, None) for field in self.fields}
+        d.update(getattr(self, "__dict__", {}))
+        return d
+
+    def _copy(self, _type):
+        # type: (type) -> CustomRecord
+        new_record = _type.from_values([getattr(self, field, None) for field in self.fields])
+        attributes = getattr(self, "__dict__", None)
+        if attributes:
+            new_record.__dict__.update(attributes)
+        return new_record
+
+    def __copy__(self):
+        # type: () -> CustomRecord
+        return self._copy(self.__class__)
+
+    def with_attribute(self, _key, _value):
+        # type: (str, Any) -> CustomRecord
+        """Return a copy of the record with the attribute set (of the `extended_type` if it has no slot for it)."""
+        try:
+            new_record = self._copy(self.__class__)
+            setattr(new_record, _key, _value)
+        except AttributeError:
+            new_record = self._copy(self.extended_type())
+            setattr(new_record, _key, _value)
+        return new_record
+
+    def __str__(self):
+        return "{}({})".format(self.__class__.__name__, self.to_dict())
+
+
+# -- A name which `__slots__` can hold as is (a "__name" would be mangled)
+_SLOT_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def slot_names(_fields):
+    # type: (Iterable[str]) -> tuple[str, ...]
+    """Return the field names which can be `__slots__`: each valid, public identifier, once."""
+    names = []  # type: List[str]
+    for field in _fields:
+        if _SLOT_NAME.match(field) and not field.startswith("__") and not hasattr(CustomRecord, field):
+            if field not in names:
+                names.append(field)
+    return tuple(names)
+
+
 class GHCompo_CreateObjectsFromCSV(object):
     def __init__(self, _IGH, _path, _class_name, _datatypes, *args, **kwargs):
         # type: (gh_io.IGH, str, str, List[str], List, Dict) -> None
@@ -83,7 +208,7 @@ class GHCompo_CreateObjectsFromCSV(object):
         # type: (List[str]) -> Dict
         d = {}
 
-        for _ in _datatypes:
+        for _ in _datatypes or []:
             if ":" not in _:
                 continue
             line = str(_).split(":")
@@ -91,40 +216,76 @@ class GHCompo_CreateObjectsFromCSV(object):
 
         return d
 
-    def create_custom_object_type(self, _datatypes):
-        # type: (Dict) -> type
+    def create_custom_object_type(self, _datatypes, _fields=()):
+        # type: (Dict, tuple[str, ...]) -> type
         # Create a new class dynamically with the user supplied name
         class_name = self.class_name or "CustomObject"
-        new_type = type(
-            class_name,
-            (CustomObject,),
-            {
-                # data members
-                "datatypes": _datatypes,
-            },
-        )
-        return new_type
-
-    def get_file_data(self):
-        # type: () -> List[str]
-        with open(self.path, "r") as csv_file:
-            return list(csv_file.readlines())
-
-    def build_objects_from_data(self, _data):
-        # type: (List[str]) -> List[CustomObject]
-
-        NewObjectType = self.create_custom_object_type(self.datatypes)
-
-        headers = [_ for _ in _data[0].split(",")]
-        new_objects_ = [
-            NewObjectType(**{h: d for h, d in izip_longest(headers, line.split(","))})
-            for line in _data[1:]
-        ]
-
-        return new_objects_
+        members = {
+            # data members
+            "datatypes": _datatypes,
+            "fields": tuple(_fields),
+        }
+        if _fields:
+            # -- A record type, with a slot for each of the CSV file's columns. A `__dict__`
+            # -- only if some column cannot be a slot.
+            slots = slot_names(_fields)
+            if set(slots) != set(_fields):
+                slots += ("__dict__",)
+            members["__slots__"] = slots
+            record_type = type(class_name, (CustomRecord,), members)
+            if "__dict__" in slots:
+                record_type._extended = record_type
+            return record_type
+        return type(class_name, (CustomObject,), members)
+
+    def read_rows(self):
+        # type: () -> Iterator[List[str]]
+        """Yield each row of the CSV file as a list of values, one at a time. Quoted values may hold commas."""
+        if sys.version_info[0] >= 3:
+            csv_file = open(self.path, "r", newline="")
+        else:
+            csv_file = open(self.path, "rb")
+        with csv_file:
+            for row in csv.reader(csv_file):
+                yield row
+
+    def build_objects_from_data(self, _rows):
+        # type: (Iterable[List[str]]) -> Iterator[_CustomObjectBase]
+        """Yield a new object for each row after the header row, one row at a time.
+
+        The header keys and the cast functions are worked out once, for each column.
+        An empty value in a typed column is None. Raises a `ValueError` if a value
+        cannot be cast to its column's type.
+        """
+        rows = iter(_rows)
+        headers = next(rows, None)
+        if headers is None:
+            return
+
+        fields = tuple(CustomObject.clean_key(h) for h in headers)
+        NewObjectType = self.create_custom_object_type(self.datatypes, fields)
+
+        casts = []  # type: List[Callable[[str], Any]]
+        for field in fields:
+            try:
+                casts.append(empty_as_none(cast_function(self.datatypes.get(field, "str"))))
+            except ValueError as e:
+                self.IGH.warning("Column '{}': {} Reading it as text.".format(field, e))
+                casts.append(str)
+
+        for row_number, row in enumerate(rows, start=2):
+            if not row:
+                continue  # -- A blank line
+            try:
+                values = [cast(v.strip()) for cast, v in zip(casts, row)]
+            except ValueError as e:
+                raise ValueError("Row {}: {}".format(row_number, e))
+            if len(values) < len(fields):
+                values.extend([None] * (len(fields) - len(values)))  # -- A short row: None for the missing values
+            yield NewObjectType.from_values(values)
 
     def run(self):
-        # type: () -> List[CustomObject]
+        # type: () -> List[_CustomObjectBase]
 
         if not self.path:
             return []
@@ -136,7 +297,8 @@ class GHCompo_CreateObjectsFromCSV(object):
             self.IGH.warning(msg)
             return []
 
-        data = self.get_file_data()
-        new_objects_ = self.build_objects_from_data(data)
-
-        return new_objects_
+        try:
+            return list(self.build_objects_from_data(self.read_rows()))
+        except ValueError as e:
+            self.IGH.error("Cannot read the file '{}': {}".format(self.path, e))
+            return []
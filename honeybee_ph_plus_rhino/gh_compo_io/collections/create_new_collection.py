@@ -5,12 +5,15 @@
 
 try:
     from typing import (
+        Any,
         Collection,
         Dict,
         ItemsView,
+        Iterable,
         KeysView,
         List,
         Optional,
+        Tuple,
         TypeVar,
         ValuesView,
     )
@@ -24,14 +27,41 @@ try:
 except ImportError:
     raise ImportError("Failed to import honeybee_ph_rhino")
 
+try:
+    from honeybee_ph_plus_rhino.gh_compo_io.collections.collection_index import HashIndex, SortedIndex
+except ImportError as e:
+    raise ImportError("\nFailed to import from honeybee_ph_plus_rhino {}".format(e))
+
+
+# -- Marks a key missing from a layer (an item may itself be None)
+_MISSING = object()
+
 
 class CustomCollection(object):
-    """A custom 'Collection' class which works like a Python Dictionary."""
+    """A custom 'Collection' class which works like a Python Dictionary.
+
+    A collection made by `with_item` shares the items of the collection it was made
+    from instead of copying them: its items are a stack of read-only `_layers` (dicts,
+    oldest first) under its own `_storage` dict, and a key's newest value is the one
+    found highest up. The layers are merged into one dict the first time the whole
+    collection is read (`keys()` / `items()` / `values()`).
+
+    Items can also be found by an attribute value (`find`), through secondary indexes
+    (see `collection_index.py`) built on first use and then kept up to date by
+    `collection[key] = item`. A collection made by `with_item` builds its own indexes.
+    """
+
+    # -- How `with_items` treats a key which is already set
+    CONFLICT_POLICIES = ("replace", "keep", "error")
 
     def __init__(self, _display_name="", *args, **kwargs):
         # type: (str, List, Dict) -> None
         self.display_name = _display_name or ""
         self._storage = {}
+        self._layers = []  # type: List[Dict[str, T]] # -- Shared with other collections: never changed
+        self._length = 0  # -- The number of unique keys, when there are _layers
+        self._shared = False  # -- If `_storage` is also a layer of another collection
+        self._indexes = {}  # type: Dict[Tuple[str, bool], HashIndex | SortedIndex] # -- (attribute, sorted)
 
     @classmethod
     def from_dict(cls, _mapping, _display_name=""):
@@ -49,43 +79,193 @@ class CustomCollection(object):
             collection[key] = value
         return collection
 
+    @classmethod
+    def from_storage(cls, _storage, _display_name=""):
+        # type: (Dict[str, T], str) -> CustomCollection
+        """Build a CustomCollection which uses the `_storage` dict itself as its storage.
+
+        Unlike `from_dict`, nothing is copied: for a component which has just built a
+        large `{key: item}` dict of its own and hands it over. The dict must not be
+        changed afterwards except through the collection.
+        """
+        collection = cls(_display_name)
+        collection._storage = _storage
+        return collection
+
+    def _derive(self, _storage, _length):
+        # type: (Dict[str, T], int) -> CustomCollection
+        """Return a new collection of this collection's items under the `_storage` dict's items."""
+        layers = list(self._layers)
+        if self._storage:
+            layers.append(self._storage)
+            self._shared = True
+
+        # -- Merge the top layer into the one below while it is as large: like a binary
+        # -- counter, each layer is then under half the size of the one below it, so a
+        # -- lookup checks at most ~log2(n) layers, and each key is re-copied ~log2(n) times.
+        while len(layers) > 1 and len(layers[-1]) >= len(layers[-2]):
+            top = layers.pop()
+            merged = dict(layers.pop())
+            merged.update(top)
+            layers.append(merged)
+
+        new_collection = self.__class__(self.display_name)
+        new_collection._layers = layers
+        new_collection._length = _length
+        new_collection._storage = _storage
+        return new_collection
+
+    def with_item(self, _key, _item):
+        # type: (str, T) -> CustomCollection
+        """Return a new collection with the item set at the key. This collection is not changed.
+
+        The new collection shares this collection's items (about O(log n) per call), so a
+        long chain of 'Set Item' components does not copy the whole collection at each step.
+        """
+        return self._derive({_key: _item}, len(self) + (0 if _key in self else 1))
+
+    def with_items(self, _items, _on_conflict="replace"):
+        # type: (Iterable[Tuple[str, T]] | Dict[str, T] | CustomCollection, str) -> CustomCollection
+        """Return a new collection with all of the items set. This collection is not changed.
+
+        `_items` is a list of `(key, item)` pairs, a dict or another collection. They are
+        set in a single pass into one new dict, shared with this collection like `with_item`.
+
+        `_on_conflict` decides what happens to a key which is already set (in this
+        collection, or earlier in `_items`):
+            * "replace": The new item replaces the old one (the last one wins).
+            * "keep": The old item is kept (the first one wins).
+            * "error": Raise a `KeyError` listing all of the conflicting keys.
+        """
+        if _on_conflict not in self.CONFLICT_POLICIES:
+            raise ValueError(
+                "Unknown conflict policy: '{}'. Use one of: {}".format(_on_conflict, self.CONFLICT_POLICIES)
+            )
+
+        pairs = _items.items() if hasattr(_items, "items") else _items
+        storage = {}  # type: Dict[str, T]
+        conflicts = []  # type: List[str]
+        new_keys = 0
+        for k, v in pairs:
+            if k not in storage and k not in self:
+                new_keys += 1
+            elif _on_conflict == "keep":
+                continue
+            elif _on_conflict == "error":
+                conflicts.append(k)
+            storage[k] = v
+
+        if conflicts:
+            raise KeyError("Key(s): {} already set in the collection.".format(conflicts))
+        return self._derive(storage, len(self) + new_keys)
+
+    def _lookup(self, k):
+        # type: (str) -> T
+        """Return the newest value of the key, or `_MISSING`."""
+        v = self._storage.get(k, _MISSING)
+        if v is _MISSING:
+            for layer in reversed(self._layers):
+                v = layer.get(k, _MISSING)
+                if v is not _MISSING:
+                    break
+        return v
+
+    def _flatten(self):
+        # type: () -> Dict[str, T]
+        """Merge the layers into this collection's own `_storage` (once), and return it."""
+        if self._layers:
+            merged = {}
+            for layer in self._layers:
+                merged.update(layer)
+            merged.update(self._storage)
+            self._storage, self._layers, self._shared = merged, [], False
+        return self._storage
+
+    def index(self, _attribute, _sorted=False):
+        # type: (str, bool) -> HashIndex | SortedIndex
+        """Return the index of the items by an attribute, building it on first use.
+
+        A sorted index also serves equality lookups, so an equality-only (hash) index
+        is only built if the collection has no sorted index on the attribute.
+        """
+        index = self._indexes.get((_attribute, True))
+        if index is None and not _sorted:
+            index = self._indexes.get((_attribute, False))
+        if index is None:
+            index = SortedIndex(_attribute) if _sorted else HashIndex(_attribute)
+            index.build(self.items())
+            self._indexes[(_attribute, _sorted)] = index
+        return index
+
+    def find(self, _attribute, _equals=None, _min=None, _max=None, _prefix=None):
+        # type: (str, Optional[Iterable], Any, Any, Optional[str]) -> List[str]
+        """Return the keys of the items with an attribute value which is one of `_equals`,
+        or which is between `_min` and `_max` (inclusive, either one optional), or which
+        starts with `_prefix`.
+        """
+        if _prefix is not None:
+            return self.index(_attribute, _sorted=True).prefix(_prefix)
+        if _min is not None or _max is not None:
+            return self.index(_attribute, _sorted=True).between(_min, _max)
+        return self.index(_attribute).equals(_equals or [])
+
     def keys(self):
         # type: () -> KeysView[str]
-        return self._storage.keys()
+        return self._flatten().keys()
 
     def items(self):
         # type: () -> ItemsView[str, T]
-        return self._storage.items()
+        return self._flatten().items()
 
     def values(self):
         # type: () -> ValuesView[T]
-        return self._storage.values()
+        return self._flatten().values()
 
     def __setitem__(self, k, v):
         # type: (str, T) -> None
-        self._storage[k] = v
+        if self._shared:
+            # -- Copy-on-write: the collections made by `with_item` still read the old dict.
+            self._storage, self._shared = dict(self._storage), False
+        old = self._lookup(k) if (self._layers or self._indexes) else _MISSING
+        if self._layers and old is _MISSING:
+            self._length += 1
+        self._storage[k] = v  # -- First: a failed index update must not lose the item
+
+        for index_key, index in list(self._indexes.items()):
+            try:
+                if old is not _MISSING:
+                    index.remove(k, old)
+                index.add(k, v)
+            except (TypeError, ValueError):
+                # -- A value the index cannot hold (ie: unhashable, or text in a sorted index
+                # -- of numbers): drop the index. The next query rebuilds it, and raises there.
+                del self._indexes[index_key]
 
     def __getitem__(self, k):
         # type: (str) -> T
-        return self._storage[k]
+        v = self._lookup(k)
+        if v is _MISSING:
+            raise KeyError(k)
+        return v
 
     def get(self, k, default):
         # type: (str, T) -> Optional[T]
-        return self._storage.get(k, default)
+        v = self._lookup(k)
+        return default if v is _MISSING else v
 
     def __contains__(self, k):
         # type: (str) -> bool
-        return k in self._storage
+        return self._lookup(k) is not _MISSING
 
     def __len__(self):
-        return len(self._storage)
+        return self._length if self._layers else len(self._storage)
 
     def __str__(self):
         # type: () -> str
         return '{}: "{}" ({} items)\n{}'.format(
             self.__class__.__name__,
             self.display_name,
-            len(self._storage),
+            len(self),
             "\n".join(
                 [
                     "\t - Key: {} = {}...".format(k, str(v)[:25].replace("\n", ""))
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""GHCompo Interface: HBPH+ - Query Custom Collection."""
+
+try:
+    from typing import Any
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
+
+try:
+    from honeybee_ph_plus_rhino.gh_compo_io.collections.create_new_collection import CustomCollection
+except ImportError:
+    raise ImportError("Failed to import honeybee_ph_plus_rhino")
+
+
+class GHCompo_QueryCustomCollection(object):
+    def __init__(self, _IGH, _collection, _attribute, _equals, _min, _max, _prefix, *args, **kwargs):
+        # type: (gh_io.IGH, CustomCollection, str, list[Any], Any, Any, str | None, list, dict) -> None
+        self.IGH = _IGH
+        self.collection = _collection
+        self.attribute = (_attribute or "").strip()
+        self.equals = [v for v in _equals or [] if v is not None]
+        self.min = _min
+        self.max = _max
+        self.prefix = _prefix or None
+
+    @property
+    def query_types(self):
+        # type: () -> list[str]
+        """The kinds of lookup asked for: 'equals', 'range' and / or 'prefix'."""
+        types = []
+        if self.equals:
+            types.append("equals")
+        if self.min is not None or self.max is not None:
+            types.append("range")
+        if self.prefix is not None:
+            types.append("prefix")
+        return types
+
+    def run(self):
+        # type: () -> tuple[list[str], list[Any]]
+        if not self.collection or not self.attribute:
+            return [], []
+
+        if len(self.query_types) != 1:
+            self.IGH.error("Set only one of: _equals, _min / _max, or _prefix. Got: {}".format(self.query_types))
+            return [], []
+
+        try:
+            keys_ = self.collection.find(self.attribute, self.equals, self.min, self.max, self.prefix)
+        except (TypeError, AttributeError, ValueError) as e:
+            # -- ie: unhashable (list) values, or text values mixed with numbers
+            self.IGH.error("Cannot query the '{}' values of the items: {}".format(self.attribute, e))
+            return [], []
+
+        return keys_, [self.collection[k] for k in keys_]
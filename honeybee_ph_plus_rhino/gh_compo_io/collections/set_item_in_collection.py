@@ -32,9 +32,4 @@ class GHCompo_SetInCustomCollection(object):
         if not self.collection or not self.key:
             return self.collection
 
-        new_collection = CustomCollection()
-        for k, v in self.collection.items():
-            new_collection[k] = v
-        new_collection[self.key] = self.item
-
-        return new_collection
+        return self.collection.with_item(self.key, self.item)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""GHCompo Interface: HBPH+ - Set Items In Custom Collection."""
+
+from itertools import chain
+
+try:
+    from typing import Any, Iterator
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError("\nFailed to import ph_gh_component_io:\n\t{}".format(e))
+
+try:
+    from honeybee_ph_plus_rhino.gh_compo_io.collections.create_new_collection import CustomCollection
+except ImportError:
+    raise ImportError("Failed to import honeybee_ph_plus_rhino")
+
+
+class GHCompo_SetItemsInCustomCollection(object):
+    def __init__(self, _IGH, _collection, _keys, _items, _collections, _on_conflict, *args, **kwargs):
+        # type: (gh_io.IGH, CustomCollection | None, list[str], list[Any], list[CustomCollection], str | None, list, dict) -> None
+        self.IGH = _IGH
+        self.collection = _collection
+        self.keys = _keys or []
+        self.items = _items or []
+        self.collections = [c for c in _collections or [] if c is not None]
+        self.on_conflict = (_on_conflict or "replace").strip().lower()
+
+    def pairs(self):
+        # type: () -> Iterator[tuple[str, Any]]
+        """Return the `(key, item)` pairs to set (an iterator): the `_collections`' items first, then the `_keys` / `_items`."""
+        return chain(chain.from_iterable(c.items() for c in self.collections), zip(self.keys, self.items))
+
+    def run(self):
+        # type: () -> CustomCollection | None
+        if len(self.keys) != len(self.items):
+            self.IGH.error(
+                "The number of _keys ({}) and _items ({}) must match.".format(len(self.keys), len(self.items))
+            )
+            return None
+
+        if self.on_conflict not in CustomCollection.CONFLICT_POLICIES:
+            self.IGH.error(
+                "Unknown _on_conflict: '{}'. Use one of: {}".format(
+                    self.on_conflict, CustomCollection.CONFLICT_POLICIES
+                )
+            )
+            return None
+
+        collection = self.collection if self.collection is not None else CustomCollection()
+        try:
+            new_collection = collection.with_items(self.pairs(), self.on_conflict)
+        except KeyError as e:
+            self.IGH.error(e.args[0])
+            return None
+
+        self.IGH.remark(
+            "Set {} items: {} new keys, {} items in the collection.".format(
+                sum(len(c) for c in self.collections) + len(self.keys),
+                len(new_collection) - len(collection),
+                len(new_collection),
+            )
+        )
+        return new_collection
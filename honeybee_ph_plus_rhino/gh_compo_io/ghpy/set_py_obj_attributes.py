@@ -31,6 +31,9 @@ except ImportError:
 def copy_and_set(obj, _key, _value):
     # type: (Any, str, Any) -> Any
     """Return a copy of the input object, with the attribute set."""
+    with_attribute = getattr(obj, "with_attribute", None)
+    if with_attribute is not None:
+        return with_attribute(_key, _value)  # -- ie: a CSV record, which may have no `__dict__`
     new_obj = copy(obj)
     setattr(new_obj, _key, _value)
     return new_obj
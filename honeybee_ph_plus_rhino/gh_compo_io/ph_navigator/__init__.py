@@ -12,6 +12,9 @@ from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1 import (
     GHCompo_PHNavV1GetApertures,
     GHCompo_PHNavV1GetConstructions,
     GHCompo_PHNavV1GetTable,
+    GHCompo_PHNavV1GetSnapshot,
     GHCompo_PHNavV1GetVersions,
+    GHCompo_PHNavV1LoadBundle,
     GHCompo_PHNavV1OrganizeTable,
+    GHCompo_PHNavV1SaveBundle,
 )
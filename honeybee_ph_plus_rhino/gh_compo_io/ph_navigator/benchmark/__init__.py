@@ -0,0 +1 @@
+"""Synthetic element tables, and timing benchmarks for the PH-Navigator V1 components."""
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Time PH-Nav Organize Table (compiled column resolvers) against the per-cell `_resolve` path it replaced.
+
+Run from the repository root (CPython, with the plugin's packages installed):
+
+    python -m honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.benchmark.run_organize_benchmarks [options]
+
+Options:
+    * --rows (int): The number of rows in each table. Default=5000
+    * --repeat (int): The number of times each solve is timed (the fastest is reported). Default=3
+
+For each mapped table (rooms, thermal_bridges, ventilators, pumps, fans, hot-water
+heaters / tanks and appliances) synthetic `TableRecord` rows are built, as Get Table
+emits them: most mapped fields as built-in columns, some only in `custom_values`,
+the single-selects as `{"id", "label"}`, some values unset, plus a few columns no
+port maps. Each table is then organized:
+
+    * per cell: the `_resolve` path from before the compiled specs (kept below, as
+      the reference);
+    * compiled, cold: `compile_spec` + `resolve`, with the compiled-spec cache cleared;
+    * compiled, warm: a re-solve with the same `field_defs` (the compiled spec is reused).
+
+The script exits with code 1 if the outputs (ports and report) of the compiled
+path differ from the reference, for any table or for the passthrough table.
+"""
+
+import argparse
+import functools
+import random
+import sys
+import timeit
+
+from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1 import table_organize
+from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.table_schema import FieldDef, TableRecord
+
+TABLES = (
+    "rooms",
+    "thermal_bridges",
+    "ventilators",
+    "pumps",
+    "fans",
+    "hot_water_heaters",
+    "hot_water_tanks",
+    "appliances",
+)
+
+# -- Columns in every row which no port maps (so the report has something to list)
+UNMAPPED_COLUMNS = ("notes", "created_by")
+UNMAPPED_CUSTOM_VALUES = ("custom_tag",)
+
+
+class Messages:
+    """Records the messages the component would add to the GH component."""
+
+    def __init__(self):
+        self.errors: list[str] = []
+        self.warnings: list[str] = []
+
+    def error(self, _message):
+        self.errors.append(_message)
+
+    def warning(self, _message):
+        self.warnings.append(_message)
+
+
+def make_table(_table: str, _num_rows: int, _seed: int = 1) -> tuple[list[TableRecord], list[FieldDef]]:
+    """Return synthetic `records` + `field_defs` for one table, as Get Table emits them."""
+    rnd = random.Random(_seed)
+    ports = table_organize.OUTPUT_SPECS.get(_table, [])
+    field_defs = [
+        FieldDef({"field_key": key, "display_name": key.replace("_", " ").title(), "origin": "built_in"})
+        for key in [p.field_key for p in ports] + list(UNMAPPED_COLUMNS)
+    ]
+    field_defs += [
+        FieldDef({"field_key": key, "display_name": key, "origin": "custom"}) for key in UNMAPPED_CUSTOM_VALUES
+    ]
+
+    records = []
+    for i in range(_num_rows):
+        row = {"id": i, "custom_values": {}, "custom_links": {}}
+        for j, port in enumerate(ports):
+            if "single-select" in port.description:
+                value = {"id": f"opt{i % 3}", "label": f"Option {i % 3}"}
+            elif port.description.startswith("(str)"):
+                value = f"{port.field_key} {i}"
+            else:
+                value = rnd.uniform(0, 100)
+            if rnd.random() < 0.05:
+                value = None  # -- Unset
+            if j % 4 == 3:
+                row["custom_values"][port.field_key] = value  # -- Only in the custom values
+            else:
+                row[port.field_key] = value
+        for key in UNMAPPED_COLUMNS:
+            row[key] = f"{key} {i}"
+        for key in UNMAPPED_CUSTOM_VALUES:
+            row["custom_values"][key] = i
+        records.append(TableRecord(row))
+    return records, field_defs
+
+
+# -----------------------------------------------------------------------------
+# -- The per-cell path from before the compiled specs: the reference output and timing.
+
+
+def _flatten_option(_value):
+    if isinstance(_value, dict) and "id" in _value and "label" in _value:
+        return _value.get("label")
+    return _value
+
+
+def _resolve(_record, _field_key):
+    if _field_key in _record:
+        return _flatten_option(_record[_field_key])
+    custom_values = _record.get("custom_values") or {}
+    return _flatten_option(custom_values.get(_field_key))
+
+
+def _present_field_keys(_records):
+    structural = ("id", "custom_values", "custom_links")
+    seen = set()
+    keys = []
+    for record in _records:
+        for key in list(record.keys()) + list((record.get("custom_values") or {}).keys()):
+            if key in structural or key in seen:
+                continue
+            seen.add(key)
+            keys.append(key)
+    return keys
+
+
+def _report(_records, _field_defs, _spec, _result):
+    notes = [f"{len(_records)} record(s), {len(_spec)} output port(s)."]
+    empty_ports = [port.name for port in _spec if all(value is None for value in _result[port.name])]
+    if _records and empty_ports:
+        notes.append("Ports with no data (field unset or missing server-side): " + ", ".join(empty_ports))
+
+    mapped_keys = {port.field_key for port in _spec}
+    unmapped = [key for key in _present_field_keys(_records) if key not in mapped_keys]
+    if unmapped:
+        display_names = {f.get("field_key"): f.get("display_name") or f.get("field_key") for f in _field_defs}
+        pretty = [f"{display_names.get(key, key)} ({key})" for key in unmapped]
+        notes.append("Downloaded columns not mapped to an output port: " + ", ".join(pretty))
+
+    notes.append("Values are raw SI (units in each port's description); convert downstream as needed.")
+    return notes
+
+
+def organize_per_cell(_records: list, _field_defs: list, _table: str) -> dict[str, list]:
+    """Organize Table's output, resolving each cell with `_resolve` (the path before the compiled specs)."""
+    spec = table_organize.OUTPUT_SPECS[_table]
+    result = {port.name: [_resolve(r, port.field_key) for r in _records] for port in spec}
+    result[table_organize.REPORT_PORT_NAME] = _report(_records, _field_defs, spec, result)
+    return result
+
+
+# -----------------------------------------------------------------------------
+
+
+def organize(_records: list, _field_defs: list, _table: str) -> dict[str, list]:
+    """Organize Table's output, through the component (compiled column resolvers)."""
+    component = table_organize.GHCompo_PHNavV1OrganizeTable(Messages(), _records, _field_defs, _table)
+    return component.run()
+
+
+def organize_cold(_records: list, _field_defs: list, _table: str) -> dict[str, list]:
+    """As `organize`, with the compiled-spec cache cleared first (as in the first solve of a session)."""
+    table_organize._COMPILED_SPECS.clear()
+    return organize(_records, _field_defs, _table)
+
+
+def check_passthrough(_num_rows: int) -> list[str]:
+    """Return a message if the passthrough table (no organize mapping) does not pass its records through."""
+    records, field_defs = make_table(table_organize.PASSTHROUGH_TABLES[0], _num_rows)
+    component = table_organize.GHCompo_PHNavV1OrganizeTable(
+        Messages(), records, field_defs, table_organize.PASSTHROUGH_TABLES[0]
+    )
+    result = component.run()
+    expected = {
+        table_organize.PASSTHROUGH_PORT.name: records,
+        table_organize.REPORT_PORT_NAME: _report(records, field_defs, [], {}),
+    }
+    if result != expected:
+        return ["passthrough: the records / report differ from the reference"]
+    return []
+
+
+def resolve_arguments(_args: list[str]) -> argparse.Namespace:
+    """Get all the script arguments."""
+    parser = argparse.ArgumentParser(description="Time PH-Nav Organize Table against the per-cell path.")
+    parser.add_argument("--rows", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args(_args)
+
+
+if __name__ == "__main__":
+    args = resolve_arguments(sys.argv[1:])
+    failures: list[str] = check_passthrough(100)
+    totals = {"per cell": 0.0, "compiled, cold": 0.0, "compiled, warm": 0.0}
+
+    print(f"PH-Nav Organize Table: {args.rows:,} rows / table (fastest of {args.repeat})")
+    print(f"  {'table':<18} {'per cell':>10} {'cold':>10} {'warm':>10}")
+    for table in TABLES:
+        records, field_defs = make_table(table, args.rows)
+        if organize_cold(records, field_defs, table) != organize_per_cell(records, field_defs, table):
+            failures.append(f"{table}: the compiled output differs from the per-cell output")
+
+        times = {}
+        for name, func in (
+            ("per cell", organize_per_cell),
+            ("compiled, cold", organize_cold),
+            ("compiled, warm", organize),
+        ):
+            times[name] = min(
+                timeit.repeat(functools.partial(func, records, field_defs, table), number=1, repeat=args.repeat)
+            )
+            totals[name] += times[name]
+        print(
+            f"  {table:<18} {times['per cell']:>8.3f} s {times['compiled, cold']:>8.3f} s "
+            f"{times['compiled, warm']:>8.3f} s"
+        )
+    print(
+        f"  {'total':<18} {totals['per cell']:>8.3f} s {totals['compiled, cold']:>8.3f} s "
+        f"{totals['compiled, warm']:>8.3f} s"
+    )
+
+    if failures:
+        print("FAILED:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("The compiled outputs match the per-cell outputs.")
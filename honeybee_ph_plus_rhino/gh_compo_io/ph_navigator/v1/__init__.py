@@ -17,3 +17,12 @@ from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.table_get import (
 from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.table_organize import (
     GHCompo_PHNavV1OrganizeTable,
 )
+from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.snapshot_get import (
+    GHCompo_PHNavV1GetSnapshot,
+)
+from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.bundle_save import (
+    GHCompo_PHNavV1SaveBundle,
+)
+from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.bundle_load import (
+    GHCompo_PHNavV1LoadBundle,
+)
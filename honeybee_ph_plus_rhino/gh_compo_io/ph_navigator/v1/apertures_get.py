@@ -3,10 +3,8 @@
 
 """GHCompo Interface: HBPH+ - PH-Nav Get Apertures."""
 
-import json
-
 try:
-    from typing import Any  # noqa: F401
+    from typing import Any, Iterable  # noqa: F401
 except ImportError:
     pass  # IronPython 2.7
 
@@ -24,20 +22,26 @@ try:
     from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.window_types_schema import ApertureTypeData
 
     # -- The build pipeline transforms schema objects -> HBPH objects (it never parses
-    # -- raw dicts), so it does not diverge between V0/V1 and the frozen V0 helpers are
-    # -- reused directly on our (duck-type-identical) V1 schema objects.
+    # -- raw dicts), so it does not diverge between V0/V1: the frozen V0 helpers are
+    # -- reused directly on our (duck-type-identical) V1 schema objects, except where
+    # -- `v1/window_builders.py` interns the glazings / frame-elements / U-w values.
     from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v0.window_types_get import (
-        create_hbph_glazing_types,
-        create_new_hbph_frame_elements,
         create_new_hbph_frames,
         create_hbph_window_unit_types,
+    )
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.window_builders import (
+        WindowTypeInterner,
+        create_hbph_glazing_types,
+        create_new_hbph_frame_elements,
         create_hbph_ep_constructions,
     )
 except ImportError as e:
     raise ImportError("\nFailed to import from honeybee_ph_plus_rhino {}".format(e))
 
 try:
-    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.client import PHNavV1Client
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.client import PHNavSnapshotClient, PHNavV1Client
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.json_stream import JSONPreview
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.snapshot import PHNavSnapshot
 except ImportError as e:
     raise ImportError("\nFailed to import PHNavV1Client. {}".format(e))
 
@@ -49,7 +53,9 @@ class GHCompo_PHNavV1GetApertures(object):
     denormalized grid per aperture type (`{ "<type name>": {...} }`); this component
     parses each into an `ApertureTypeData` and runs the shared build pipeline to emit
     two collections: `WindowUnitType`s (geometry) and `WindowConstruction`s (with rich
-    `ph_frame` / `ph_glazing` props, U-value via ISO 10077-1).
+    `ph_frame` / `ph_glazing` props, U-value via ISO 10077-1). The payload is
+    streamed: each grid is decoded and parsed in turn, so only the parsed
+    `ApertureTypeData`s (not the raw dicts) are held for the whole project.
 
     Route 4 (`GET /aperture-constructions/hbjson`) also exists, but only carries the
     minimal `EnergyWindowMaterialSimpleGlazSys` subset - strictly poorer than the
@@ -59,21 +65,32 @@ class GHCompo_PHNavV1GetApertures(object):
     All transport / parse / envelope / error handling (including 409
     `duplicate_aperture_type_names`) lives in `PHNavV1Client`; a failure there returns
     `None` after logging via `IGH.error`.
+
+    With a `_snapshot` (from `PH-Nav Get Snapshot`) the route is read from the
+    snapshot through a `PHNavSnapshotClient` instead, with no network call.
     """
 
-    def __init__(self, _IGH, _project_number, _version, _url_base, _token, _download, *args, **kwargs):
-        # type: (gh_io.IGH, str, str | None, str | None, str | None, bool, *Any, **Any) -> None
+    def __init__(self, _IGH, _project_number, _version, _url_base, _token, _download, _snapshot=None, *args, **kwargs):
+        # type: (gh_io.IGH, str, str | None, str | None, str | None, bool, PHNavSnapshot | None, *Any, **Any) -> None
         self.IGH = _IGH
         self.project_number = _project_number
         self.version = _version
         self.url_base = _url_base
         self.token = _token
         self.download = _download
+        self.snapshot = _snapshot
 
     @property
     def ready(self):
         # type: () -> bool
-        return bool(self.download and self.project_number)
+        return bool(self.snapshot or (self.download and self.project_number))
+
+    def _client(self):
+        # type: () -> PHNavV1Client
+        """A client for the `_snapshot` (no network calls) if one is given, else for the live API."""
+        if self.snapshot is not None:
+            return PHNavSnapshotClient(self.IGH, self.snapshot)
+        return PHNavV1Client(self.IGH, self.project_number, self.url_base, self.token, self.version)
 
     def run(self):
         # type: () -> tuple[CustomCollection | None, CustomCollection | None, str | None, str | None]
@@ -81,27 +98,35 @@ class GHCompo_PHNavV1GetApertures(object):
         if not self.ready:
             return None, None, None, None
 
-        client = PHNavV1Client(self.IGH, self.project_number, self.url_base, self.token, self.version)
-        aperture_types_raw = client.get_aperture_types()
-        if aperture_types_raw is None:
+        client = self._client()
+        aperture_type_items = client.iter_aperture_types()
+        if aperture_type_items is None:
             # -- The client already surfaced the failure via IGH.error.
             return None, None, None, None
 
-        # -- Build the debug preview BEFORE parsing, so a malformed payload can still
-        # -- be inspected on the canvas (the case the preview exists to diagnose).
-        json_preview = json.dumps(aperture_types_raw, indent=2, ensure_ascii=False)
+        # -- Each grid is added to the debug preview BEFORE it is parsed, so a malformed
+        # -- payload can still be inspected on the canvas (the case the preview exists to diagnose).
+        json_preview = JSONPreview()
+        try:
+            aperture_types = self._parse_aperture_types(aperture_type_items, json_preview)
+        except ValueError as e:
+            self.IGH.error("Failed to parse the PH-Navigator response as JSON:\n{}".format(e))
+            return None, None, json_preview.text(), client.last_modified
 
-        aperture_types = self._parse_aperture_types(aperture_types_raw)
         window_unit_types = CustomCollection.from_dict(create_hbph_window_unit_types(self.IGH, aperture_types))
         window_constructions = self._build_window_constructions(aperture_types)
 
-        return window_unit_types, window_constructions, json_preview, client.last_modified
+        return window_unit_types, window_constructions, json_preview.text(), client.last_modified
+
+    def _parse_aperture_types(self, _items, _json_preview):
+        # type: (Iterable[tuple[str, dict]], JSONPreview) -> list[ApertureTypeData]
+        """Parse each raw aperture-type dict into an `ApertureTypeData` (skip + warn on failure).
 
-    def _parse_aperture_types(self, _raw):
-        # type: (dict[str, dict]) -> list[ApertureTypeData]
-        """Parse each raw aperture-type dict into an `ApertureTypeData` (skip + warn on failure)."""
+        A malformed JSON entry raises `ValueError` as it is decoded from the stream.
+        """
         aperture_types = []
-        for data in _raw.values():
+        for name, data in _items:
+            _json_preview.add(name, data)
             try:
                 aperture_types.append(ApertureTypeData.from_dict(data))
             except Exception as e:
@@ -110,8 +135,14 @@ class GHCompo_PHNavV1GetApertures(object):
 
     def _build_window_constructions(self, _aperture_types):
         # type: (list[ApertureTypeData]) -> CustomCollection
-        """Build the `WindowConstruction` collection (glazings -> frames -> constructions)."""
-        glazing_types = create_hbph_glazing_types(_aperture_types)
-        frame_elements = create_new_hbph_frame_elements(_aperture_types)
+        """Build the `WindowConstruction` collection (glazings -> frames -> constructions).
+
+        Each unique glazing / frame-element definition is built, and each unique
+        window U-w calculated, only once (see `WindowTypeInterner`).
+        """
+        interner = WindowTypeInterner()
+        glazing_types = create_hbph_glazing_types(_aperture_types, interner)
+        frame_elements = create_new_hbph_frame_elements(_aperture_types, interner)
         frame_types = create_new_hbph_frames(_aperture_types, frame_elements)
-        return CustomCollection.from_dict(create_hbph_ep_constructions(_aperture_types, glazing_types, frame_types))
+        constructions = create_hbph_ep_constructions(_aperture_types, glazing_types, frame_types, interner)
+        return CustomCollection.from_dict(constructions)
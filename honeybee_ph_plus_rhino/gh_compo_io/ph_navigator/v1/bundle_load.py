@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""GHCompo Interface: HBPH+ - PH-Nav Load Bundle."""
+
+import os
+
+try:
+    from typing import Any  # noqa: F401
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError("\nFailed to import ph_gh_component_io. {}".format(e))
+
+try:
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.snapshot import PHNavSnapshot
+except ImportError as e:
+    raise ImportError("\nFailed to import from honeybee_ph_plus_rhino {}".format(e))
+
+
+class GHCompo_PHNavV1LoadBundle(object):
+    """Load a PH-Navigator snapshot from a bundle file saved by `PH-Nav Save Bundle`.
+
+    The loaded `snapshot_` has the same outputs as `PH-Nav Get Snapshot`: wire it to
+    the `_snapshot` input of the other `PH-Nav Get ...` components, which then read
+    their route from it with no network access at all.
+
+    The last loaded bundle per file is kept for the Rhino session, and is only read
+    again if the file has changed (modified-time or size).
+    """
+
+    # -- {absolute file path: ((mtime, size), snapshot)}
+    loaded = {}  # type: dict[str, tuple[tuple[float, int], PHNavSnapshot]]
+
+    def __init__(self, _IGH, _file_path, *args, **kwargs):
+        # type: (gh_io.IGH, str | None, *Any, **Any) -> None
+        self.IGH = _IGH
+        self.file_path = _file_path
+
+    @property
+    def ready(self):
+        # type: () -> bool
+        return bool(self.file_path)
+
+    def _load(self, _file_path):
+        # type: (str) -> PHNavSnapshot
+        file_path = os.path.abspath(_file_path)
+        stat = os.stat(file_path)
+        file_stamp = (stat.st_mtime, stat.st_size)
+
+        entry = self.loaded.get(file_path)
+        if entry is not None and entry[0] == file_stamp:
+            return entry[1]
+
+        snapshot = PHNavSnapshot.load_bundle(file_path)
+        self.loaded[file_path] = (file_stamp, snapshot)
+        return snapshot
+
+    def run(self):
+        # type: () -> tuple[PHNavSnapshot | None, list[str], str | None, str | None]
+        """Load the bundle file into a snapshot."""
+        if not self.ready:
+            return None, [], None, None
+
+        try:
+            snapshot = self._load(self.file_path)
+        except (IOError, OSError, EOFError, ValueError) as e:
+            self.IGH.error("Failed to load the PH-Navigator bundle '{}':\n{}".format(self.file_path, e))
+            return None, [], None, None
+
+        return snapshot, snapshot.routes, snapshot.version_id, snapshot.last_modified
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""GHCompo Interface: HBPH+ - PH-Nav Save Bundle."""
+
+try:
+    from typing import Any  # noqa: F401
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError("\nFailed to import ph_gh_component_io. {}".format(e))
+
+try:
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.snapshot import PHNavSnapshot
+except ImportError as e:
+    raise ImportError("\nFailed to import from honeybee_ph_plus_rhino {}".format(e))
+
+
+class GHCompo_PHNavV1SaveBundle(object):
+    """Save a PH-Navigator snapshot to a single compressed bundle file, for offline use.
+
+    The bundle holds every route envelope in the snapshot, all at the snapshot's
+    `version_id`. Load it again with `PH-Nav Load Bundle` (no network access needed).
+    With no `_file_path` the bundle is saved to `PHNavSnapshot.default_bundle_path()`.
+    """
+
+    def __init__(self, _IGH, _snapshot, _file_path, _save, *args, **kwargs):
+        # type: (gh_io.IGH, PHNavSnapshot | None, str | None, bool, *Any, **Any) -> None
+        self.IGH = _IGH
+        self.snapshot = _snapshot
+        self.file_path = _file_path
+        self.save = _save
+
+    @property
+    def ready(self):
+        # type: () -> bool
+        return bool(self.save and self.snapshot)
+
+    def run(self):
+        # type: () -> str | None
+        """Write the bundle file. Returns its path (None if not saved)."""
+        if not self.ready:
+            return None
+
+        try:
+            file_path = self.snapshot.save_bundle(self.file_path)
+        except (IOError, OSError) as e:
+            self.IGH.error("Failed to save the PH-Navigator bundle:\n{}".format(e))
+            return None
+
+        self.IGH.remark(
+            "Saved {} route(s) at version '{}' to: {}".format(
+                len(self.snapshot.routes), self.snapshot.version_id, file_path
+            )
+        )
+        return file_path
@@ -8,10 +8,11 @@ so that TLS setup, header/auth config, JSON parsing, envelope validation, and
 HTTP-error surfacing live in a single place instead of being copy-pasted into
 each component (as they were in V0).
 
-Runtime target is Rhino/Grasshopper's IronPython 2.7 - transport is `System.Net`
-only. The client never lets a raw `WebException` reach the canvas: on any failure
-it logs a readable message via `IGH.error` and returns `None` / empty so the
-downstream component can bail friendly.
+Runtime target is Rhino/Grasshopper's IronPython 2.7 - the default transport
+(`transport.DotNetTransport`) is `System.Net.Http`, with one shared keep-alive,
+decompressing `HttpClient`. The client never lets a raw transport exception reach
+the canvas: on any failure it logs a readable message via `IGH.error` and returns
+`None` / empty so the downstream component can bail friendly.
 
 The API uses a single, uniform response envelope on every route::
 
@@ -24,40 +25,115 @@ The API uses a single, uniform response envelope on every route::
 `last_modified` for the caller to read back (change-detection keys on
 `version_id` / `last_modified`, NEVER on payload bytes), and returns the full
 envelope. The per-route convenience methods return just that route's payload.
+The large dict-payload routes (constructions, aperture types) can also be read
+with `iter_*()` methods, which decode the envelope fields first and then the
+payload one item at a time (`json_stream.StreamedEnvelope`), so the caller can
+build each object as it is decoded instead of holding every raw dict at once.
+
+Responses are cached on disk (`PHNavResponseCache`), keyed by server, project,
+route, pinned version and query. A pinned saved-version is immutable, so a cached
+pinned response is served with no network call at all. An unpinned response is
+revalidated with a conditional GET (`If-None-Match` / `If-Modified-Since`, from the
+cached response's `ETag` / `Last-Modified`): a `304 Not Modified` reuses the cached
+body, so a stable project costs one round-trip per route. If the server sent no
+validators, the cached response is used only while the project's latest
+`version_id` / `last_modified` (read from the small route-1 versions envelope, once
+per client) still match the cached envelope's.
 """
 
 import json
+import threading
 
 try:
-    from typing import Any  # noqa: F401
+    from typing import Any, Iterator  # noqa: F401
 except ImportError:
     pass  # IronPython 2.7
 
 try:
-    import System.IO  # type: ignore
-    import System.Net  # type: ignore
+    from Queue import Empty, Queue  # type: ignore
 except ImportError:
-    pass  # Outside Rhino
+    from queue import Empty, Queue  # Python 3
 
 try:
     from ph_gh_component_io import gh_io
 except ImportError as e:
     raise ImportError("\nFailed to import ph_gh_component_io. {}".format(e))
 
+try:
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.response_cache import PHNavResponseCache
+except ImportError as e:
+    raise ImportError("\nFailed to import PHNavResponseCache. {}".format(e))
+
+try:
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.json_stream import StreamedEnvelope, iter_payload_items
+except ImportError as e:
+    raise ImportError("\nFailed to import the PH-Navigator JSON stream decoder. {}".format(e))
+
+try:
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.transport import (
+        DotNetTransport,
+        HTTPResponse,
+        PHNavTransportError,
+    )
+except ImportError as e:
+    raise ImportError("\nFailed to import the PH-Navigator transport. {}".format(e))
+
+try:
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.snapshot import (
+        CONSTRUCTIONS_QUERY,
+        SNAPSHOT_ROUTE_NAMES,
+        SNAPSHOT_ROUTES,
+        PHNavSnapshot,
+    )
+except ImportError as e:
+    raise ImportError("\nFailed to import PHNavSnapshot. {}".format(e))
+
+
+class _MessageLog(object):
+    """Stands in for `IGH` on a worker thread: records the messages to replay later.
+
+    Only the main (canvas) thread may add messages to the GH component.
+    """
+
+    def __init__(self):
+        self.messages = []  # type: list[tuple[str, str]]
+
+    def error(self, _message):
+        # type: (str) -> None
+        self.messages.append(("error", _message))
+
+    def warning(self, _message):
+        # type: (str) -> None
+        self.messages.append(("warning", _message))
+
+    def replay(self, _IGH):
+        # type: (gh_io.IGH) -> None
+        for level, message in self.messages:
+            getattr(_IGH, level)(message)
+
 
 class PHNavV1Client(object):
     """Transport + envelope handling for the PH-Navigator V1 read API."""
 
     EXPECTED_SCHEMA_VERSION = 1
     DEFAULT_BASE = "https://api.ph-nav.com/api/v1/gh"
+    # -- The envelope fields read by `_validate_envelope`: a streamed envelope reads these up front.
+    ENVELOPE_KEYS = ("schema_version", "project", "version_id", "last_modified", "warnings")
 
-    def __init__(self, _IGH, _bt_number, _url_base=None, _token=None, _version=None):
-        # type: (gh_io.IGH, str, str | None, str | None, str | None) -> None
+    def __init__(self, _IGH, _bt_number, _url_base=None, _token=None, _version=None, _use_cache=True, _transport=None):
+        # type: (gh_io.IGH, str, str | None, str | None, str | None, bool, Any) -> None
         self.IGH = _IGH
         self.bt_number = _bt_number
         self.url_base = _url_base or self.DEFAULT_BASE
         self.token = _token
         self.version = _version
+        self.cache = PHNavResponseCache() if _use_cache else None  # type: PHNavResponseCache | None
+        # -- Anything with a `get(url, headers) -> HTTPResponse` method (see `transport.py`)
+        self.transport = _transport or DotNetTransport()
+
+        # -- The project's latest (version_id, last_modified), fetched at most once
+        # -- per client to revalidate cached unpinned responses.
+        self._latest_stamp = None  # type: tuple[str | None, str | None] | None
 
         # -- Envelope metadata from the most recent successful `get()`. Components
         # -- read these back to surface project info + version freshness.
@@ -68,34 +144,138 @@ class PHNavV1Client(object):
     # -------------------------------------------------------------------------
     # -- Core request
 
-    def get(self, _path="", _pin_version=True, _query=None):
-        # type: (str, bool, dict | None) -> dict | None
+    def get(self, _path="", _pin_version=True, _query=None, _decode=json.loads):
+        # type: (str, bool, dict | None, Any) -> dict | None
         """GET one route, parse once, validate the envelope.
 
-        Returns the full envelope dict on success. On any transport / HTTP /
-        parse / schema error, logs via `IGH.error` and returns `None`.
+        Returns the full envelope dict on success (from the cache when it is still
+        current). On any transport / HTTP / parse / schema error, logs via
+        `IGH.error` and returns `None`. `_decode` turns the response body into the
+        envelope dict (ie: a `StreamedEnvelope` to leave the payload un-decoded).
         """
         url = self._project_url(_path, _pin_version, _query)
-        self._force_tls_12(url)
+        pinned = bool(_pin_version and self.version)
+
+        cache_key = self._cache_key(_path, _pin_version, _query)
+        meta = self.cache.load_meta(cache_key) if cache_key is not None else None  # type: dict | None
+
+        # -- Without HTTP validators (ETag / Last-Modified) to send, fall back to
+        # -- comparing the cached envelope against the project's latest version stamp.
+        if meta is not None and (pinned or not self._has_validators(meta)):
+            if not pinned and self._get_latest_stamp() is None:
+                return None  # -- The probe already surfaced the failure via IGH.error.
+            if pinned or self._latest_stamp == (meta.get("version_id"), meta.get("last_modified")):
+                envelope = self._load_cached_envelope(cache_key, _decode)
+                if envelope is not None:
+                    return envelope
+            meta = None
+
+        response = self._download(url, meta)
+        if response is not None and response.status == 304:
+            envelope = self._load_cached_envelope(cache_key, _decode)
+            if envelope is not None:
+                return envelope
+            # -- The cached body has gone missing since its meta was read: download in full.
+            response = self._download(url)
+        if response is None:
+            return None
 
         try:
-            response = self._client().DownloadString(url)
-        except System.Net.WebException as e:
-            self.IGH.error(self._format_http_error(e))
-            return None
+            envelope = _decode(response.body)  # type: dict
         except Exception as e:
-            self.IGH.error("PH-Navigator request failed:\n{}".format(e))
+            self.IGH.error("Failed to parse the PH-Navigator response as JSON:\n{}".format(e))
+            return None
+
+        if not self._validate_envelope(envelope):
             return None
 
+        if cache_key is not None:
+            self.cache.save(
+                cache_key,
+                response.body,
+                {
+                    "url": url,
+                    "version_id": self.version_id,
+                    "last_modified": self.last_modified,
+                    "etag": response.etag,
+                    "http_last_modified": response.http_last_modified,
+                },
+            )
+        return envelope
+
+    def _download(self, _url, _validators=None):
+        # type: (str, dict | None) -> HTTPResponse | None
+        """GET the URL, as a conditional request if cached validators are given.
+
+        `_validators` is a cache meta dict: its `etag` / `http_last_modified` are sent
+        as `If-None-Match` / `If-Modified-Since`. Returns an `HTTPResponse` with status
+        200 (and the body), or 304 (no body: the cached copy is still current). On any
+        error, logs via `IGH.error` and returns `None`.
+        """
         try:
-            envelope = json.loads(response)  # type: dict
+            response = self.transport.get(_url, self._request_headers(_validators))
+        except PHNavTransportError as e:
+            # -- No HTTP response at all (DNS failure, connection refused, timeout, ...)
+            self.IGH.error("Could not reach the PH-Navigator server at:\n{}\n{}".format(self.url_base, e))
+            return None
         except Exception as e:
-            self.IGH.error("Failed to parse the PH-Navigator response as JSON:\n{}".format(e))
+            self.IGH.error("PH-Navigator request failed:\n{}".format(e))
             return None
 
-        if not self._validate_envelope(envelope):
+        if response.status >= 400:
+            self.IGH.error(self._format_http_error(response.status, response.body))
+            return None
+        return response
+
+    @staticmethod
+    def _has_validators(_meta):
+        # type: (dict) -> bool
+        """Return True if the cache meta has an `ETag` / `Last-Modified` to revalidate with."""
+        return bool(_meta.get("etag") or _meta.get("http_last_modified"))
+
+    # -------------------------------------------------------------------------
+    # -- Response cache
+
+    def _cache_key(self, _path, _pin_version=True, _query=None):
+        # type: (str, bool, dict | None) -> str | None
+        """Return the route's response-cache key, or None if it is not cached.
+
+        Route 1 (the versions list) is never cached: it is the revalidation probe.
+        """
+        if self.cache is None or not _path:
+            return None
+        version = self.version if (_pin_version and self.version) else None
+        return self.cache.key(self.url_base, self.bt_number, _path, version, _query, self.token)
+
+    def _get_latest_stamp(self):
+        # type: () -> tuple[str | None, str | None] | None
+        """Return the project's latest `(version_id, last_modified)`, or `None` on failure.
+
+        Read from the unpinned route-1 envelope (a small versions list), once per client.
+        """
+        if self._latest_stamp is None:
+            if self.get("", _pin_version=False) is not None:
+                self._latest_stamp = (self.version_id, self.last_modified)
+        return self._latest_stamp
+
+    def _load_cached_envelope(self, _cache_key, _decode=json.loads):
+        # type: (str, Any) -> dict | None
+        """Return the cached envelope (validated), or `None` if it is missing or unusable."""
+        body = self.cache.load_body(_cache_key)
+        if body is None:
             return None
 
+        try:
+            envelope = _decode(body)  # type: dict
+        except Exception:
+            envelope = None
+
+        # -- A stale cache from an older plugin / schema is a silent miss, not an error.
+        if not isinstance(envelope, dict) or envelope.get("schema_version") != self.EXPECTED_SCHEMA_VERSION:
+            self.cache.remove(_cache_key)
+            return None
+
+        self._validate_envelope(envelope)
         return envelope
 
     # -------------------------------------------------------------------------
@@ -113,6 +293,36 @@ class PHNavV1Client(object):
             return None
         return envelope.get(_key, _default)
 
+    def _iter_payload(self, _path, _key, _query=None):
+        # type: (str, str, dict | None) -> Iterator[tuple[str, Any]] | None
+        """GET one route and return an iterator over its payload object's `(name, item)` entries.
+
+        The envelope is validated before this returns; the items are decoded one at a
+        time as the iterator is consumed, and a malformed item raises `ValueError` then.
+        Returns `None` on failure (logged via `IGH.error`).
+        """
+        envelope = self.get(
+            _path, _query=_query, _decode=lambda body: StreamedEnvelope(body, [_key], self.ENVELOPE_KEYS)
+        )
+        if envelope is None:
+            return None
+        return self._evict_on_error(iter_payload_items(envelope, _key), self._cache_key(_path, _query=_query))
+
+    def _evict_on_error(self, _items, _cache_key):
+        # type: (Iterator[tuple[str, Any]], str | None) -> Iterator[tuple[str, Any]]
+        """Pass the items through, but drop the cached response if one of them fails to decode.
+
+        A streamed body is cached before its payload is fully decoded, and a pinned
+        cached response is never re-downloaded, so a malformed one must not be kept.
+        """
+        try:
+            for item in _items:
+                yield item
+        except ValueError:
+            if _cache_key is not None:
+                self.cache.remove(_cache_key)
+            raise
+
     def get_versions(self):
         # type: () -> list | None
         """Route 1 - `GET /`: saved versions, newest first.
@@ -131,15 +341,23 @@ class PHNavV1Client(object):
         defaults + an envelope `warning` (surfaced automatically), instead of the
         whole export failing with 422. Missing `conductivity` still 422s.
         """
-        return self._payload(
-            "/constructions/hbjson", "hb_constructions", {}, _query={"on_missing_thermal": "user_defaults"}
-        )
+        return self._payload("/constructions/hbjson", "hb_constructions", {}, _query=CONSTRUCTIONS_QUERY)
+
+    def iter_constructions_hbjson(self):
+        # type: () -> Iterator[tuple[str, dict]] | None
+        """Route 2, streamed: the `(name, OpaqueConstruction.to_dict())` entries, decoded one at a time."""
+        return self._iter_payload("/constructions/hbjson", "hb_constructions", _query=CONSTRUCTIONS_QUERY)
 
     def get_aperture_types(self):
         # type: () -> dict | None
         """Route 3 - `GET /aperture-types`: `{ name: <denormalized window-type grid> }`."""
         return self._payload("/aperture-types", "aperture_types", {})
 
+    def iter_aperture_types(self):
+        # type: () -> Iterator[tuple[str, dict]] | None
+        """Route 3, streamed: the `(name, <window-type grid>)` entries, decoded one at a time."""
+        return self._iter_payload("/aperture-types", "aperture_types")
+
     def get_aperture_constructions(self):
         # type: () -> dict | None
         """Route 4 - `GET /aperture-constructions/hbjson`: `{ element_id: WindowConstruction.to_dict() }`."""
@@ -157,6 +375,106 @@ class PHNavV1Client(object):
             return None, None
         return envelope.get("records", []), envelope.get("field_defs", [])
 
+    # -------------------------------------------------------------------------
+    # -- Project snapshot
+
+    MAX_SNAPSHOT_WORKERS = 4
+
+    def get_snapshot(self, _route_names=None):
+        # type: (list[str] | None) -> PHNavSnapshot | None
+        """Download a set of routes concurrently, all pinned to the same saved version.
+
+        `_route_names` are `SNAPSHOT_ROUTE_NAMES` (ie: 'constructions', 'rooms'); all of
+        them if None. The version is the client's pinned `_version`, or else the
+        project's latest saved version (route 1), resolved ONCE up front so a save
+        landing mid-download cannot mix two versions. Returns `None` if any route fails
+        (each failure is logged via `IGH.error`).
+        """
+        route_names = list(_route_names or SNAPSHOT_ROUTE_NAMES)
+        unknown = [name for name in route_names if name not in SNAPSHOT_ROUTES]
+        if unknown:
+            self.IGH.error(
+                "Unknown snapshot route(s): {}. Valid names are:\n{}".format(
+                    ", ".join(unknown), "\n".join(SNAPSHOT_ROUTE_NAMES)
+                )
+            )
+            return None
+
+        version_id = self.version
+        if not version_id:
+            latest_stamp = self._get_latest_stamp()
+            if latest_stamp is None:
+                return None  # -- The probe already surfaced the failure via IGH.error.
+            version_id = latest_stamp[0]
+            if not version_id:
+                self.IGH.error("PH-Navigator did not report a version_id for project '{}'.".format(self.bt_number))
+                return None
+
+        results = self._fetch_concurrently(route_names, version_id)
+
+        envelopes = {}
+        for name, (envelope, log) in zip(route_names, results):
+            log.replay(self.IGH)
+            if envelope is None:
+                return None
+            if envelope.get("version_id") != version_id:
+                self.IGH.error(
+                    "PH-Navigator returned version '{}' for '{}', but the snapshot is pinned to '{}'.".format(
+                        envelope.get("version_id"), name, version_id
+                    )
+                )
+                return None
+            envelopes[SNAPSHOT_ROUTES[name][0]] = envelope
+
+        snapshot = PHNavSnapshot(self.url_base, self.bt_number, version_id, envelopes)
+        self.project = snapshot.project
+        self.version_id = version_id
+        self.last_modified = snapshot.last_modified
+        return snapshot
+
+    def _fetch_concurrently(self, _route_names, _version_id):
+        # type: (list[str], str) -> list[tuple[dict | None, _MessageLog]]
+        """GET each named route, pinned to the version, on a small pool of worker threads.
+
+        Each worker uses its own client (sharing this client's transport and cache),
+        since a client's envelope attributes are per-request state. Returns one
+        `(envelope | None, log)` per route name, in order.
+        """
+        results = [(None, _MessageLog()) for _ in _route_names]  # type: list[tuple[dict | None, _MessageLog]]
+        jobs = Queue()
+        for i, name in enumerate(_route_names):
+            jobs.put((i, name))
+
+        def worker():
+            while True:
+                try:
+                    i, name = jobs.get_nowait()
+                except Empty:
+                    return
+                log = _MessageLog()
+                try:
+                    path, query = SNAPSHOT_ROUTES[name]
+                    results[i] = (self._pinned_client(log, _version_id).get(path, _query=query), log)
+                except Exception as e:
+                    log.error("PH-Navigator request for '{}' failed:\n{}".format(name, e))
+                    results[i] = (None, log)
+
+        threads = [threading.Thread(target=worker) for _ in range(min(self.MAX_SNAPSHOT_WORKERS, len(_route_names)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def _pinned_client(self, _IGH, _version_id):
+        # type: (Any, str) -> PHNavV1Client
+        """A client for the same project, pinned to the version, sharing this client's transport + cache."""
+        client = PHNavV1Client(
+            _IGH, self.bt_number, self.url_base, self.token, _version_id, _use_cache=False, _transport=self.transport
+        )
+        client.cache = self.cache
+        return client
+
     # -------------------------------------------------------------------------
     # -- Transport helpers
 
@@ -177,26 +495,20 @@ class PHNavV1Client(object):
             url += "?" + "&".join("{}={}".format(k, params[k]) for k in sorted(params))
         return url
 
-    def _force_tls_12(self, _url):
-        # type: (str) -> None
-        """Force TLS 1.2 for https downloads; warn on legacy .NET that lacks it."""
-        try:
-            System.Net.ServicePointManager.SecurityProtocol = System.Net.SecurityProtocolType.Tls12
-        except AttributeError:
-            # -- TLS 1.2 is not provided by MacOS .NET in Rhino 5
-            if _url.lower().startswith("https"):
-                self.IGH.error("This system lacks the necessary security libraries to download over https.")
-
-    def _client(self):
-        # type: () -> System.Net.WebClient
-        """Build a configured `WebClient`: JSON headers + Bearer token only when set."""
-        client = System.Net.WebClient()
-        client.Headers.Add("Content-type", "application/json")
+    def _request_headers(self, _validators=None):
+        # type: (dict | None) -> dict
+        """Build the request headers: JSON Accept, plus the Bearer token and validators only when set."""
+        headers = {"Accept": "application/json"}
         # -- Send the auth header ONLY when a token is set. Anonymous read must
         # -- send no header at all (V0's `Bearer None` bug is deliberately gone).
         if self.token:
-            client.Headers.Add("Authorization", "Bearer {}".format(self.token))
-        return client
+            headers["Authorization"] = "Bearer {}".format(self.token)
+        if _validators:
+            if _validators.get("etag"):
+                headers["If-None-Match"] = _validators["etag"]
+            if _validators.get("http_last_modified"):
+                headers["If-Modified-Since"] = _validators["http_last_modified"]
+        return headers
 
     # -------------------------------------------------------------------------
     # -- Envelope + error handling
@@ -236,22 +548,14 @@ class PHNavV1Client(object):
                 message = "{}\n{}".format(message, detail)
             self.IGH.warning(message)
 
-    def _format_http_error(self, _web_exception):
-        # type: (System.Net.WebException) -> str
-        """Turn a `WebException` into a readable message using the status code + JSON body."""
-        response = _web_exception.Response
-        if response is None:
-            # -- No HTTP response at all (DNS failure, connection refused, timeout, ...)
-            return "Could not reach the PH-Navigator server at:\n{}\n{}".format(
-                self.url_base, _web_exception.Message
-            )
-
-        status = int(response.StatusCode)
-        body = self._read_error_body(response)
+    def _format_http_error(self, _status, _body):
+        # type: (int, str | None) -> str
+        """Turn an HTTP error response into a readable message using the status code + JSON body."""
+        body = self._parse_error_body(_body)
         message = body.get("message") or "(no message from server)"
-        hint = self._http_status_hint(status, body)
+        hint = self._http_status_hint(_status, body)
 
-        msg = "PH-Navigator request failed [HTTP {}]: {}".format(status, message)
+        msg = "PH-Navigator request failed [HTTP {}]: {}".format(_status, message)
         if hint:
             msg += "\n{}".format(hint)
         return msg
@@ -305,20 +609,44 @@ class PHNavV1Client(object):
             lines.append("{}: {}".format(key.replace("_", " "), shown))
         return "\n".join(lines)
 
-    def _read_error_body(self, _response):
-        # type: (System.Net.HttpWebResponse) -> dict
-        """Read and JSON-parse the error response body; empty dict on any failure."""
-        reader = None
-        try:
-            reader = System.IO.StreamReader(_response.GetResponseStream())
-            raw = reader.ReadToEnd()
-        except Exception:
-            return {}
-        finally:
-            # -- Always close the stream, even if the read above threw.
-            if reader is not None:
-                reader.Close()
+    def _parse_error_body(self, _body):
+        # type: (str | None) -> dict
+        """JSON-parse the error response body; empty dict on any failure."""
         try:
-            return json.loads(raw)
+            body = json.loads(_body)
         except Exception:
             return {}
+        return body if isinstance(body, dict) else {}
+
+
+class PHNavSnapshotClient(PHNavV1Client):
+    """A `PHNavV1Client` which serves every route from a `PHNavSnapshot` - no network calls.
+
+    Lets a `PH-Nav Get ...` component read its route from a snapshot with exactly the
+    same code path (per-route methods, envelope validation, warnings) as a live download.
+    """
+
+    def __init__(self, _IGH, _snapshot):
+        # type: (gh_io.IGH, PHNavSnapshot) -> None
+        super(PHNavSnapshotClient, self).__init__(
+            _IGH, _snapshot.bt_number, _snapshot.url_base, _version=_snapshot.version_id, _use_cache=False
+        )
+        self.snapshot = _snapshot
+
+    def get(self, _path="", _pin_version=True, _query=None, _decode=None):
+        # type: (str, bool, dict | None, Any) -> dict | None
+        """Return the snapshot's envelope for the route (validated), or `None` if it is not in the snapshot.
+
+        The snapshot's envelopes are already decoded, so `_decode` is ignored.
+        """
+        envelope = self.snapshot.envelope(_path)
+        if envelope is None:
+            self.IGH.error(
+                "The PH-Navigator snapshot does not include '{}'. Add it to the snapshot's "
+                "'_routes' (snapshot routes: {}).".format(_path, ", ".join(self.snapshot.routes))
+            )
+            return None
+
+        if not self._validate_envelope(envelope):
+            return None
+        return envelope
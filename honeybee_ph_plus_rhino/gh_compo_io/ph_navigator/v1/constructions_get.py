@@ -3,7 +3,9 @@
 
 """GHCompo Interface: HBPH+ - PH-Nav Get Constructions."""
 
+import hashlib
 import json
+from collections import namedtuple
 
 try:
     from typing import Any  # noqa: F401
@@ -26,11 +28,61 @@ except ImportError as e:
     raise ImportError("\nFailed to import from honeybee_ph_plus_rhino {}".format(e))
 
 try:
-    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.client import PHNavV1Client
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.client import PHNavSnapshotClient, PHNavV1Client
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.json_stream import JSONPreview
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.snapshot import PHNavSnapshot
 except ImportError as e:
     raise ImportError("\nFailed to import PHNavV1Client. {}".format(e))
 
 
+# -- One memoized assembly: the template construction, and its indented JSON for the preview.
+MemoEntry = namedtuple("MemoEntry", ["construction", "preview_json"])
+
+
+class OpaqueConstructionMemo(object):
+    """Built `OpaqueConstruction`s (+ their preview JSON), keyed by a content-hash of the assembly dict.
+
+    One memo is shared by every Get Constructions component for the Rhino session,
+    so an assembly whose dict is unchanged since an earlier solve (of any project
+    or version) is not rebuilt with `from_dict`. The memoized constructions are only
+    templates: each solve outputs a `duplicate()` of them, so a rename / edit /
+    `.properties` change downstream never reaches the memo, or another solve.
+    """
+
+    # -- Past this size, entries not used by the latest solve are dropped.
+    MAX_ENTRIES = 10000
+
+    def __init__(self):
+        self.entries = {}  # type: dict[str, MemoEntry]
+        self._used = set()  # type: set[str]
+
+    @staticmethod
+    def content_hash(_hb_construction_dict):
+        # type: (dict) -> str
+        """Return a hash of the dict's content (independent of its key order)."""
+        text = json.dumps(_hb_construction_dict, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def get(self, _key):
+        # type: (str) -> MemoEntry | None
+        self._used.add(_key)
+        return self.entries.get(_key)
+
+    def add(self, _key, _construction, _preview_json):
+        # type: (str, OpaqueConstruction, str) -> MemoEntry
+        """Memoize the construction (with its preview JSON) under the key."""
+        self._used.add(_key)
+        self.entries[_key] = MemoEntry(_construction, _preview_json)
+        return self.entries[_key]
+
+    def end_solve(self):
+        # type: () -> None
+        """Drop the entries the solve did not use, if the memo has grown too large."""
+        if len(self.entries) > self.MAX_ENTRIES:
+            self.entries = {k: v for k, v in self.entries.items() if k in self._used}
+        self._used = set()
+
+
 class GHCompo_PHNavV1GetConstructions(object):
     """Download a PH-Navigator project's opaque assemblies and rebuild `OpaqueConstruction`s.
 
@@ -39,25 +91,44 @@ class GHCompo_PHNavV1GetConstructions(object):
     single-encoded), so this is a dedicated build component rather than the generic
     Get Table. `from_dict` round-trips the rich PH props (PhColor, division grid,
     `honeybee_energy_ref` datasheet/photo refs, `ph_nav` external id) on its own.
+    The payload is streamed: each assembly is decoded, previewed and rebuilt in
+    turn, so the raw dicts for the whole project are never in memory at once.
+    Only new / changed assemblies are rebuilt: the rest are copied from the
+    session-wide `OpaqueConstructionMemo` (the counts are reported as a remark).
+    Every output construction is a new, unlocked object, owned by this solve.
 
     All transport / parse / envelope / error handling (including 409
     `duplicate_assembly_names`) lives in `PHNavV1Client`; a failure there returns
     `None` after logging via `IGH.error`.
+
+    With a `_snapshot` (from `PH-Nav Get Snapshot`) the route is read from the
+    snapshot through a `PHNavSnapshotClient` instead, with no network call.
     """
 
-    def __init__(self, _IGH, _project_number, _version, _url_base, _token, _download, *args, **kwargs):
-        # type: (gh_io.IGH, str, str | None, str | None, str | None, bool, *Any, **Any) -> None
+    # -- Shared by every instance: the module (and so the memo) lives for the whole Rhino session.
+    memo = OpaqueConstructionMemo()
+
+    def __init__(self, _IGH, _project_number, _version, _url_base, _token, _download, _snapshot=None, *args, **kwargs):
+        # type: (gh_io.IGH, str, str | None, str | None, str | None, bool, PHNavSnapshot | None, *Any, **Any) -> None
         self.IGH = _IGH
         self.project_number = _project_number
         self.version = _version
         self.url_base = _url_base
         self.token = _token
         self.download = _download
+        self.snapshot = _snapshot
 
     @property
     def ready(self):
         # type: () -> bool
-        return bool(self.download and self.project_number)
+        return bool(self.snapshot or (self.download and self.project_number))
+
+    def _client(self):
+        # type: () -> PHNavV1Client
+        """A client for the `_snapshot` (no network calls) if one is given, else for the live API."""
+        if self.snapshot is not None:
+            return PHNavSnapshotClient(self.IGH, self.snapshot)
+        return PHNavV1Client(self.IGH, self.project_number, self.url_base, self.token, self.version)
 
     def run(self):
         # type: () -> tuple[CustomCollection | None, str | None, str | None]
@@ -65,22 +136,40 @@ class GHCompo_PHNavV1GetConstructions(object):
         if not self.ready:
             return None, None, None
 
-        client = PHNavV1Client(self.IGH, self.project_number, self.url_base, self.token, self.version)
-        hb_constructions = client.get_constructions_hbjson()
-        if hb_constructions is None:
+        client = self._client()
+        hb_construction_items = client.iter_constructions_hbjson()
+        if hb_construction_items is None:
             # -- The client already surfaced the failure via IGH.error.
             return None, None, None
 
-        # -- Build the debug preview BEFORE the rebuild, so it is still emitted if
-        # -- from_dict raises on a malformed payload (the case it helps diagnose).
-        json_preview = json.dumps(hb_constructions, indent=2, ensure_ascii=False)
+        # -- Add each assembly to the debug preview BEFORE rebuilding it, so the preview
+        # -- is still emitted (up to and including the failing assembly) if from_dict
+        # -- raises on a malformed payload (the case it helps diagnose).
+        json_preview = JSONPreview()
 
         # -- Keyed by the server's assembly name, emitted as a CustomCollection to match
         # -- the Get Apertures constructions output (one consistent getter output type).
+        constructions = {}
+        num_reused, num_rebuilt = 0, 0
         try:
-            constructions = {name: OpaqueConstruction.from_dict(d) for name, d in hb_constructions.items()}
+            for name, d in hb_construction_items:
+                key = self.memo.content_hash(d)
+                entry = self.memo.get(key)
+                if entry is None:
+                    preview_json = json_preview.dumps(d)
+                    json_preview.add_json(name, preview_json)
+                    entry = self.memo.add(key, OpaqueConstruction.from_dict(d), preview_json)
+                    num_rebuilt += 1
+                else:
+                    json_preview.add_json(name, entry.preview_json)
+                    num_reused += 1
+                # -- A copy, so that no two solves share (and edit) the same construction
+                constructions[name] = entry.construction.duplicate()
         except Exception as e:
             self.IGH.error("Failed to rebuild Honeybee Constructions from the PH-Navigator data.\n{}".format(e))
-            return None, client.last_modified, json_preview
+            return None, client.last_modified, json_preview.text()
+        finally:
+            self.memo.end_solve()
 
-        return CustomCollection.from_dict(constructions), client.last_modified, json_preview
+        self.IGH.remark("Reused {} unchanged assemblies, rebuilt {} new / changed.".format(num_reused, num_rebuilt))
+        return CustomCollection.from_dict(constructions), client.last_modified, json_preview.text()
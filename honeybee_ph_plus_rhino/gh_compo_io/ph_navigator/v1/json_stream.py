@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Incremental decoding of large PH-Navigator V1 response envelopes.
+
+`json.loads` builds a route's whole payload as one nested dict before any of it
+can be used, so for a large route (ie: `/constructions/hbjson` on a big project)
+the raw dicts for EVERY item are alive at the same time as the objects built from
+them. `StreamedEnvelope` instead decodes only the small envelope fields up front
+(`schema_version`, `project`, `version_id`, ...) and leaves the payload object as
+text, to be decoded one entry at a time::
+
+    envelope = StreamedEnvelope(body, ["hb_constructions"], ENVELOPE_KEYS)
+    envelope.get("version_id")                                  # decoded up front
+    for name, d in envelope.iter_items("hb_constructions"):    # decoded one-by-one
+        ...
+
+Each value is decoded by the standard `json` decoder (`raw_decode`), so the items
+are exactly what `json.loads` would have returned.
+
+The envelope members are read in document order. Once all of the `_header_keys`
+have been read, reading stops at the payload: the rest of the body (anything
+after the payload) is only read, and checked, once `iter_items()` has walked the
+whole payload. If a header key comes AFTER the payload, the payload is first
+skipped over (bracket-matched, not decoded) to reach it.
+"""
+
+import json
+import re
+from json.decoder import scanstring
+
+try:
+    from typing import Any, Iterable, Iterator  # noqa: F401
+except ImportError:
+    pass  # IronPython 2.7
+
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# -- Skipping over an un-decoded object / array only needs its strings (which may
+# -- contain brackets) and its brackets.
+_SKIP_TOKENS = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]', re.DOTALL)
+
+
+def _skip_whitespace(_text, _idx):
+    # type: (str, int) -> int
+    return _WHITESPACE.match(_text, _idx).end()
+
+
+def _expect(_text, _idx, _char):
+    # type: (str, int, str) -> int
+    """Return the index past `_char`, which must be at `_idx`."""
+    if _text[_idx : _idx + 1] != _char:
+        raise ValueError("Expecting '{}' at char {}".format(_char, _idx))
+    return _idx + 1
+
+
+class _ObjectReader(object):
+    """Reads the members of one JSON object, one at a time, in document order.
+
+    Call `next_key()`, then exactly one of `read_value()` / `skip_value()`, until
+    `next_key()` returns None. `idx` is then the index just past the closing brace.
+    """
+
+    def __init__(self, _text, _idx):
+        # type: (str, int) -> None
+        self.text = _text
+        self.idx = _skip_whitespace(_text, _expect(_text, _idx, "{"))
+        self.finished = _text[self.idx : self.idx + 1] == "}"
+        if self.finished:
+            self.idx += 1
+
+    def next_key(self):
+        # type: () -> str | None
+        """Read the next member's key (leaving `idx` at its value), or return None at the end of the object."""
+        if self.finished:
+            return None
+        key, idx = scanstring(self.text, _expect(self.text, self.idx, '"'))
+        self.idx = _skip_whitespace(self.text, _expect(self.text, _skip_whitespace(self.text, idx), ":"))
+        return key
+
+    def read_value(self):
+        # type: () -> Any
+        """Decode the current member's value."""
+        value, idx = _decoder.raw_decode(self.text, self.idx)
+        self.end_value(idx)
+        return value
+
+    def skip_value(self):
+        # type: () -> None
+        """Move past the current member's value without decoding it."""
+        if self.text[self.idx : self.idx + 1] not in ("{", "["):
+            self.read_value()  # -- A scalar: decoding it is as cheap as skipping it.
+            return
+
+        depth = 0
+        for match in _SKIP_TOKENS.finditer(self.text, self.idx):
+            char = self.text[match.start()]
+            if char == '"':
+                continue
+            depth += 1 if char in "{[" else -1
+            if depth == 0:
+                self.end_value(match.end())
+                return
+        raise ValueError("Unterminated JSON value starting at char {}".format(self.idx))
+
+    def end_value(self, _idx):
+        # type: (int) -> None
+        """Move past the `,` (or the closing `}`) following a value which ends at `_idx`."""
+        idx = _skip_whitespace(self.text, _idx)
+        if self.text[idx : idx + 1] == "}":
+            self.finished = True
+            self.idx = idx + 1
+        else:
+            self.idx = _skip_whitespace(self.text, _expect(self.text, idx, ","))
+
+
+class StreamedEnvelope(dict):
+    """A response envelope with its large payload key(s) left un-decoded.
+
+    Dict-like for the envelope fields (so the client validates it exactly like a
+    `json.loads` envelope). The `_lazy_keys` are NOT in the dict: read them with
+    `iter_items()`. `_header_keys` are the envelope fields which must be read up
+    front (None: all of them). Raises `ValueError` (like `json.loads`) on a
+    malformed envelope, or from `iter_items()` on a malformed payload / trailer.
+    """
+
+    def __init__(self, _text, _lazy_keys, _header_keys=None):
+        # type: (str, Iterable[str], Iterable[str] | None) -> None
+        super(StreamedEnvelope, self).__init__()
+        self.text = _text
+        self.lazy_keys = frozenset(_lazy_keys)
+        self.header_keys = frozenset(_header_keys) if _header_keys is not None else None
+        self.lazy_offsets = {}  # type: dict[str, int]
+
+        # -- Set while the envelope has been read only up to (the start of) a lazy
+        # -- payload: `(payload key, reader)`. The rest is read by `iter_items()`.
+        self._paused_at = None  # type: tuple[str, _ObjectReader] | None
+
+        self._read_members(_ObjectReader(_text, _skip_whitespace(_text, 0)))
+
+    def _has_header(self):
+        # type: () -> bool
+        if self.header_keys is None:
+            return False
+        return all(key in self for key in self.header_keys)
+
+    def _read_members(self, _reader):
+        # type: (_ObjectReader) -> None
+        """Read envelope members until a lazy payload is reached with the header complete, or to the end."""
+        while True:
+            key = _reader.next_key()
+            if key is None:
+                break
+            if key not in self.lazy_keys:
+                self[key] = _reader.read_value()
+                continue
+            self.lazy_offsets[key] = _reader.idx
+            if self._has_header():
+                self._paused_at = (key, _reader)
+                return
+            _reader.skip_value()
+
+        if _skip_whitespace(self.text, _reader.idx) != len(self.text):
+            raise ValueError("Extra data at char {}".format(_reader.idx))
+
+    def iter_items(self, _key):
+        # type: (str) -> Iterator[tuple[str, Any]]
+        """Return an iterator of the `(name, item)` entries of a lazy payload object.
+
+        Items are decoded one at a time as the iterator is consumed. A missing /
+        `null` payload yields nothing. A malformed item raises `ValueError` when it is
+        reached.
+        """
+        idx = self.lazy_offsets.get(_key)
+        if idx is None:
+            return iter(())
+        if self.text[idx : idx + 1] != "{":
+            value = _decoder.raw_decode(self.text, idx)[0]
+            if value is not None:
+                raise ValueError(
+                    "Expecting the '{}' payload to be a JSON object, got: {}".format(_key, type(value).__name__)
+                )
+            return iter(())
+        return self._iter_members(_key, idx)
+
+    def _iter_members(self, _key, _idx):
+        # type: (str, int) -> Iterator[tuple[str, Any]]
+        reader = _ObjectReader(self.text, _idx)
+        while True:
+            name = reader.next_key()
+            if name is None:
+                break
+            yield name, reader.read_value()
+
+        # -- The whole payload has been read: finish reading the envelope after it.
+        if self._paused_at is not None and self._paused_at[0] == _key:
+            envelope_reader = self._paused_at[1]
+            self._paused_at = None
+            envelope_reader.end_value(reader.idx)
+            self._read_members(envelope_reader)
+
+    def __repr__(self):
+        return "{}({}, lazy_keys=[{}])".format(
+            self.__class__.__name__, dict.__repr__(self), ", ".join(sorted(self.lazy_keys))
+        )
+
+
+def iter_payload_items(_envelope, _key):
+    # type: (dict, str) -> Iterator[tuple[str, Any]]
+    """Return an iterator of the `(name, item)` entries of an envelope's payload object.
+
+    Works on a `StreamedEnvelope` (decoded one item at a time) or a plain decoded
+    envelope dict (ie: one served from a `PHNavSnapshot`).
+    """
+    if isinstance(_envelope, StreamedEnvelope):
+        return _envelope.iter_items(_key)
+    return iter((_envelope.get(_key) or {}).items())
+
+
+class JSONPreview(object):
+    """An indented JSON preview of a payload object, built up one entry at a time.
+
+    The same text as `json.dumps(payload, indent=2, ensure_ascii=False)`, but never
+    needs the whole payload dict at once: each item is rendered as it is decoded.
+    """
+
+    def __init__(self):
+        self.entries = []  # type: list[str]
+
+    @staticmethod
+    def dumps(_item):
+        # type: (Any) -> str
+        """Return one item's indented JSON, as used by `add_json()`."""
+        return json.dumps(_item, indent=2, ensure_ascii=False)
+
+    def add(self, _name, _item):
+        # type: (str, Any) -> None
+        self.add_json(_name, self.dumps(_item))
+
+    def add_json(self, _name, _item_json):
+        # type: (str, str) -> None
+        """Add an entry from its item's already-dumped JSON (see `dumps()`), ie: a memoized one."""
+        # -- Nest the item one level in. A JSON dump has no raw newlines inside its strings.
+        name_json = json.dumps(_name, ensure_ascii=False)
+        self.entries.append(u"  {}: {}".format(name_json, _item_json.replace(u"\n", u"\n  ")))
+
+    def text(self):
+        # type: () -> str
+        if not self.entries:
+            return u"{}"
+        return u"{{\n{}\n}}".format(u",\n".join(self.entries))
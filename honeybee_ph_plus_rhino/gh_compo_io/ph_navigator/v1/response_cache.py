@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""On-disk cache of PH-Navigator V1 responses, used by `PHNavV1Client`.
+
+Each cached response is two small files in the cache folder, named by the
+request's cache-key::
+
+    <key>.json       The raw response body, exactly as downloaded.
+    <key>.meta.json  `{ url, version_id, last_modified, etag, http_last_modified }`
+
+The meta file lets the client decide whether a cached body is still current
+without parsing the full body: `etag` / `http_last_modified` are the response's
+HTTP validators (for a conditional GET), `version_id` / `last_modified` are the
+cached envelope's version stamp.
+
+The cache is plain Python (no `System.Net`) so it also runs under CPython. It
+never raises: an unreadable / unwritable cache is treated as a cache-miss.
+"""
+
+import hashlib
+import io
+import json
+import os
+
+try:
+    from typing import Any  # noqa: F401
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee.config import folders as hb_folders  # type: ignore
+except ImportError:
+    hb_folders = None  # Outside Rhino
+
+
+def default_cache_folder():
+    # type: () -> str
+    """Return the default cache folder, inside the Honeybee simulation folder."""
+    if hb_folders is not None:
+        root = hb_folders.default_simulation_folder
+    else:
+        root = os.path.join(os.path.expanduser("~"), "simulation")
+    return os.path.join(root, "ph_navigator_cache")
+
+
+class PHNavResponseCache(object):
+    """A folder of cached PH-Navigator V1 response bodies, keyed by request."""
+
+    def __init__(self, _folder=None):
+        # type: (str | None) -> None
+        self.folder = _folder or default_cache_folder()
+
+    @staticmethod
+    def key(_url_base, _bt_number, _path, _version, _query=None, _token=None):
+        # type: (str, str, str, str | None, dict | None, str | None) -> str
+        """Return the cache-key for one request.
+
+        The key covers the server, project, route, pinned version and any extra
+        query params. A digest of the access-token is included so that a response
+        downloaded with one token is never served to a request made with another.
+        """
+        query = "&".join("{}={}".format(k, _query[k]) for k in sorted(_query or {}))
+        token_digest = hashlib.sha1(_token.encode("utf-8")).hexdigest() if _token else ""
+        parts = [_url_base.rstrip("/"), _bt_number, _path, _version or "", query, token_digest]
+        return hashlib.sha1(u"\n".join(u"{}".format(p) for p in parts).encode("utf-8")).hexdigest()
+
+    def _body_path(self, _key):
+        # type: (str) -> str
+        return os.path.join(self.folder, "{}.json".format(_key))
+
+    def _meta_path(self, _key):
+        # type: (str) -> str
+        return os.path.join(self.folder, "{}.meta.json".format(_key))
+
+    def load_meta(self, _key):
+        # type: (str) -> dict | None
+        """Return the cached response's meta-data dict, or None if not cached."""
+        try:
+            with io.open(self._meta_path(_key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def load_body(self, _key):
+        # type: (str) -> str | None
+        """Return the cached raw response body, or None if not cached."""
+        try:
+            with io.open(self._body_path(_key), "r", encoding="utf-8") as f:
+                return f.read()
+        except (IOError, OSError, ValueError):
+            return None
+
+    def save(self, _key, _body, _meta):
+        # type: (str, str, dict) -> None
+        """Write the raw response body and its meta-data to the cache.
+
+        The body is written before the meta file, so a meta file is only ever
+        found next to a complete body.
+        """
+        try:
+            if not os.path.isdir(self.folder):
+                os.makedirs(self.folder)
+            self._write_file(self._body_path(_key), _body)
+            self._write_file(self._meta_path(_key), json.dumps(_meta))
+        except (IOError, OSError):
+            self.remove(_key)
+
+    def remove(self, _key):
+        # type: (str) -> None
+        """Delete a cached response (if any)."""
+        for path in (self._meta_path(_key), self._body_path(_key)):
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except (IOError, OSError):
+                pass
+
+    @staticmethod
+    def _write_file(_path, _text):
+        # type: (str, str) -> None
+        """Write to a temp-file, then move it into place, so readers never see a partial file."""
+        tmp_path = "{}.tmp".format(_path)
+        with io.open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(u"{}".format(_text))
+        # -- os.rename will not overwrite an existing file on Windows (no os.replace in 2.7)
+        if os.path.exists(_path):
+            os.remove(_path)
+        os.rename(tmp_path, _path)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""A PH-Navigator project snapshot: a set of V1 route envelopes at ONE saved version.
+
+Built by `PHNavV1Client.get_snapshot()`, which downloads the chosen routes
+concurrently, all pinned to the same `version_id`. Feed the snapshot into the
+other `PH-Nav Get ...` components (`_snapshot` input) and they read their route
+from it through a `PHNavSnapshotClient`, with no further network calls.
+
+A snapshot can also be saved to, and loaded back from, a single gzip-compressed
+JSON "bundle" file (`save_bundle()` / `load_bundle()`), for working offline::
+
+    {
+        "format": "ph-navigator-bundle", "format_version": 1,
+        "url_base": ..., "bt_number": ..., "version_id": ...,
+        "envelopes": { "<route path>": <envelope>, ... }
+    }
+
+A bundle's bytes depend only on the snapshot (sorted keys, no gzip timestamp /
+file name), so the same version always saves to the same file.
+"""
+
+import gzip
+import io
+import json
+import os
+import re
+
+try:
+    from typing import Any  # noqa: F401
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.response_cache import default_cache_folder
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.table_names import VALID_TABLE_NAMES
+except ImportError as e:
+    raise ImportError("\nFailed to import from honeybee_ph_plus_rhino {}".format(e))
+
+
+# -- The routes a snapshot can hold, by name: `(route path, extra query params)`.
+# -- Route 1 (versions) is not included: it is how the snapshot version is resolved.
+CONSTRUCTIONS_QUERY = {"on_missing_thermal": "user_defaults"}
+SNAPSHOT_ROUTES = dict(
+    [
+        ("constructions", ("/constructions/hbjson", CONSTRUCTIONS_QUERY)),
+        ("aperture_types", ("/aperture-types", None)),
+        ("aperture_constructions", ("/aperture-constructions/hbjson", None)),
+    ]
+    + [(name, ("/tables/{}".format(name), None)) for name in VALID_TABLE_NAMES]
+)
+SNAPSHOT_ROUTE_NAMES = ("constructions", "aperture_types", "aperture_constructions") + VALID_TABLE_NAMES
+
+BUNDLE_FORMAT = "ph-navigator-bundle"
+BUNDLE_FORMAT_VERSION = 1
+BUNDLE_EXTENSION = ".phnav.json.gz"
+
+
+def default_bundle_folder():
+    # type: () -> str
+    """Return the default folder for saved bundles, next to the response cache folder."""
+    return os.path.join(os.path.dirname(default_cache_folder()), "ph_navigator_bundles")
+
+
+class PHNavSnapshot(object):
+    """The envelopes of a set of PH-Navigator V1 routes, all at the same saved version."""
+
+    def __init__(self, _url_base, _bt_number, _version_id, _envelopes):
+        # type: (str, str, str, dict[str, dict]) -> None
+        self.url_base = _url_base
+        self.bt_number = _bt_number
+        self.version_id = _version_id
+        self.envelopes = _envelopes  # -- {route path: envelope}
+
+    @property
+    def routes(self):
+        # type: () -> list[str]
+        """The snapshot's route names, in `SNAPSHOT_ROUTE_NAMES` order."""
+        paths = set(self.envelopes.keys())
+        return [name for name in SNAPSHOT_ROUTE_NAMES if SNAPSHOT_ROUTES[name][0] in paths]
+
+    def _any_envelope(self):
+        # type: () -> dict
+        for envelope in self.envelopes.values():
+            return envelope
+        return {}
+
+    @property
+    def project(self):
+        # type: () -> dict | None
+        return self._any_envelope().get("project")
+
+    @property
+    def last_modified(self):
+        # type: () -> str | None
+        return self._any_envelope().get("last_modified")
+
+    def envelope(self, _path):
+        # type: (str) -> dict | None
+        """Return the envelope for one route path (ie: '/aperture-types'), or None if not in the snapshot."""
+        return self.envelopes.get(_path)
+
+    # -------------------------------------------------------------------------
+    # -- Bundle files
+
+    def to_dict(self):
+        # type: () -> dict
+        return {
+            "format": BUNDLE_FORMAT,
+            "format_version": BUNDLE_FORMAT_VERSION,
+            "url_base": self.url_base,
+            "bt_number": self.bt_number,
+            "version_id": self.version_id,
+            "envelopes": self.envelopes,
+        }
+
+    @classmethod
+    def from_dict(cls, _input_dict):
+        # type: (dict) -> PHNavSnapshot
+        """Build a snapshot from a bundle dict. Raises `ValueError` if it is not a (supported) bundle."""
+        if not isinstance(_input_dict, dict) or _input_dict.get("format") != BUNDLE_FORMAT:
+            raise ValueError("Not a PH-Navigator bundle (no '{}' format marker).".format(BUNDLE_FORMAT))
+        if _input_dict.get("format_version") != BUNDLE_FORMAT_VERSION:
+            raise ValueError(
+                "Unsupported PH-Navigator bundle format_version '{}' (expected {}).".format(
+                    _input_dict.get("format_version"), BUNDLE_FORMAT_VERSION
+                )
+            )
+        envelopes = _input_dict.get("envelopes")
+        if not isinstance(envelopes, dict):
+            raise ValueError("The PH-Navigator bundle has no 'envelopes'.")
+        return cls(_input_dict.get("url_base"), _input_dict.get("bt_number"), _input_dict.get("version_id"), envelopes)
+
+    def default_bundle_path(self):
+        # type: () -> str
+        """The default bundle file path: `<default_bundle_folder>/<bt_number>_<version_id>.phnav.json.gz`."""
+        file_name = re.sub(r"[^\w.-]", "_", u"{}_{}".format(self.bt_number, self.version_id))
+        return os.path.join(default_bundle_folder(), file_name + BUNDLE_EXTENSION)
+
+    def save_bundle(self, _file_path=None):
+        # type: (str | None) -> str
+        """Write the snapshot to a bundle file (default: `default_bundle_path()`). Returns the file path.
+
+        The file is written to a temp-file first, then moved into place. Raises
+        `IOError` / `OSError` if it cannot be written.
+        """
+        file_path = _file_path or self.default_bundle_path()
+        folder = os.path.dirname(os.path.abspath(file_path))
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+
+        data = json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":")).encode("utf-8")
+        tmp_path = "{}.tmp".format(file_path)
+        with io.open(tmp_path, "wb") as f:
+            with gzip.GzipFile(filename="", mode="wb", fileobj=f, mtime=0) as gz:
+                gz.write(data)
+        # -- os.rename will not overwrite an existing file on Windows (no os.replace in 2.7)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        os.rename(tmp_path, file_path)
+        return file_path
+
+    @classmethod
+    def load_bundle(cls, _file_path):
+        # type: (str) -> PHNavSnapshot
+        """Read a snapshot from a bundle file.
+
+        Raises `IOError` / `OSError` / `EOFError` if the file cannot be read (or is not
+        / a truncated gzip file), `ValueError` if it is not a valid bundle.
+        """
+        with gzip.GzipFile(_file_path, "rb") as gz:
+            data = gz.read()
+        return cls.from_dict(json.loads(data.decode("utf-8")))
+
+    def __repr__(self):
+        return "{}(bt_number={}, version_id={}, routes=[{}])".format(
+            self.__class__.__name__, self.bt_number, self.version_id, ", ".join(self.routes)
+        )
+
+    def __str__(self):
+        return self.__repr__()
+
+    def ToString(self):
+        # -- GH calls .NET `ToString()` when displaying an object on the canvas.
+        return self.__repr__()
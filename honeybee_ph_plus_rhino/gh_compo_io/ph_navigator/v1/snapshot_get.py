@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""GHCompo Interface: HBPH+ - PH-Nav Get Snapshot."""
+
+try:
+    from typing import Any  # noqa: F401
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from ph_gh_component_io import gh_io
+except ImportError as e:
+    raise ImportError("\nFailed to import ph_gh_component_io. {}".format(e))
+
+try:
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.client import PHNavV1Client
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.snapshot import PHNavSnapshot
+except ImportError as e:
+    raise ImportError("\nFailed to import from honeybee_ph_plus_rhino {}".format(e))
+
+
+class GHCompo_PHNavV1GetSnapshot(object):
+    """Download a chosen set of PH-Navigator routes at once, all at the same saved version.
+
+    The routes (`constructions`, `aperture_types`, `aperture_constructions` and the
+    element-table names) are fetched concurrently by `PHNavV1Client.get_snapshot()`,
+    all pinned to one `version_id`: the `_version` pin, or else the project's latest
+    saved version, resolved once before any route is downloaded. Wire the `snapshot_`
+    output into the `_snapshot` input of the other `PH-Nav Get ...` components, which
+    then read their route from it with no further network calls.
+    """
+
+    def __init__(self, _IGH, _project_number, _routes, _version, _url_base, _token, _download, *args, **kwargs):
+        # type: (gh_io.IGH, str, list[str], str | None, str | None, str | None, bool, *Any, **Any) -> None
+        self.IGH = _IGH
+        self.project_number = _project_number
+        self.routes = [r for r in (_routes or []) if r]
+        self.version = _version
+        self.url_base = _url_base
+        self.token = _token
+        self.download = _download
+
+    @property
+    def ready(self):
+        # type: () -> bool
+        return bool(self.download and self.project_number)
+
+    def run(self):
+        # type: () -> tuple[PHNavSnapshot | None, list[str], str | None, str | None]
+        """Download the routes into one snapshot."""
+        if not self.ready:
+            return None, [], None, None
+
+        client = PHNavV1Client(self.IGH, self.project_number, self.url_base, self.token, self.version)
+        snapshot = client.get_snapshot(self.routes or None)
+        if snapshot is None:
+            # -- The client already surfaced the failure via IGH.error.
+            return None, [], None, None
+
+        return snapshot, snapshot.routes, snapshot.version_id, snapshot.last_modified
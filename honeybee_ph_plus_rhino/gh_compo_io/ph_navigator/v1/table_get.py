@@ -17,9 +17,10 @@ except ImportError as e:
 
 try:
     from honeybee_ph_plus_rhino.gh_compo_io.collections.create_new_collection import CustomCollection
-    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.client import PHNavV1Client
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.client import PHNavSnapshotClient, PHNavV1Client
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.snapshot import PHNavSnapshot
     from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.table_names import VALID_TABLE_NAMES
-    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.table_schema import FieldDef, TableRecord
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.table_schema import FieldDef, TablePreview, TableRecord
 except ImportError as e:
     raise ImportError("\nFailed to import from honeybee_ph_plus_rhino {}".format(e))
 
@@ -31,8 +32,13 @@ class GHCompo_PHNavV1GetTable(object):
     downloader for all 12 row-based element types (`rooms`, `ventilators`, ... see
     `VALID_TABLE_NAMES`). Transport lives in `PHNavV1Client`; this component only
     validates the table name, then wraps each row / field-def in a dict-like
-    `TableRecord` / `FieldDef` (so GH can display the contents instead of the bare
+    `TableRecord` / `FieldDef` view (so GH can display the contents instead of the bare
     `PythonDictionary` type name) and passes them through otherwise unchanged.
+
+    `json_` is the full table (records + field defs) as indented JSON text. Set
+    `_full_json` to False to skip building it for a large table: the
+    `json_preview_` output (a `TablePreview`) is rendered only when displayed, and
+    shows only the first `TablePreview.MAX_RECORDS` records.
     Reshaping rows into Honeybee/PH objects is the job of the separate `Organize
     Table` component, keyed on the `table_name_` echoed here.
 
@@ -40,16 +46,37 @@ class GHCompo_PHNavV1GetTable(object):
     keyed by the `_key` field - the common GH pattern for matching a downloaded record
     to a Rhino geometry element via `Get From Custom Collection`. With no `_key` the
     collection is keyed by each record's `id`; duplicate keys are warned (not silently
-    dropped) since the caller almost certainly wants a unique key.
+    dropped) since the caller almost certainly wants a unique key. The collection holds
+    the same record objects as `records_` (nothing is copied).
 
     `_table_name` is validated against `VALID_TABLE_NAMES` before any network call, so
     a typo fails fast on the canvas instead of round-tripping to a 422. Everything past
     that (transport / envelope / HTTP errors) is handled by `PHNavV1Client`, which
     returns `None` after logging via `IGH.error`.
+
+    With a `_snapshot` (from `PH-Nav Get Snapshot`) the route is read from the
+    snapshot through a `PHNavSnapshotClient` instead, with no network call.
     """
 
-    def __init__(self, _IGH, _project_number, _table_name, _key, _version, _url_base, _token, _download, *args, **kwargs):
-        # type: (gh_io.IGH, str, str | None, str | None, str | None, str | None, str | None, bool, *Any, **Any) -> None
+    # -- The most duplicate keys named in the duplicate-key warning.
+    MAX_REPORTED_KEYS = 10
+
+    def __init__(
+        self,
+        _IGH,
+        _project_number,
+        _table_name,
+        _key,
+        _version,
+        _url_base,
+        _token,
+        _download,
+        _snapshot=None,
+        _full_json=True,
+        *args,
+        **kwargs
+    ):
+        # type: (gh_io.IGH, str, str | None, str | None, str | None, str | None, str | None, bool, PHNavSnapshot | None, bool | None, *Any, **Any) -> None
         self.IGH = _IGH
         self.project_number = _project_number
         self.table_name = _table_name
@@ -58,19 +85,28 @@ class GHCompo_PHNavV1GetTable(object):
         self.url_base = _url_base
         self.token = _token
         self.download = _download
+        self.snapshot = _snapshot
+        self.full_json = _full_json is not False  # -- An unconnected GH input is None
 
     @property
     def ready(self):
         # type: () -> bool
-        return bool(self.download and self.project_number and self.table_name)
+        return bool(self.table_name and (self.snapshot or (self.download and self.project_number)))
+
+    def _client(self):
+        # type: () -> PHNavV1Client
+        """A client for the `_snapshot` (no network calls) if one is given, else for the live API."""
+        if self.snapshot is not None:
+            return PHNavSnapshotClient(self.IGH, self.snapshot)
+        return PHNavV1Client(self.IGH, self.project_number, self.url_base, self.token, self.version)
 
     def _empty_result(self):
-        # type: () -> tuple[list, CustomCollection, list, str | None, str | None, str | None]
+        # type: () -> tuple[list, CustomCollection, list, str | None, str | None, str | None, TablePreview | None]
         """The 'nothing downloaded' result - matches the run() arity with empty values."""
-        return [], CustomCollection(), [], None, None, None
+        return [], CustomCollection(), [], None, None, None, None
 
     def run(self):
-        # type: () -> tuple[list, CustomCollection, list, str | None, str | None, str | None]
+        # type: () -> tuple[list, CustomCollection, list, str | None, str | None, str | None, TablePreview | None]
         """Download one element table; wrap its rows + field defs for readable GH display."""
         if not self.ready:
             return self._empty_result()
@@ -83,7 +119,7 @@ class GHCompo_PHNavV1GetTable(object):
             )
             return self._empty_result()
 
-        client = PHNavV1Client(self.IGH, self.project_number, self.url_base, self.token, self.version)
+        client = self._client()
         records, field_defs = client.get_table(self.table_name)
         if records is None:
             # -- The client already surfaced the failure via IGH.error.
@@ -93,28 +129,53 @@ class GHCompo_PHNavV1GetTable(object):
             # -- Empty table is a valid state (not a 404) - warn, do not error.
             self.IGH.warning("Table '{}' returned no records (it is empty).".format(self.table_name))
 
-        # -- Build the raw preview from the payload dicts BEFORE wrapping, so `json_`
+        # -- The JSON is built from the raw payload dicts (not the wrappers), so `json_`
         # -- stays faithful JSON. The wrappers are dict-like, so the values are
         # -- unchanged for downstream consumers - only their GH display improves.
-        json_preview = json.dumps({"records": records, "field_defs": field_defs}, indent=2, ensure_ascii=False)
+        json_text = None  # type: str | None
+        if self.full_json:
+            json_text = json.dumps({"records": records, "field_defs": field_defs}, indent=2, ensure_ascii=False)
+        json_preview = TablePreview(records, field_defs)
         records = [TableRecord(r) for r in records]
         field_defs = [FieldDef(f) for f in field_defs]
         record_collection = self._build_collection(records)
-        return records, record_collection, field_defs, self.table_name, json_preview, client.last_modified
+        return (
+            records,
+            record_collection,
+            field_defs,
+            self.table_name,
+            json_text,
+            client.last_modified,
+            json_preview,
+        )
 
     def _build_collection(self, _records):
         # type: (list[TableRecord]) -> CustomCollection
-        """Index the wrapped records into a `CustomCollection` keyed by `_key` (or `id`)."""
-        collection = CustomCollection(self.table_name or "")
+        """Index the wrapped records into a `CustomCollection` keyed by `_key` (or `id`).
+
+        Duplicate keys are reported in ONE warning (a key shared by every row of a large
+        table would otherwise add a warning per row).
+        """
+        storage = {}  # type: dict[str, TableRecord]
+        duplicate_keys = []  # type: list[str]
         for record in _records:
             key = self._record_key(record)
-            if key in collection:
-                self.IGH.warning(
-                    "Duplicate collection key '{}' in table '{}'; the later record overwrites the "
-                    "earlier one. Pick a '_key' field with unique values.".format(key, self.table_name)
+            if key in storage:
+                duplicate_keys.append(key)
+            storage[key] = record
+
+        if duplicate_keys:
+            unique_duplicates = sorted(set(duplicate_keys))
+            self.IGH.warning(
+                "{} records in table '{}' have a duplicate collection key; each later record overwrites "
+                "the earlier one. Pick a '_key' field with unique values. Duplicate keys: {}{}".format(
+                    len(duplicate_keys),
+                    self.table_name,
+                    ", ".join("'{}'".format(k) for k in unique_duplicates[: self.MAX_REPORTED_KEYS]),
+                    ", ..." if len(unique_duplicates) > self.MAX_REPORTED_KEYS else "",
                 )
-            collection[key] = record
-        return collection
+            )
+        return CustomCollection.from_storage(storage, self.table_name or "")
 
     def _record_key(self, _record):
         # type: (TableRecord) -> str
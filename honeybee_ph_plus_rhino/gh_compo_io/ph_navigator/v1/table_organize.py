@@ -25,10 +25,14 @@ Resolution falls back to the record's `custom_values` bag by key, so a custom
 field can be mapped later without code changes. Single-select values arrive as
 `{"id", "label"}` and are flattened to their `label` (O-C). Missing / unset fields
 resolve to `None` so the downstream create-component applies its own default.
+
+A table's spec is compiled (`compile_spec`) once per `field_defs` set into one
+column-resolver function per port, each of which reads its whole column from the raw
+row dicts in a single pass.
 """
 
 try:
-    from typing import Any, Dict, List  # noqa: F401
+    from typing import Any, Callable, Dict, List, Tuple  # noqa: F401
 except ImportError:
     pass  # IronPython 2.7
 
@@ -188,12 +192,81 @@ def get_component_outputs(_type):
     return {}  # deferred / unknown -> no data ports
 
 
-def _flatten_option(_value):
-    # type: (Any) -> Any
-    """Single-select values arrive as `{"id", "label"}` (O6) - emit the label."""
-    if isinstance(_value, dict) and "id" in _value and "label" in _value:
-        return _value.get("label")
-    return _value
+# -- Marks a field that is not a built-in column of the row (vs. one that is, set to `null`).
+_MISSING = object()
+
+
+def _column_resolver(_field_key):
+    # type: (str) -> Callable[[List[dict]], list]
+    """Return a function which reads one field out of every row dict, in one pass.
+
+    The built-in column first, then the `custom_values` bag. Single-select values
+    arrive as `{"id", "label"}` (O6) and are flattened to their label.
+    """
+
+    def resolve_column(_rows):
+        # type: (List[dict]) -> list
+        column = [row.get(_field_key, _MISSING) for row in _rows]
+        for i, value in enumerate(column):
+            if value is _MISSING:
+                custom_values = _rows[i].get("custom_values")
+                value = custom_values.get(_field_key) if custom_values else None
+                column[i] = value
+            if isinstance(value, dict) and "id" in value and "label" in value:
+                column[i] = value.get("label")
+        return column
+
+    return resolve_column
+
+
+class CompiledSpec(object):
+    """One table's `OUTPUT_SPECS` entry, compiled against one `field_defs` set.
+
+    Holds a column-resolver per port, plus the `{field_key: display_name}` lookup
+    (from `field_defs`) used by the report.
+    """
+
+    def __init__(self, _spec, _field_defs):
+        # type: (List[_Port], List[dict]) -> None
+        self.ports = _spec
+        self.resolvers = [(port.name, _column_resolver(port.field_key)) for port in _spec]
+        self.mapped_keys = frozenset(port.field_key for port in _spec)
+        self.display_names = {}  # type: Dict[str, str]
+        for field_def in _field_defs:
+            key = field_def.get("field_key")
+            if key:
+                self.display_names[key] = field_def.get("display_name") or key
+
+    def resolve(self, _rows):
+        # type: (List[dict]) -> Dict[str, list]
+        """Return `{port name: [value per row]}`, one column at a time."""
+        return {name: resolve_column(_rows) for name, resolve_column in self.resolvers}
+
+
+# -- Compiled specs, by `(table name, field_defs fingerprint)`. Kept for the Rhino
+# -- session, so a re-solve with the same table / field defs skips the compile.
+_COMPILED_SPECS = {}  # type: Dict[Tuple, CompiledSpec]
+MAX_COMPILED_SPECS = 64
+
+
+def compile_spec(_type, _field_defs):
+    # type: (str, List[dict]) -> CompiledSpec
+    """Return the `CompiledSpec` for a mapped table + `field_defs` set, compiling it on first use."""
+    fingerprint = tuple((f.get("field_key"), f.get("display_name")) for f in _field_defs)
+    key = (_type, fingerprint)
+    compiled = _COMPILED_SPECS.get(key)
+    if compiled is None:
+        if len(_COMPILED_SPECS) >= MAX_COMPILED_SPECS:
+            _COMPILED_SPECS.clear()
+        compiled = CompiledSpec(OUTPUT_SPECS[_type], _field_defs)
+        _COMPILED_SPECS[key] = compiled
+    return compiled
+
+
+def _raw_rows(_records):
+    # type: (List[Any]) -> List[dict]
+    """The raw row dicts: unwraps `TableRecord`s (from Get Table); plain dicts pass as-is."""
+    return [r.to_dict() if hasattr(r, "to_dict") else r for r in _records]
 
 
 class GHCompo_PHNavV1OrganizeTable(object):
@@ -239,61 +312,50 @@ class GHCompo_PHNavV1OrganizeTable(object):
             self.IGH.warning(
                 "No organize mapping for '{}'; passing the raw records through unchanged.".format(self.type)
             )
-            return {PASSTHROUGH_PORT.name: list(self.records), REPORT_PORT_NAME: self._report([], {})}
-
-        spec = OUTPUT_SPECS[self.type]
-        result = {port.name: [self._resolve(r, port.field_key) for r in self.records] for port in spec}
-        result[REPORT_PORT_NAME] = self._report(spec, result)
+            # -- No ports: the report lists every downloaded column as unmapped
+            report = self._report(CompiledSpec([], self.field_defs), _raw_rows(self.records), {})
+            return {PASSTHROUGH_PORT.name: list(self.records), REPORT_PORT_NAME: report}
+
+        compiled = compile_spec(self.type, self.field_defs)
+        rows = _raw_rows(self.records)
+        result = compiled.resolve(rows)
+        result[REPORT_PORT_NAME] = self._report(compiled, rows, result)
         return result
 
-    def _resolve(self, _record, _field_key):
-        # type: (Any, str) -> Any
-        """Pull one field from a record: built-in column first, then `custom_values`."""
-        if _field_key in _record:
-            return _flatten_option(_record[_field_key])
-        custom_values = _record.get("custom_values") or {}
-        return _flatten_option(custom_values.get(_field_key))
-
-    def _present_field_keys(self):
-        # type: () -> List[str]
-        """Every data column that actually appears in the records, in first-seen
+    @staticmethod
+    def _present_field_keys(_rows):
+        # type: (List[dict]) -> List[str]
+        """Every data column that actually appears in the rows, in first-seen
         order (built-in columns + `custom_values` keys; structural keys skipped)."""
         structural = ("id", "custom_values", "custom_links")
-        seen = set()
+        seen = set(structural)
         keys = []
-        for record in self.records:
-            for key in list(record.keys()) + list((record.get("custom_values") or {}).keys()):
-                if key in structural or key in seen:
+        for row in _rows:
+            for key_set in (row, row.get("custom_values") or {}):
+                # -- Rows of one table mostly share their keys: skip the per-key loop once all are seen.
+                if seen.issuperset(key_set):
                     continue
-                seen.add(key)
-                keys.append(key)
+                for key in key_set:
+                    if key not in seen:
+                        seen.add(key)
+                        keys.append(key)
         return keys
 
-    def _display_names(self):
-        # type: () -> Dict[str, str]
-        """`{field_key: display_name}` from `field_defs`, for a readable report."""
-        names = {}
-        for field_def in self.field_defs:
-            key = field_def.get("field_key")
-            if key:
-                names[key] = field_def.get("display_name") or key
-        return names
-
-    def _report(self, spec, result):
-        # type: (List[_Port], Dict[str, list]) -> List[str]
+    def _report(self, _compiled, _rows, _result):
+        # type: (CompiledSpec, List[dict], Dict[str, list]) -> List[str]
         """Flag gaps: ports that resolved to nothing, and downloaded columns that
         no port consumed - so nothing is silently dropped (README no-silent-caps).
         Reads the already-resolved `result` rather than re-resolving every field."""
-        notes = ["{} record(s), {} output port(s).".format(len(self.records), len(spec))]
+        spec = _compiled.ports
+        notes = ["{} record(s), {} output port(s).".format(len(_rows), len(spec))]
 
-        empty_ports = [port.name for port in spec if all(value is None for value in result[port.name])]
-        if self.records and empty_ports:
+        empty_ports = [port.name for port in spec if all(value is None for value in _result[port.name])]
+        if _rows and empty_ports:
             notes.append("Ports with no data (field unset or missing server-side): " + ", ".join(empty_ports))
 
-        mapped_keys = set(port.field_key for port in spec)
-        unmapped = [key for key in self._present_field_keys() if key not in mapped_keys]
+        unmapped = [key for key in self._present_field_keys(_rows) if key not in _compiled.mapped_keys]
         if unmapped:
-            display_names = self._display_names()
+            display_names = _compiled.display_names
             pretty = ["{} ({})".format(display_names.get(key, key), key) for key in unmapped]
             notes.append("Downloaded columns not mapped to an output port: " + ", ".join(pretty))
 
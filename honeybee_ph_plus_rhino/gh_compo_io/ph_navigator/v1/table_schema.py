@@ -14,8 +14,18 @@ downstream `Organize Table` component (and any user script) reads fields exactly
 they were still raw dicts - the wrapping is transparent to consumers, cosmetic to GH.
 `to_dict()` is a public escape hatch back to the underlying dict for any consumer that
 wants it raw.
+
+The wrappers are views, not copies: each holds a reference to its payload dict (and
+nothing else - they are slotted), and a field is only looked up when it is read, either
+as an item (`record["name"]`) or as an attribute (`record.name`).
+
+`TablePreview` is the (truncated) JSON text of the payload, rendered only when it is
+first displayed.
 """
 
+import json
+from collections import OrderedDict
+
 try:
     from typing import Any, ItemsView, Iterator, KeysView, ValuesView  # noqa: F401
 except ImportError:
@@ -29,6 +39,8 @@ class _ReadableDict(object):
     of the mapping protocol to it. Subclasses only supply `__repr__`.
     """
 
+    __slots__ = ("_data",)
+
     def __init__(self, _data):
         # type: (dict | None) -> None
         self._data = _data or {}
@@ -58,6 +70,17 @@ class _ReadableDict(object):
         # type: (str) -> Any
         return self._data[_key]
 
+    def __getattr__(self, _name):
+        # type: (str) -> Any
+        """Read a field as an attribute (ie: `record.name`), so the wrappers also work
+        with attribute-keyed components such as 'Create Custom Collection'."""
+        if _name.startswith("_"):
+            raise AttributeError(_name)
+        try:
+            return self._data[_name]
+        except KeyError:
+            raise AttributeError("'{}' has no field '{}'".format(self.__class__.__name__, _name))
+
     def __contains__(self, _key):
         # type: (str) -> bool
         return _key in self._data
@@ -75,7 +98,23 @@ class _ReadableDict(object):
 
 
 class TableRecord(_ReadableDict):
-    """One element-table row: `id` + typed built-in columns + `custom_values` / `custom_links` bags."""
+    """One element-table row: `id` + typed built-in columns + `custom_values` / `custom_links` bags.
+
+    An attribute is read from the built-in columns first, then the `custom_values` bag.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, _name):
+        # type: (str) -> Any
+        if _name.startswith("_"):
+            raise AttributeError(_name)
+        if _name in self._data:
+            return self._data[_name]
+        custom_values = self._data.get("custom_values") or {}
+        if _name in custom_values:
+            return custom_values[_name]
+        raise AttributeError("'{}' has no field '{}'".format(self.__class__.__name__, _name))
 
     @property
     def id(self):
@@ -90,5 +129,45 @@ class TableRecord(_ReadableDict):
 class FieldDef(_ReadableDict):
     """One field definition: `field_key`, `display_name`, `field_type`, `config`, `origin`, ..."""
 
+    __slots__ = ()
+
     def __repr__(self):
         return "FieldDef({} [{}])".format(self._data.get("field_key"), self._data.get("field_type"))
+
+
+class TablePreview(object):
+    """The route-5 payload as indented, truncated JSON text, for the `json_preview_` output.
+
+    Holds the raw payload lists (no copy) and renders them only when the text is
+    first asked for (ie: when a GH panel displays it), so a solve whose preview is
+    never looked at pays nothing for it. Only the first `MAX_RECORDS` records are
+    rendered; the number left out is given as `records_not_shown`.
+    """
+
+    MAX_RECORDS = 100
+
+    def __init__(self, _records, _field_defs):
+        # type: (list[dict], list[dict]) -> None
+        self.records = _records
+        self.field_defs = _field_defs
+        self._text = None  # type: str | None
+
+    def text(self):
+        # type: () -> str
+        if self._text is None:
+            preview = OrderedDict([("records", self.records[: self.MAX_RECORDS])])
+            if len(self.records) > self.MAX_RECORDS:
+                preview["records_not_shown"] = len(self.records) - self.MAX_RECORDS
+            preview["field_defs"] = self.field_defs
+            self._text = json.dumps(preview, indent=2, ensure_ascii=False)
+        return self._text
+
+    def __str__(self):
+        return self.text()
+
+    def __repr__(self):
+        return "{}({} records, {} field defs)".format(self.__class__.__name__, len(self.records), len(self.field_defs))
+
+    def ToString(self):
+        # -- GH calls .NET `ToString()` when displaying an object on the canvas.
+        return self.text()
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""HTTP transports for `PHNavV1Client`.
+
+The client sends every request through a transport object with a single method::
+
+    transport.get(url, headers) -> HTTPResponse
+
+which returns the response for ANY HTTP status (the client turns 4xx / 5xx into
+readable errors) and raises `PHNavTransportError` only when there is no HTTP
+response at all (DNS failure, connection refused, timeout, ...).
+
+- `DotNetTransport` is the transport used on the canvas. All instances share ONE
+  keep-alive `System.Net.Http.HttpClient`, so the TLS connection to the server is
+  reused across requests, clients and component solves, and responses are
+  gzip / deflate compressed on the wire.
+- `PythonTransport` is a plain-Python (`urllib`) stand-in, so the client can be run
+  against a local stub server outside of Rhino. It is not used on the canvas.
+"""
+
+import threading
+from collections import namedtuple
+
+try:
+    from typing import Any  # noqa: F401
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    import clr  # type: ignore
+
+    clr.AddReference("System.Net.Http")
+    import System  # type: ignore
+    import System.Net  # type: ignore
+    import System.Net.Http  # type: ignore
+except ImportError:
+    pass  # Outside Rhino
+
+try:
+    from urllib2 import HTTPError, Request, URLError, urlopen  # type: ignore
+except ImportError:
+    from urllib.error import HTTPError, URLError  # Python 3
+    from urllib.request import Request, urlopen
+
+
+# -- One HTTP response. `body` is None for a 304 (Not Modified). `etag` / `http_last_modified`
+# -- are the response's validator headers (distinct from the envelope's `last_modified`).
+HTTPResponse = namedtuple("HTTPResponse", ["status", "body", "etag", "http_last_modified"])
+
+
+class PHNavTransportError(Exception):
+    """No HTTP response was received (DNS failure, connection refused, timeout, ...)."""
+
+
+class DotNetTransport(object):
+    """`System.Net.Http` transport: one shared, keep-alive, decompressing `HttpClient`."""
+
+    # -- Shared by every instance. `HttpClient` is built to be created once and
+    # -- reused: a new client per request would re-do the TCP + TLS handshake.
+    _http_client = None  # type: System.Net.Http.HttpClient | None
+    _http_client_lock = threading.Lock()
+
+    # -- .NET Framework allows only 2 connections per server by default, which
+    # -- would serialize concurrent (snapshot) requests.
+    MIN_CONNECTION_LIMIT = 8
+
+    @classmethod
+    def http_client(cls):
+        # type: () -> System.Net.Http.HttpClient
+        """Return the shared `HttpClient`, building it on first use."""
+        with cls._http_client_lock:
+            if cls._http_client is None:
+                cls._http_client = cls._build_http_client()
+        return cls._http_client
+
+    @classmethod
+    def _build_http_client(cls):
+        # type: () -> System.Net.Http.HttpClient
+        """Build the `HttpClient`: TLS 1.2, a raised connection limit and gzip / deflate decompression."""
+        try:
+            System.Net.ServicePointManager.SecurityProtocol = System.Net.SecurityProtocolType.Tls12
+        except AttributeError:
+            pass  # -- TLS 1.2 is not provided by MacOS .NET in Rhino 5 (see `get`)
+        if System.Net.ServicePointManager.DefaultConnectionLimit < cls.MIN_CONNECTION_LIMIT:
+            System.Net.ServicePointManager.DefaultConnectionLimit = cls.MIN_CONNECTION_LIMIT
+
+        handler = System.Net.Http.HttpClientHandler()
+        handler.AutomaticDecompression = System.Net.DecompressionMethods.GZip | System.Net.DecompressionMethods.Deflate
+        return System.Net.Http.HttpClient(handler)
+
+    def get(self, _url, _headers):
+        # type: (str, dict) -> HTTPResponse
+        """GET the URL with the given request headers."""
+        if _url.lower().startswith("https") and not hasattr(System.Net.SecurityProtocolType, "Tls12"):
+            raise PHNavTransportError("This system lacks the necessary security libraries to download over https.")
+
+        request = System.Net.Http.HttpRequestMessage(System.Net.Http.HttpMethod.Get, _url)
+        for name, value in _headers.items():
+            request.Headers.TryAddWithoutValidation(name, value)
+
+        response = None
+        try:
+            try:
+                response = self.http_client().SendAsync(request).Result
+            except System.AggregateException as e:
+                raise PHNavTransportError(e.GetBaseException().Message)
+
+            status = int(response.StatusCode)
+            if status == 304:
+                return HTTPResponse(status, None, None, None)
+
+            etag = response.Headers.ETag
+            last_modified = response.Content.Headers.LastModified
+            return HTTPResponse(
+                status,
+                response.Content.ReadAsStringAsync().Result,
+                etag.ToString() if etag is not None else None,
+                last_modified.ToString("r") if last_modified is not None else None,
+            )
+        finally:
+            if response is not None:
+                response.Dispose()
+            request.Dispose()
+
+
+class PythonTransport(object):
+    """Plain-Python (`urllib`) transport, to run the client against a local stub server.
+
+    A test double only: no connection reuse and no compression.
+    """
+
+    def __init__(self, _timeout=100):
+        # type: (float) -> None
+        self.timeout = _timeout
+
+    def get(self, _url, _headers):
+        # type: (str, dict) -> HTTPResponse
+        """GET the URL with the given request headers."""
+        try:
+            response = urlopen(Request(_url, headers=_headers), timeout=self.timeout)
+        except HTTPError as e:
+            # -- A 304 / 4xx / 5xx is still an HTTP response.
+            response = e
+        except URLError as e:
+            raise PHNavTransportError(str(e.reason))
+
+        try:
+            status = response.getcode()
+            if status == 304:
+                return HTTPResponse(status, None, None, None)
+            headers = response.info()
+            return HTTPResponse(
+                status,
+                response.read().decode("utf-8"),
+                headers.get("ETag"),
+                headers.get("Last-Modified"),
+            )
+        finally:
+            response.close()
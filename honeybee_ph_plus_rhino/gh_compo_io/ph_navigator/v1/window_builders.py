@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Interning build pipeline for the PH-Navigator V1 aperture types (route 3).
+
+Builds the same glazing / frame-element / construction collections as the frozen
+V0 helpers (`v0/window_types_get.py`), but the V0 helpers build a new
+`PhWindowGlazing` / `PhWindowFrameElement` for EVERY element, and re-run the
+ISO 10077-1 U-w calculation for every element, even though a project's window types
+typically share a handful of glazing and frame types. Here a `WindowTypeInterner`
+builds each of those once per unique (normalized, schema-parsed) definition::
+
+    interner = WindowTypeInterner()
+    glazing_types = create_hbph_glazing_types(aperture_types, interner)
+    frame_elements = create_new_hbph_frame_elements(aperture_types, interner)
+    frame_types = create_new_hbph_frames(aperture_types, frame_elements)  # -- V0
+    constructions = create_hbph_ep_constructions(aperture_types, glazing_types, frame_types, interner)
+
+The output collections are unchanged (same names, same objects-per-name, same U-w
+values): V0 already shared one glazing / frame-element object per name across the
+constructions, the interner only stops building (and discarding) the duplicates.
+The V0 `create_new_hbph_frames` / `create_hbph_window_unit_types` are still used
+as-is: each `PhWindowFrame` is named for its element, so there is nothing to share.
+"""
+
+try:
+    from typing import Any  # noqa: F401
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee_energy.construction.window import WindowConstruction
+    from honeybee_energy.material.glazing import EnergyWindowMaterialSimpleGlazSys
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_energy. {}".format(e))
+
+try:
+    from honeybee_energy_ph.construction.window import PhWindowFrame  # noqa: F401
+    from honeybee_energy_ph.construction.window import PhWindowFrameElement, PhWindowGlazing
+    from honeybee_energy_ph.properties.construction.window import WindowConstructionPhProperties  # noqa: F401
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_energy_ph:\n\t{}".format(e))
+
+try:
+    from honeybee_ph_utils import iso_10077_1
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_utils:\n\t{}".format(e))
+
+try:
+    from honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.window_types_schema import (
+        ApertureTypeData,
+        FrameType,
+        GlazingType,
+    )
+except ImportError as e:
+    raise ImportError("\nFailed to import from honeybee_ph_plus_rhino {}".format(e))
+
+
+class WindowTypeInterner(object):
+    """The HBPH glazings, frame-elements and window U-w values, built once per unique definition.
+
+    Use one interner per build: the interned HBPH objects are shared by every
+    construction built with it.
+    """
+
+    def __init__(self):
+        self.glazings = {}  # type: dict[tuple, PhWindowGlazing]
+        self.frame_elements = {}  # type: dict[tuple, PhWindowFrameElement]
+        self.uw_values = {}  # type: dict[tuple, float]
+
+    @staticmethod
+    def glazing_key(_glazing_type):
+        # type: (GlazingType) -> tuple
+        return (_glazing_type.name, _glazing_type.u_value_w_m2k, _glazing_type.g_value)
+
+    @staticmethod
+    def frame_element_key(_frame_type):
+        # type: (FrameType) -> tuple
+        return (
+            _frame_type.name,
+            _frame_type.width_m,
+            _frame_type.u_value_w_m2k,
+            _frame_type.psi_g_w_mk,
+            _frame_type.psi_install_w_mk,
+            _frame_type.chi_value_w_k,
+        )
+
+    @staticmethod
+    def uw_key(_hbph_frame, _hbph_glazing):
+        # type: (PhWindowFrame, PhWindowGlazing) -> tuple
+        """The values `iso_10077_1.calculate_window_uw` reads from the frame and glazing."""
+        sides = (_hbph_frame.left, _hbph_frame.right, _hbph_frame.top, _hbph_frame.bottom)
+        return tuple((e.width, e.u_factor, e.psi_glazing, e.psi_install) for e in sides) + (_hbph_glazing.u_factor,)
+
+    def glazing(self, _glazing_type):
+        # type: (GlazingType) -> PhWindowGlazing
+        """Return the `PhWindowGlazing` for a glazing-type, building it on first use."""
+        key = self.glazing_key(_glazing_type)
+        hbph_glazing = self.glazings.get(key)
+        if hbph_glazing is None:
+            hbph_glazing = PhWindowGlazing(_glazing_type.name)
+            hbph_glazing.display_name = _glazing_type.name
+            hbph_glazing.u_factor = _glazing_type.u_value_w_m2k
+            hbph_glazing.g_value = _glazing_type.g_value
+            self.glazings[key] = hbph_glazing
+        return hbph_glazing
+
+    def frame_element(self, _frame_type):
+        # type: (FrameType) -> PhWindowFrameElement
+        """Return the `PhWindowFrameElement` for a frame-type, building it on first use."""
+        key = self.frame_element_key(_frame_type)
+        hbph_frame_element = self.frame_elements.get(key)
+        if hbph_frame_element is None:
+            hbph_frame_element = PhWindowFrameElement(_frame_type.name)
+            hbph_frame_element.display_name = _frame_type.name
+            hbph_frame_element.width = _frame_type.width_m
+            hbph_frame_element.u_factor = _frame_type.u_value_w_m2k
+            hbph_frame_element.psi_glazing = _frame_type.psi_g_w_mk
+            hbph_frame_element.psi_install = _frame_type.psi_install_w_mk
+            hbph_frame_element.chi_value = _frame_type.chi_value_w_k
+            self.frame_elements[key] = hbph_frame_element
+        return hbph_frame_element
+
+    def window_uw(self, _hbph_frame, _hbph_glazing):
+        # type: (PhWindowFrame, PhWindowGlazing) -> float
+        """Return the ISO 10077-1 U-w of the standard-size window, calculated once per unique frame + glazing."""
+        key = self.uw_key(_hbph_frame, _hbph_glazing)
+        uw = self.uw_values.get(key)
+        if uw is None:
+            uw = iso_10077_1.calculate_window_uw(_hbph_frame, _hbph_glazing)
+            self.uw_values[key] = uw
+        return uw
+
+
+def create_hbph_glazing_types(_aperture_types, _interner):
+    # type: (list[ApertureTypeData], WindowTypeInterner) -> dict[str, PhWindowGlazing]
+    """Create a collection of the HoneybeePH Glazing-Types from the PH-Navigator Aperture Types."""
+
+    glazing_types_ = {}  # type: dict[str, PhWindowGlazing]
+    for aperture_type in _aperture_types:
+        for element in aperture_type.elements:
+            if element.glazing is None:
+                continue
+
+            hbph_glazing = _interner.glazing(element.glazing.glazing_type)
+            glazing_types_[hbph_glazing.display_name] = hbph_glazing
+
+    return glazing_types_
+
+
+def create_new_hbph_frame_elements(_aperture_types, _interner):
+    # type: (list[ApertureTypeData], WindowTypeInterner) -> dict[str, PhWindowFrameElement]
+    """Create a collection of the HoneybeePH Frame-Element-Types from the PH-Navigator Aperture Types."""
+
+    frame_element_types_ = {}  # type: dict[str, PhWindowFrameElement]
+    for aperture_type in _aperture_types:
+        for element in aperture_type.elements:
+            for frame_data in element.frames.get_all_frames():
+                # -- Same (name-based) skip as the V0 helper, so the collections match.
+                if frame_data.name in frame_element_types_:
+                    continue
+
+                if not frame_data.frame_type:
+                    continue
+
+                hbph_frame_element = _interner.frame_element(frame_data.frame_type)
+                frame_element_types_[hbph_frame_element.display_name] = hbph_frame_element
+
+    return frame_element_types_
+
+
+def create_new_hbph_window_material(_display_name, _hbph_frame, _hbph_glazing, _interner):
+    # type: (str, PhWindowFrame, PhWindowGlazing, WindowTypeInterner) -> EnergyWindowMaterialSimpleGlazSys
+    """Create a new HB Simple Window Material and set the NFRC/HBmaterial properties"""
+
+    nfrc_u_factor = _interner.window_uw(_hbph_frame, _hbph_glazing)
+    nfrc_shgc = _hbph_glazing.g_value
+    t_vis = 0.6
+    window_mat = EnergyWindowMaterialSimpleGlazSys(_display_name, nfrc_u_factor, nfrc_shgc, t_vis)
+    window_mat.display_name = _display_name
+    return window_mat
+
+
+def create_hbph_ep_constructions(_aperture_types, _glazing_types, _frame_types, _interner):
+    # type: (list[ApertureTypeData], dict[str, PhWindowGlazing], dict[str, PhWindowFrame], WindowTypeInterner) -> dict[str, WindowConstruction]
+    """Create the HoneybeePH EP-Constructions for the Window Types."""
+
+    constructions_ = {}  # type: dict[str, WindowConstruction]
+    for aperture_type in _aperture_types:
+        for element in aperture_type.elements:
+            hbph_frame = _frame_types.get(element.type_name, None)
+            if hbph_frame is None:
+                continue
+
+            hbph_glazing = _glazing_types.get(element.glazing.glazing_type.name, None)
+            if hbph_glazing is None:
+                continue
+
+            hbph_mat = create_new_hbph_window_material(element.type_name, hbph_frame, hbph_glazing, _interner)
+            hb_win_construction = WindowConstruction(element.type_name, [hbph_mat])
+
+            prop_ph = getattr(hb_win_construction.properties, "ph")  # type: WindowConstructionPhProperties
+            prop_ph.ph_frame = hbph_frame
+            prop_ph.ph_glazing = hbph_glazing
+
+            constructions_[hb_win_construction.display_name] = hb_win_construction
+
+    return constructions_
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""SI -> IP Unit-Conversion table, used by the CSV writers."""
+
+from dataclasses import dataclass
+from typing import Hashable, Iterable
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class UnitConversion:
+    """An SI -> IP unit conversion: IP = SI * factor / divisor + offset"""
+
+    ip_unit: str
+    factor: float = 1.0
+    divisor: float = 1.0
+    offset: float = 0.0
+
+
+# -- Keyed by the SI unit
+SI_TO_IP: dict[str, UnitConversion] = {
+    "m": UnitConversion("ft", factor=3.280839895),
+    "mm": UnitConversion("inches", factor=0.039370079),
+    "m2": UnitConversion("ft2", factor=10.76391042),
+    "m3": UnitConversion("ft3", factor=35.31466672),
+    "m3/h": UnitConversion("cfm", factor=0.588577779),
+    "m3/hm2": UnitConversion("cfm/ft2", factor=0.054680665),
+    "kWh/m2": UnitConversion("kWh/ft2", divisor=10.76391042),
+    "C": UnitConversion("F", factor=9 / 5, offset=32),
+}
+
+
+def convert_rows_to_ip(
+    _df: pd.DataFrame,
+    _si_units: dict[Hashable, str],
+    _data_columns: Iterable[Hashable] | None = None,
+) -> pd.DataFrame:
+    """Convert rows of a DataFrame from SI to IP units, in place, as a single whole-frame operation.
+
+    Arguments:
+    ----------
+        * _df (pd.DataFrame): The DataFrame to convert.
+        * _si_units (dict[Hashable, str]): The SI unit of each row to convert, by row label.
+            Rows not included are left unchanged.
+        * _data_columns (Iterable[Hashable] | None): The columns with the values to convert.
+            If None, all columns except 'Datatype' and 'Units' are converted. Default=None.
+
+    Returns:
+    --------
+        * (pd.DataFrame): The input DataFrame, with the rows converted. If the DataFrame has
+            a 'Units' column, it is updated with the new IP-unit labels.
+    """
+    if not _si_units:
+        return _df
+
+    conversions = [SI_TO_IP[si_unit] for si_unit in _si_units.values()]
+    factors = np.array([[c.factor] for c in conversions])
+    divisors = np.array([[c.divisor] for c in conversions])
+    offsets = np.array([[c.offset] for c in conversions])
+
+    if _data_columns is None:
+        data_columns = [c for c in _df.columns if c not in ("Datatype", "Units")]
+    else:
+        data_columns = list(_data_columns)
+
+    row_positions = _df.index.get_indexer(list(_si_units.keys()))
+    col_positions = _df.columns.get_indexer(data_columns)
+    si_values = _df.iloc[row_positions, col_positions].to_numpy()
+    _df.iloc[row_positions, col_positions] = si_values * factors / divisors + offsets
+    if "Units" in _df.columns:
+        _df.iloc[row_positions, _df.columns.get_loc("Units")] = [c.ip_unit for c in conversions]
+
+    return _df
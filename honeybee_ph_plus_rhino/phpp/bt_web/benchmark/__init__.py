@@ -0,0 +1 @@
+"""Synthetic PHPP data and timing benchmarks for the bt_web CSV pipeline."""
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Generate synthetic raw PHPP CSV files (Variants, Climate, Room-Ventilation) of any size.
+
+The files mimic the layout written by the 'read_phpp_data_*.py' scripts so that they
+can be passed through the full 'process_phpp_csv_data.py' pipeline.
+"""
+
+import csv
+import random
+from pathlib import Path
+
+from honeybee_ph_plus_rhino.phpp.bt_web._variants_data_schema import VARIANTS
+
+# -- The first / last Excel row of the PHPP 'Variants' worksheet data.
+FIRST_VARIANTS_ROW = 11
+LAST_VARIANTS_ROW = VARIANTS.primary_energy_renewable.end_row()
+
+# -- Rows which hold text values, not numbers.
+TEXT_FIELDS = {
+    "Ventilation System": ["1-Balanced PH ventilation with HR", "2-Extract air only"],
+    "Heating System": ["Heat pump(s)", "Direct electricity"],
+    "Cooling System": ["Elec. Heat Pump", "None"],
+    "DHW System": ["Heat pump(s)", "Direct electricity"],
+    "Certification Compliant?": ["Yes", "No"],
+}
+
+SECTION_UNITS = {
+    "geometry": "m2",
+    "envelope": "W/m2K",
+    "systems": "-",
+    "certification_limits": "kWh/m2",
+    "heating_demand": "kWh",
+    "cooling_demand": "kWh",
+    "site_energy": "kWh",
+    "primary_energy": "kWh",
+    "certification_results": "kWh/m2",
+    "airtightness": "-",
+    "r_values": "m2K/W",
+    "certification_compliant": "-",
+    "peak_loads": "W",
+    "co2e": "kg",
+    "primary_energy_renewable": "kWh",
+}
+
+CLIMATE_ROWS = [
+    "Radiation North",
+    "Radiation East",
+    "Radiation South",
+    "Radiation West",
+    "Horizontal radiation",
+    "Exterior temperature",
+    "Dew point temperature",
+    "Sky temperature",
+]
+
+
+def write_variants_csv(_file_path: Path, _num_variants: int, _seed: int = 1) -> Path:
+    """Write out a synthetic PHPP 'Variants' CSV file.
+
+    Arguments:
+    ----------
+        * _file_path (Path): The CSV file path to write to.
+        * _num_variants (int): The number of Variant columns to create.
+        * _seed (int): The random-number seed. Default=1
+
+    Returns:
+    --------
+        * (Path): The CSV file path.
+    """
+    rnd = random.Random(_seed)
+    variant_names = [f"Variant {i}" for i in range(_num_variants)]
+
+    # -- Rows above the schema are filled with arbitrary numeric data
+    rows: dict[int, list] = {}
+    for row_num in range(FIRST_VARIANTS_ROW, VARIANTS.geometry.start_row()):
+        rows[row_num] = [f"Data {row_num}", "-"] + [round(rnd.uniform(0, 100), 6) for _ in variant_names]
+
+    for section_name, section in vars(VARIANTS).items():
+        for i, field in enumerate(section.rows):
+            if not field.field_name.strip():
+                rows[field.row] = ["", ""] + ["" for _ in variant_names]
+            elif i == 0 or field.field_name == "-":
+                rows[field.row] = [field.field_name, "-"] + ["" for _ in variant_names]
+            elif field.field_name in TEXT_FIELDS:
+                options = TEXT_FIELDS[field.field_name]
+                rows[field.row] = [field.field_name, "-"] + [rnd.choice(options) for _ in variant_names]
+            else:
+                values = [round(rnd.uniform(1, 1_000), 6) for _ in variant_names]
+                rows[field.row] = [field.field_name, SECTION_UNITS[section_name]] + values
+
+    with open(_file_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([""] + [str(i) for i in range(4 + _num_variants)])
+        writer.writerow([0, "Datatype", "Units", "Ref", "Col"] + variant_names)
+        writer.writerow([1, "", "", "", ""] + ["" for _ in variant_names])
+        for row_num in range(FIRST_VARIANTS_ROW, LAST_VARIANTS_ROW + 1):
+            datatype, units, *values = rows[row_num]
+            writer.writerow([row_num - 9, datatype, units, "", ""] + values)
+
+    return _file_path
+
+
+def write_climate_csv(_file_path: Path, _seed: int = 1) -> Path:
+    """Write out a synthetic PHPP 'Climate' CSV file with 12 months of data.
+
+    Arguments:
+    ----------
+        * _file_path (Path): The CSV file path to write to.
+        * _seed (int): The random-number seed. Default=1
+
+    Returns:
+    --------
+        * (Path): The CSV file path.
+    """
+    rnd = random.Random(_seed)
+    with open(_file_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([""] + [str(i) for i in range(13)])
+        for i, row_name in enumerate(CLIMATE_ROWS):
+            writer.writerow([i, row_name] + [round(rnd.uniform(-10, 150), 4) for _ in range(12)])
+    return _file_path
+
+
+def write_room_vent_csv(_file_path: Path, _num_rooms: int, _seed: int = 1) -> Path:
+    """Write out a synthetic PHPP 'Room-Ventilation' CSV file.
+
+    Arguments:
+    ----------
+        * _file_path (Path): The CSV file path to write to.
+        * _num_rooms (int): The number of rooms to create.
+        * _seed (int): The random-number seed. Default=1
+
+    Returns:
+    --------
+        * (Path): The CSV file path.
+    """
+    rnd = random.Random(_seed)
+    with open(_file_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([""] + [str(i) for i in range(20)])
+        for i in range(3):
+            writer.writerow([i] + ["-"] * 20)
+        for i in range(_num_rooms):
+            area = round(rnd.uniform(5, 50), 3)
+            writer.writerow(
+                [
+                    i + 3,
+                    "",
+                    1,  # Amount
+                    f"{i + 1:03d}-Room",
+                    1,  # Allocation to Vent Unit
+                    area,
+                    2.5,  # Clear height
+                    round(area * 2.5, 3),
+                    round(rnd.uniform(0, 60), 3),  # V_Supply
+                    round(rnd.uniform(0, 60), 3),  # V_Extract
+                    0,  # V_Transmission
+                    0.5,
+                    24,
+                    7,
+                    0,
+                    1.0,
+                    0.77,
+                    0.5,
+                    0.2,
+                    0.3,
+                    0.03,
+                ]
+            )
+    return _file_path
+
+
+def write_fixture_csvs(_folder: Path, _num_variants: int, _num_rooms: int = 20) -> tuple[Path, Path, Path]:
+    """Write out a full set of synthetic raw PHPP CSV files to a folder.
+
+    Arguments:
+    ----------
+        * _folder (Path): The folder to write the CSV files to.
+        * _num_variants (int): The number of Variant columns to create.
+        * _num_rooms (int): The number of Room-Ventilation rows to create. Default=20
+
+    Returns:
+    --------
+        * tuple[Path, Path, Path]:
+            * [0]: The path to the Variant Data CSV File
+            * [1]: The path to the Climate Data CSV File
+            * [2]: The path to the Room-Ventilation Data CSV File
+    """
+    _folder.mkdir(parents=True, exist_ok=True)
+    return (
+        write_variants_csv(_folder / "phpp_data_variants.csv", _num_variants),
+        write_climate_csv(_folder / "phpp_data_climate.csv"),
+        write_room_vent_csv(_folder / "phpp_data_room_ventilation.csv", _num_rooms),
+    )
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Time each step of the bt_web PHPP-CSV pipeline against synthetic data.
+
+Run from the repository root:
+
+    python -m honeybee_ph_plus_rhino.phpp.bt_web.benchmark.run_benchmarks [options]
+
+Options:
+    * --variants (int...): The dataset sizes (number of Variants) to time. Default=5 20 100
+    * --baseline (str): The JSON baseline file to compare against / save to.
+    * --save: Save the new timings as the baseline (instead of comparing).
+    * --threshold (float): The allowed slowdown before failing, as a fraction. Default=0.25
+    * --min-delta (float): Slowdowns smaller than this (ms) are treated as timing noise. Default=2.0
+    * --repeat (int): The number of times to run each step (the best time is kept). Default=5
+
+When comparing, the script exits with code 1 if any step is slower than its baseline
+by more than the threshold. Baselines are machine-specific, so save a new one on
+each machine before comparing.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import timeit
+import warnings
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+from honeybee_ph_plus_rhino.phpp.bt_web import process_phpp_csv_data as process
+from honeybee_ph_plus_rhino.phpp.bt_web._types import PHPPData
+from honeybee_ph_plus_rhino.phpp.bt_web.benchmark.fixtures import write_fixture_csvs
+from honeybee_ph_plus_rhino.phpp.bt_web.write_csv import csv_writers
+from honeybee_ph_plus_rhino.phpp.bt_web.write_csv.csv_writers import heating_and_cooling
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines.json"
+
+# -- A benchmark step: a function which takes the PHPPData and a folder to write to.
+Step = Callable[[PHPPData, Path], object]
+
+
+def _climate(_data: PHPPData, _folder: Path) -> None:
+    csv_writers.create_csv_radiation(_data.df_climate, _folder / "climate_radiation.csv")
+    csv_writers.create_csv_temperatures(_data.df_climate, _folder / "climate_temps.csv")
+
+
+def _heating_and_cooling(_data: PHPPData, _folder: Path) -> None:
+    args = (_data.df_variants, _data.df_tfa, _data.df_certification_limits)
+    heating_and_cooling.create_csv_heating_and_cooling_demand(*args, _folder / "demand_HeatAndCool.csv")
+    heating_and_cooling.create_csv_heating_demand(*args, _folder / "demand_Phius_heating.csv")
+    heating_and_cooling.create_csv_cooling_demand(*args, _folder / "demand_Phius_cooling.csv")
+    heating_and_cooling.create_csv_heating_load(*args, _folder / "load_Phius_heating.csv")
+    heating_and_cooling.create_csv_cooling_load(*args, _folder / "load_Phius_cooling.csv")
+
+
+# -- The 'csv_writers' modules, one step each
+WRITER_STEPS: dict[str, Step] = {
+    "write.airtightness": lambda d, f: csv_writers.create_csv_airtightness(d.df_variants, f / "airflow.csv"),
+    "write.bldg_data_basics": lambda d, f: csv_writers.create_csv_bldg_basic_data_table(d.df_variants, f / "bldg.csv"),
+    "write.climate": _climate,
+    "write.co2e": lambda d, f: csv_writers.create_csv_CO2E(d.df_variants, f / "co2e.csv"),
+    "write.demand_cooling_dtl": lambda d, f: csv_writers.create_csv_detailed_cooling_demand(
+        d.df_variants, d.df_certification_limits, f / "cooling_demand.csv"
+    ),
+    "write.demand_heating_dtl": lambda d, f: csv_writers.create_csv_detailed_heating_demand(
+        d.df_variants, d.df_certification_limits, f / "heating_demand.csv"
+    ),
+    "write.heating_and_cooling": _heating_and_cooling,
+    "write.mech": lambda d, f: csv_writers.create_csv_fresh_air_flowrates(d.df_room_vent, f / "room_airflows.csv"),
+    "write.per": lambda d, f: csv_writers.create_csv_PER(d.df_variants, f / "per.csv"),
+    "write.phius_net_source": lambda d, f: csv_writers.create_csv_Phius_net_source_energy(
+        d.df_variants, d.df_certification_limits, f / "net_source.csv"
+    ),
+    "write.site_energy": lambda d, f: csv_writers.create_csv_SiteEnergy(d.df_variants, f / "site.csv"),
+    "write.variant_table": lambda d, f: csv_writers.create_csv_variant_table(
+        d.df_variants, d.variant_names, f / "variant_inputs.csv"
+    ),
+}
+
+
+def best_time(_func: Callable[[], object], _setup: Callable[[], object] = lambda: None, _repeat: int = 5) -> float:
+    """Return the best (minimum) run time of the function, in seconds.
+
+    The setup function is called before each run, outside of the timing.
+    """
+    times = []
+    for _ in range(_repeat):
+        _setup()
+        times.append(timeit.timeit(_func, number=1))
+    return min(times)
+
+
+def time_dataset(_num_variants: int, _repeat: int) -> dict[str, float]:
+    """Time each pipeline step for a synthetic dataset with the given number of Variants.
+
+    Arguments:
+    ----------
+        * _num_variants (int): The number of Variants in the synthetic dataset.
+        * _repeat (int): The number of times to run each step.
+
+    Returns:
+    --------
+        * dict[str, float]: The best run time (seconds) of each step, by step name.
+    """
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        variants_csv, climate_csv, room_vent_csv = write_fixture_csvs(folder / "raw", _num_variants)
+        raw_variants = pd.read_csv(variants_csv)
+        raw_climate = pd.read_csv(climate_csv)
+        raw_room_vent = pd.read_csv(room_vent_csv)
+
+        # -- Clean-up steps, each is given a new copy of the raw data
+        inputs = {}
+
+        def setup() -> None:
+            inputs.update(variants=raw_variants.copy(), climate=raw_climate.copy(), vent=raw_room_vent.copy())
+
+        results["clean_variants_df"] = best_time(lambda: process.clean_variants_df(inputs["variants"]), setup, _repeat)
+        results["clean_climate_df"] = best_time(lambda: process.clean_climate_df(inputs["climate"]), setup, _repeat)
+        results["clean_room_vent_df"] = best_time(lambda: process.clean_room_vent_df(inputs["vent"]), setup, _repeat)
+        results["convert_to_numeric"] = best_time(lambda: process.convert_to_numeric(inputs["variants"]), setup, _repeat)
+
+        data = process.load_phpp_data(variants_csv, climate_csv, room_vent_csv)
+        results["get_tfa_as_df"] = best_time(lambda: process.get_tfa_as_df(data.df_variants), _repeat=_repeat)
+        results["get_absolute_certification_limits_as_df"] = best_time(
+            lambda: process.get_absolute_certification_limits_as_df(data.df_variants), _repeat=_repeat
+        )
+
+        # -- CSV-Writer steps
+        out_folder = folder / "out"
+        out_folder.mkdir()
+        for step_name, step in WRITER_STEPS.items():
+            results[step_name] = best_time(lambda: step(data, out_folder), _repeat=_repeat)
+
+    return results
+
+
+def compare_to_baseline(
+    _results: dict[str, dict[str, float]],
+    _baseline: dict[str, dict[str, float]],
+    _threshold: float,
+    _min_delta: float = 0.002,
+) -> list[str]:
+    """Return a list of messages for any steps slower than the baseline by more than the threshold.
+
+    Arguments:
+    ----------
+        * _results (dict[str, dict[str, float]]): The new timings (seconds), by dataset and step name.
+        * _baseline (dict[str, dict[str, float]]): The baseline timings (seconds), by dataset and step name.
+        * _threshold (float): The allowed slowdown, as a fraction of the baseline time.
+        * _min_delta (float): Slowdowns smaller than this (seconds) are ignored as noise. Default=0.002
+
+    Returns:
+    --------
+        * list[str]: A message for each step which is too slow.
+    """
+    failures = []
+    for dataset_name, steps in _results.items():
+        for step_name, seconds in steps.items():
+            baseline_seconds = _baseline.get(dataset_name, {}).get(step_name)
+            if baseline_seconds is None:
+                continue
+            if seconds - baseline_seconds < _min_delta:
+                continue
+            if seconds > baseline_seconds * (1 + _threshold):
+                failures.append(
+                    f"{dataset_name} | {step_name}: {seconds * 1_000:.2f} ms "
+                    f"(baseline {baseline_seconds * 1_000:.2f} ms, +{seconds / baseline_seconds - 1:.0%})"
+                )
+    return failures
+
+
+def resolve_arguments(_args: list[str]) -> argparse.Namespace:
+    """Get all the script arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the bt_web PHPP-CSV pipeline.")
+    parser.add_argument("--variants", type=int, nargs="+", default=[5, 20, 100])
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--min-delta", type=float, default=2.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args(_args)
+
+
+if __name__ == "__main__":
+    args = resolve_arguments(sys.argv[1:])
+    warnings.simplefilter("ignore")
+
+    results: dict[str, dict[str, float]] = {}
+    for num_variants in args.variants:
+        dataset_name = f"{num_variants}_variants"
+        print(f"Timing dataset: {dataset_name}")
+        results[dataset_name] = time_dataset(num_variants, args.repeat)
+        for step_name, seconds in results[dataset_name].items():
+            print(f"  {step_name:<45} {seconds * 1_000:>10.2f} ms")
+
+    if args.save:
+        args.baseline.write_text(json.dumps(results, indent=2))
+        print(f"Saved baseline to: {args.baseline}")
+        sys.exit(0)
+
+    if not args.baseline.exists():
+        print(f"No baseline found at: {args.baseline}. Run with --save to create one.")
+        sys.exit(0)
+
+    failures = compare_to_baseline(
+        results, json.loads(args.baseline.read_text()), args.threshold, args.min_delta / 1_000
+    )
+    if failures:
+        print(f"Slower than baseline by more than {args.threshold:.0%}:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print(f"All steps within {args.threshold:.0%} of the baseline.")
@@ -22,6 +22,10 @@ from honeybee_ph_plus_rhino.phpp.bt_web._variants_data_schema import VARIANTS
 from honeybee_ph_plus_rhino.phpp.bt_web.write_csv import generate_csv_files
 
 
+# -- Columns with repeated string labels, stored as categoricals.
+LABEL_COLUMNS = ["Datatype", "Units"]
+
+
 def convert_to_numeric(df: pd.DataFrame) -> pd.DataFrame:
     """Converts all columns in a DataFrame to numeric values where possible."""
     for col in df.columns:
@@ -29,6 +33,38 @@ def convert_to_numeric(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def compact_dtypes(_df: pd.DataFrame, _label_columns: list[str] | None = None) -> pd.DataFrame:
+    """Store a cleaned PHPP DataFrame using memory-lean dtypes.
+
+    Label columns are converted to categoricals, and any 'object' column which
+    holds only numbers is converted to a float64 column. Float values are kept
+    at float64 since the CSV writers apply unit-conversion factors to them and
+    any lower precision would change the digits written to the output files.
+
+    Arguments:
+    ----------
+        * _df (pd.DataFrame): The cleaned DataFrame to compact.
+        * _label_columns (list[str] | None): The names of the label columns to store
+            as categoricals. Default=None (no label columns).
+
+    Returns:
+    --------
+        * (pd.DataFrame): A new DataFrame with the compacted dtypes.
+    """
+    columns = []
+    for _, column in _df.items():
+        if column.name in (_label_columns or []):
+            column = column.astype("category")
+        elif column.dtype == object:
+            numeric = pd.to_numeric(column, errors="coerce")
+            if numeric.isna().equals(column.isna()):
+                column = numeric.astype("float64")
+        columns.append(column)
+
+    # -- Build the new DataFrame in one go so the original object-blocks are released
+    return pd.concat(columns, axis=1)
+
+
 def clean_climate_df(_climate_df: pd.DataFrame) -> pd.DataFrame:
     # -- Drop the first column
     climate_df_ = _climate_df.drop(_climate_df.columns[0], axis=1)
@@ -131,16 +167,13 @@ def get_absolute_certification_limits_as_df(
     tfa_df = get_tfa_as_df(_df_main)
 
     # Calc the total limits (not .../m2 results for certification values)
-    cert_limits_abs = pd.DataFrame()
-    for variant in cert_limits_specific.columns[:2]:  # Data ID cols
-        cert_limits_abs[variant] = cert_limits_specific[variant]
-
-    cert_limits_abs["Units"] = cert_limits_specific["Units"].str.replace(
-        "/m2", ""
-    )  # 'm2' strings
-
-    for variant in cert_limits_specific.columns[2:]:  # The data cols
-        cert_limits_abs[variant] = cert_limits_specific[variant].mul(tfa_df[variant])
+    # -- Build all the columns at once, rather than inserting them one by one.
+    id_cols = cert_limits_specific.columns[:2]  # Data ID cols
+    data_cols = cert_limits_specific.columns[2:]  # The data cols
+    cert_limits_id = cert_limits_specific[id_cols].astype(object)
+    cert_limits_id["Units"] = cert_limits_id["Units"].str.replace("/m2", "")  # 'm2' strings
+    cert_limits_data = cert_limits_specific[data_cols].mul(tfa_df[data_cols], axis="columns")
+    cert_limits_abs = pd.concat([cert_limits_id, cert_limits_data], axis=1)
 
     return cert_limits_abs
 
@@ -159,6 +192,38 @@ def get_variant_names_as_series(_df_main: pd.DataFrame) -> pd.Series:
     return pd.Series(_df_main.columns[2::])
 
 
+def load_phpp_data(
+    _variant_data_csv: Path, _climate_data_csv: Path, _room_vent_data_csv: Path
+) -> PHPPData:
+    """Read in the raw PHPP CSV files and build a new PHPPData object.
+
+    Arguments:
+    ----------
+        * _variant_data_csv (Path): The path to the Variant Data CSV File.
+        * _climate_data_csv (Path): The path to the Climate Data CSV File.
+        * _room_vent_data_csv (Path): The path to the Room-Ventilation Data CSV File.
+
+    Returns:
+    --------
+        * (PHPPData): A new PHPPData object with all the cleaned DataFrames.
+    """
+
+    print(f"Reading Data from: {_variant_data_csv}")
+    variant_df = compact_dtypes(clean_variants_df(pd.read_csv(_variant_data_csv)), LABEL_COLUMNS)
+
+    print(f"Reading Data from: {_climate_data_csv}")
+    climate_df = compact_dtypes(clean_climate_df(pd.read_csv(_climate_data_csv)))
+
+    print(f"Reading Data from: {_room_vent_data_csv}")
+    room_vent_df = compact_dtypes(clean_room_vent_df(pd.read_csv(_room_vent_data_csv)))
+
+    abs_cert_limits_df = get_absolute_certification_limits_as_df(variant_df)
+    tfa_df = get_tfa_as_df(variant_df)
+    variant_names = get_variant_names_as_series(variant_df)
+
+    return PHPPData(variant_df, climate_df, room_vent_df, abs_cert_limits_df, tfa_df, variant_names)
+
+
 def resolve_arguments(_args: list[str]) -> tuple[Path, Path, Path, Path]:
     """Get all the script arguments
 
@@ -208,21 +273,6 @@ if __name__ == "__main__":
     # room_vent_data_csv = Path("/Users/em/Dropbox/bldgtyp-00/00_PH_Tools/honeybee_grasshopper_ph_plus/honeybee_ph_plus_rhino/phpp/bt_web/test/phpp_data_room_ventilation.csv")
     # save_folder = Path("/Users/em/Desktop/test")
 
-    print(f"Reading Data from: {variant_data_csv}")
-    variant_df = clean_variants_df(pd.read_csv(variant_data_csv))
-
-    print(f"Reading Data from: {climate_data_csv}")
-    climate_df = clean_climate_df(pd.read_csv(climate_data_csv))
-
-    print(f"Reading Data from: {room_vent_data_csv}")
-    room_vent_df = clean_room_vent_df(pd.read_csv(room_vent_data_csv))
-
-    abs_cert_limits_df = get_absolute_certification_limits_as_df(variant_df)
-    tfa_df = get_tfa_as_df(variant_df)
-    variant_names = get_variant_names_as_series(variant_df)
-
-    phpp_data = PHPPData(
-        variant_df, climate_df, room_vent_df, abs_cert_limits_df, tfa_df, variant_names
-    )
+    phpp_data = load_phpp_data(variant_data_csv, climate_data_csv, room_vent_data_csv)
 
     generate_csv_files.create_csv_files(save_folder, phpp_data)
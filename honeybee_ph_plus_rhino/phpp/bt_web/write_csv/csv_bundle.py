@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Combine all of the web-dashboard CSV files into a single, compressed, columnar bundle file.
+
+The bundle is a gzipped JSON document so the web-dashboard can load every dataset
+with a single request. Each dataset is stored as a set of column-arrays:
+
+    {
+        "format": "bt_web-csv-bundle",
+        "version": 1,
+        "toc": [
+            {"name": "climate_temps", "file": "climate_temps.csv", "num_rows": 12, "columns": ["Month", ...]},
+            ...
+        ],
+        "datasets": {
+            "climate_temps": [["Jan", "Feb", ...], [23.2, 25.8, ...], ...],
+            ...
+        }
+    }
+
+A column-array is written as JSON numbers (blank cells become null) only if every
+cell in it reads back as exactly the same text: "12" and "0.25" are numbers, but
+"007", "1e3", "12.50" or "+5" would lose their text form as a number, so a column
+with any cell like those is written as strings, exactly as in the CSV. Only the CSV
+files written in the run are bundled, not any other .csv file in the folder.
+"""
+
+import csv
+import gzip
+import json
+from pathlib import Path
+from typing import Iterable
+
+BUNDLE_FORMAT = "bt_web-csv-bundle"
+BUNDLE_VERSION = 1
+BUNDLE_FILE_NAME = "phpp_data.json.gz"
+
+# -- The largest integer a JavaScript number holds exactly (2^53 - 1)
+MAX_SAFE_INTEGER = 9_007_199_254_740_991
+
+
+def _to_number(_value: str) -> int | float | None:
+    """Return the CSV cell as a number (None if blank).
+
+    Raises ValueError if it is not a number, or if the number would not be written
+    back as exactly the same text (ie: "007", "1e3", "12.50", "nan").
+    """
+    if _value == "":
+        return None
+    try:
+        number: int | float = int(_value)
+    except ValueError:
+        number = float(_value)
+    if json.dumps(number) != _value or (isinstance(number, int) and abs(number) > MAX_SAFE_INTEGER):
+        raise ValueError(f"Cannot store '{_value}' as a JSON number without changing it.")
+    return number
+
+
+def read_csv_columns(_csv_file: Path) -> tuple[list[str], list[list]]:
+    """Read a CSV file and return its header and its data as a list of column-arrays.
+
+    Arguments:
+    ----------
+        * _csv_file (Path): The CSV file to read.
+
+    Returns:
+    --------
+        * tuple[list[str], list[list]]:
+            * [0]: The column names (the CSV header row).
+            * [1]: The column-arrays, one for each column name.
+    """
+    with open(_csv_file, newline="") as f:
+        rows = list(csv.reader(f))
+
+    if not rows:
+        return [], []
+
+    header, data_rows = rows[0], rows[1:]
+    columns: list[list] = []
+    for i in range(len(header)):
+        column = [row[i] if i < len(row) else "" for row in data_rows]
+        try:
+            columns.append([_to_number(value) for value in column])
+        except ValueError:
+            columns.append(column)
+
+    return header, columns
+
+
+def create_csv_bundle(
+    _csv_file_path: Path, _csv_files: Iterable[Path], _bundle_file_name: str = BUNDLE_FILE_NAME
+) -> Path:
+    """Write the CSV files out to a single gzipped-JSON bundle file, in the CSV folder.
+
+    Arguments:
+    ----------
+        * _csv_file_path (Path): The folder with the CSV files.
+        * _csv_files (Iterable[Path]): The CSV files to bundle (the files written in this run).
+        * _bundle_file_name (str): The name of the bundle file to write. Default="phpp_data.json.gz"
+
+    Returns:
+    --------
+        * (Path): The path to the new bundle file.
+    """
+
+    toc = []
+    datasets = {}
+    for csv_file in sorted(set(_csv_files)):
+        header, columns = read_csv_columns(csv_file)
+        toc.append(
+            {
+                "name": csv_file.stem,
+                "file": csv_file.name,
+                "num_rows": len(columns[0]) if columns else 0,
+                "columns": header,
+            }
+        )
+        datasets[csv_file.stem] = columns
+
+    bundle = {"format": BUNDLE_FORMAT, "version": BUNDLE_VERSION, "toc": toc, "datasets": datasets}
+
+    # -- mtime=0 so the same data always gives the same bundle file
+    bundle_file = _csv_file_path / _bundle_file_name
+    with gzip.GzipFile(bundle_file, "wb", mtime=0) as f:
+        f.write(json.dumps(bundle, separators=(",", ":"), allow_nan=False).encode("utf-8"))
+
+    return bundle_file
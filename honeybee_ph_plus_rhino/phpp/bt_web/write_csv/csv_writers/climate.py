@@ -7,6 +7,30 @@ import pathlib
 
 import pandas as pd
 
+from honeybee_ph_plus_rhino.phpp.bt_web._unit_conversions import convert_rows_to_ip
+
+
+# -- The monthly-data column names
+CLIMATE_MONTHS = [
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "June",
+    "July",
+    "Aug",
+    "Sept",
+    "Oct",
+    "Nov",
+    "Dec",
+]
+
+
+def get_monthly_data_as_df(_df_climate: pd.DataFrame, _rows: list[str]) -> pd.DataFrame:
+    """Return a new DataFrame with just the monthly data (columns 1-13) of the specified rows."""
+    return _df_climate.loc[_rows].iloc[:, 1:13]
+
 
 def create_csv_radiation(_df_climate: pd.DataFrame, _output_path: pathlib.Path) -> None:
     """Creates the Radiation data CSV file based on the PHPP Climate DataFrame.
@@ -22,52 +46,24 @@ def create_csv_radiation(_df_climate: pd.DataFrame, _output_path: pathlib.Path)
     """
 
     # --------------------------------------------------------------------------
-    # Climate: Radiation
-    climate_col_names = [
-        "Jan",
-        "Feb",
-        "Mar",
-        "Apr",
-        "May",
-        "June",
-        "July",
-        "Aug",
-        "Sept",
-        "Oct",
-        "Nov",
-        "Dec",
-    ]
-    _df_climate.columns = ["Units"] + climate_col_names
-
-    # --------------------------------------------------------------------------
-    # Pull out the Radiation Data
-    rad_df1 = _df_climate.loc[
-        [
-            "Radiation North",
-            "Radiation East",
-            "Radiation South",
-            "Radiation West",
-            "Horizontal radiation",
-        ]
-    ]
-    rad_df2 = rad_df1.T
-
-    rad_df3 = rad_df2.drop("Units")
-
-    rad_series_converted = []
-    for each_col_name in rad_df3.columns:
-        newSeries = pd.Series(
-            rad_df3[each_col_name].values / 10.76391042
-        )  # kWh/m2---> kWh/ft2
-        rad_series_converted.append(newSeries)
-
-    rad_df4 = pd.DataFrame(rad_series_converted).T
-    rad_df4.columns = ["North", "East", "South", "West", "Horizontal"]
-    rad_df4.insert(loc=0, column="Month", value=climate_col_names)
+    # Pull out the Radiation Data, convert kWh/m2---> kWh/ft2
+    radiation_rows = {
+        "Radiation North": "North",
+        "Radiation East": "East",
+        "Radiation South": "South",
+        "Radiation West": "West",
+        "Horizontal radiation": "Horizontal",
+    }
+    rad_df1 = get_monthly_data_as_df(_df_climate, list(radiation_rows.keys()))
+    rad_df2 = convert_rows_to_ip(rad_df1, {row: "kWh/m2" for row in radiation_rows}, rad_df1.columns)
+
+    rad_df3 = rad_df2.T
+    rad_df3.columns = list(radiation_rows.values())
+    rad_df3.insert(loc=0, column="Month", value=CLIMATE_MONTHS)
 
     # --------------------------------------------------------------------------
     # Export to csv
-    rad_df4.to_csv(_output_path, index=False)
+    rad_df3.to_csv(_output_path, index=False)
 
 
 def create_csv_temperatures(
@@ -86,39 +82,14 @@ def create_csv_temperatures(
     """
 
     # --------------------------------------------------------------------------
-    # Climate: Temps
-    climate_col_names = [
-        "Jan",
-        "Feb",
-        "Mar",
-        "Apr",
-        "May",
-        "June",
-        "July",
-        "Aug",
-        "Sept",
-        "Oct",
-        "Nov",
-        "Dec",
-    ]
+    # Pull out the Temperature Data, convert C-->F
+    temperature_rows = ["Exterior temperature", "Dew point temperature", "Sky temperature"]
+    temps_df1 = get_monthly_data_as_df(_df_climate, temperature_rows)
+    temps_df2 = convert_rows_to_ip(temps_df1, {row: "C" for row in temperature_rows}, temps_df1.columns)
 
-    # --------------------------------------------------------------------------
-    # Pull out the Temperature Data
-    temps_df1 = _df_climate.loc[
-        ["Exterior temperature", "Dew point temperature", "Sky temperature"]
-    ]
-    temps_df2 = temps_df1.T
-    temps_df3 = temps_df2.drop("Units")
-
-    temps_series_converted = []
-    for each_col_name in temps_df3.columns:
-        newSeries = pd.Series(temps_df3[each_col_name].values * (9 / 5) + 32)  # C-->F
-        temps_series_converted.append(newSeries)
-
-    temps_df4 = pd.DataFrame(temps_series_converted).T
-    temps_df4.columns = temps_df3.columns
-    temps_df4.insert(loc=0, column="Month", value=climate_col_names)
+    temps_df3 = temps_df2.T
+    temps_df3.insert(loc=0, column="Month", value=CLIMATE_MONTHS)
 
     # --------------------------------------------------------------------------
     # Export to csv
-    temps_df4.to_csv(_output_path, index=False)
+    temps_df3.to_csv(_output_path, index=False)
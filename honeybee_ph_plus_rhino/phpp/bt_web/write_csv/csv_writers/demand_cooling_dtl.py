@@ -17,7 +17,7 @@ def clean_file_name(_filename: str) -> str:
 
 def create_csv_detailed_cooling_demand(
     _df_main: pd.DataFrame, _cert_limits_abs: pd.DataFrame, _output_path: pathlib.Path
-) -> None:
+) -> list[pathlib.Path]:
     """Creates the Annual Cooling Demand data CSV files for each Variant based on the PHPP Climate DataFrame.
 
     Arguments:
@@ -28,7 +28,7 @@ def create_csv_detailed_cooling_demand(
 
     Returns:
     --------
-        * None
+        * (list[pathlib.Path]): The paths of the CSV files written, one for each Variant.
     """
 
     # Create the Detailed Heating Demand CSV
@@ -95,7 +95,10 @@ def create_csv_detailed_cooling_demand(
         output[k] = v._append(tempLimits[k], ignore_index=True)
 
     # Write out to CSV
+    output_paths = []
     for k, v in output.items():
         new_filename = clean_file_name("{}_{}.csv".format(_output_path.stem, k))
         output_path = pathlib.Path(_output_path.parents[0], new_filename)
         v.to_csv(output_path, index=False)
+        output_paths.append(output_path)
+    return output_paths
@@ -8,6 +8,8 @@ import pathlib
 import numpy as np
 import pandas as pd
 
+from honeybee_ph_plus_rhino.phpp.bt_web._unit_conversions import SI_TO_IP
+
 
 def create_csv_fresh_air_flowrates(
     _df_vent: pd.DataFrame, _output_path: pathlib.Path
@@ -53,10 +55,10 @@ def create_csv_fresh_air_flowrates(
     rm_vent_df2 = rm_vent_df1.dropna(axis=0, subset=["Room name"])
 
     # Calc the flow rates for high, med and low for each room
-    unitFactor_flow = 0.588577779  # m3/h---> cfm
-    unitFactor_vol = 35.31466672  # m3 --> ft3
-    unitFactor_area = 10.76391042  # m3 --> ft3
-    unitFactor_length = 3.280839895  # m --> ft
+    unitFactor_flow = SI_TO_IP["m3/h"].factor  # m3/h---> cfm
+    unitFactor_vol = SI_TO_IP["m3"].factor  # m3 --> ft3
+    unitFactor_area = SI_TO_IP["m2"].factor  # m2 --> ft2
+    unitFactor_length = SI_TO_IP["m"].factor  # m --> ft
 
     flowRate_Sup_High = (
         rm_vent_df2["V_Supply"].values
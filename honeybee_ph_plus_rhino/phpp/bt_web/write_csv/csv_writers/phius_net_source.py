@@ -97,14 +97,14 @@ def reduce_energy_by_solar(_df_main: pd.DataFrame, _pe_df: pd.DataFrame) -> pd.D
     # drop the 'PE' row
     pe_df2 = pe_df1.drop(pe_df1[pe_df1["Datatype"] == "PE"].index)
 
-    # -- Sum up the totals for each column
-    totals = pe_df2.sum(axis=0, numeric_only=False)
+    # -- Sum up the totals for each of the data columns
+    totals = pe_df2.drop(columns=["Datatype", "Units"]).sum(axis=0, numeric_only=False)
     totals["Datatype"] = "Totals"
-    totals["Units"] = None
+    totals["Units"] = ""
     """
     totals = 
         Datatype                Totals
-        Units                     None
+        Units                         
         Code Minimum       74307.85775
         Insulation        68476.059319
         Airtight + ERV    54316.624202
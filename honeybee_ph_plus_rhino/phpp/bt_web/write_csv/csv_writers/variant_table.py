@@ -4,41 +4,38 @@
 """Export Variant Data Table CSV files from the Main PHPP DataFrme"""
 
 import pathlib
+from collections.abc import Iterator, Mapping
 
 import numpy as np
 import pandas as pd
 
+from honeybee_ph_plus_rhino.phpp.bt_web._unit_conversions import convert_rows_to_ip
 from honeybee_ph_plus_rhino.phpp.bt_web._variants_data_schema import VARIANTS
 
 pd.options.mode.chained_assignment = None  # default='warn'
 
 
-def row_has_data(row: pd.Series) -> bool:
-    """Check if the 'data' (everything except 'Datatype') in the row is blank.
+def row_has_data(_df: pd.DataFrame) -> pd.Series:
+    """Check which rows have 'data' (everything except 'Datatype') which is not blank.
 
     Arguments:
     ----------
-        * pd.Series: The row to check.
+        * _df (pd.DataFrame): The rows to check.
 
     Returns:
     --------
-        * bool: True if the row has data, False if it is blank.
+        * pd.Series: A boolean mask, True for each row with data, False if it is blank.
     """
     # Exclude the 'Datatype' column and check if any value is non-empty
-    return row.drop(labels="Datatype").astype(str).str.strip().ne("").any()
+    data = _df.drop(columns="Datatype").to_numpy(dtype=str)
+    return pd.Series((np.char.strip(data) != "").any(axis=1), index=_df.index)
 
 
-def split_table_into_sections(_variants_data: pd.DataFrame) -> dict[str, pd.DataFrame]:
-    """
-    Split the DataFrame into sections based on rows where 'Datatype' is a section header.
-
-    Arguments:
-    ----------
-        * _variants_data (pd.DataFrame): The input DataFrame containing the variant data.
+class VariantTableSections(Mapping):
+    """A lazy, read-only view of the 'sections' of the Variant Data Table.
 
-    Returns:
-    --------
-        * dict[str, pd.DataFrame]: A dictionary where keys are section names and values are DataFrames for each section.
+    The section's row-ranges are found up front using the 'break' rows in the
+    index, but each section's DataFrame is only built when it is first accessed.
 
     Example DataFrame Input:
     --------
@@ -84,30 +81,56 @@ def split_table_into_sections(_variants_data: pd.DataFrame) -> dict[str, pd.Data
         [37 rows x 7 columns]
     """
 
-    # Look for the 'break' in the index, use that to delineate the 'section' of the DataFrame
-    sections: dict[str, pd.DataFrame] = {}
-    current_section = ""
-    for index, row in _variants_data.iterrows():
-        # If it is a blank row, skip it
-        if row["Datatype"] == "":
-            continue
+    def __init__(self, _variants_data: pd.DataFrame) -> None:
+        self._variants_data = _variants_data
+        self._sections: dict[str, pd.DataFrame] = {}
+
+        # -- Look for the 'break' in the index, use that to delineate the 'section' of the DataFrame
+        self._row_ranges: dict[str, list[tuple[int, int]]] = {}
+        break_positions = np.flatnonzero(_variants_data.index == "break").tolist()
+        for start, end in zip(break_positions, break_positions[1:] + [len(_variants_data)]):
+            section_name = str(_variants_data["Datatype"].iat[start]).upper().strip().replace(" ", "_")
+            self._row_ranges.setdefault(section_name, []).append((start + 1, end))
 
-        # If it is a break, set the current section to the new section
-        if index == "break":
-            current_section = str(row["Datatype"]).upper().strip().replace(" ", "_")
-            if current_section not in sections:
-                sections[current_section] = pd.DataFrame()
-        else:
-            if not row_has_data(row):
-                continue
+    def _build_section(self, _section_name: str) -> pd.DataFrame:
+        """Return a new DataFrame with only the non-blank rows of the section."""
+        section_df = pd.concat([self._variants_data.iloc[start:end] for start, end in self._row_ranges[_section_name]])
 
-            # --  Add the row to the current section
-            sections[current_section] = pd.concat(
-                [sections[current_section], row.to_frame().T], ignore_index=True
-            )
-            sections[current_section].reset_index(drop=True, inplace=True)
+        # -- Skip any rows with a blank 'Datatype', or without any data
+        section_df = section_df[section_df["Datatype"] != ""]
+        section_df = section_df[row_has_data(section_df)]
+        if section_df.empty:
+            return pd.DataFrame()
+        return section_df.astype(object).reset_index(drop=True)
 
-    return sections
+    def __getitem__(self, _section_name: str) -> pd.DataFrame:
+        if _section_name not in self._sections:
+            self._sections[_section_name] = self._build_section(_section_name)
+        return self._sections[_section_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._row_ranges)
+
+    def __len__(self) -> int:
+        return len(self._row_ranges)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self._row_ranges)})"
+
+
+def split_table_into_sections(_variants_data: pd.DataFrame) -> VariantTableSections:
+    """Split the DataFrame into sections based on rows where 'Datatype' is a section header.
+
+    Arguments:
+    ----------
+        * _variants_data (pd.DataFrame): The input DataFrame containing the variant data.
+
+    Returns:
+    --------
+        * VariantTableSections: A lazy mapping where keys are section names and values are
+            DataFrames for each section. Each section is only built when it is accessed.
+    """
+    return VariantTableSections(_variants_data)
 
 
 def clean_variant_table_data(
@@ -173,6 +196,8 @@ def clean_variant_table_data(
     env_end_row = VARIANTS.envelope.end_row()
     env_df1 = _df_main.loc[env_start_row:env_end_row]
     env_df1 = pd.DataFrame(env_df1)
+    # -- Units is a categorical, allow it to take on the new IP-unit labels
+    env_df1["Units"] = env_df1["Units"].astype(object)
     new_datatype_column = (
         env_df1["Datatype"].str.replace("_", " ").str.replace("Generic ", "")
     )
@@ -181,17 +206,11 @@ def clean_variant_table_data(
     env_df1["Datatype"] = new_datatype_column
 
     # Convert in the envelope leakage rate
-    q50_ip1 = (
-        env_df1.loc[VARIANTS.envelope["Envelope Air Leakage Rate (q50)"].row][
-            _variant_names
-        ]
-        * 0.054680665
-    )
-    q50_ip2 = pd.Series(
-        ["Envelope Air Leakage Rate (q50)", "cfm/ft2"], index=["Datatype", "Units"]
+    convert_rows_to_ip(
+        env_df1,
+        {VARIANTS.envelope["Envelope Air Leakage Rate (q50)"].row: "m3/hm2"},
+        _variant_names,
     )
-    q50_ip3 = pd.concat([q50_ip2, q50_ip1])
-    env_df1.loc[VARIANTS.envelope["Envelope Air Leakage Rate (q50)"].row] = q50_ip3
     env_results_df2 = env_df1.dropna(how="any")
 
     # Systems
@@ -203,35 +222,18 @@ def clean_variant_table_data(
 
     # drop the 'SYSTEMS' row
     sys_df2 = sys_df1.drop(sys_df1[sys_df1["Datatype"] == "SYSTEMS"].index)
-
-    # Re-set the units for duct
-    duct_len_s1 = (
-        sys_df2.loc[VARIANTS.systems["Cold Air Duct Length (ea)"].row][_variant_names]
-        * 3.280839895
-    )
-    duct_len_s2 = pd.Series(
-        ["Cold Air Duct Length (ea)", "ft"], index=["Datatype", "Units"]
+    sys_df2["Units"] = sys_df2["Units"].astype(object)
+
+    # Re-set the units for duct length and insulation
+    sys_df3 = convert_rows_to_ip(
+        sys_df2,
+        {
+            VARIANTS.systems["Cold Air Duct Length (ea)"].row: "m",
+            VARIANTS.systems["Cold Air Duct Insulation Thickness"].row: "mm",
+        },
+        _variant_names,
     )
-    duct_len_s3 = pd.concat([duct_len_s2, duct_len_s1])
-
-    sys_df3 = sys_df2.copy(deep=True)
-    sys_df3.loc[VARIANTS.systems["Cold Air Duct Length (ea)"].row] = duct_len_s3
-
-    # Insulation
-    duct_insul_s1 = (
-        sys_df3.loc[VARIANTS.systems["Cold Air Duct Insulation Thickness"].row][
-            _variant_names
-        ]
-        * 0.039370079
-    )
-    ductInsul_s2 = pd.Series(
-        ["Cold Air Duct Insulation Thickness", "inches"], index=["Datatype", "Units"]
-    )
-    ductInsul_s3 = pd.concat([ductInsul_s2, duct_insul_s1])
-
-    sys_df4 = sys_df3.copy(deep=True)
-    sys_df4.loc[VARIANTS.systems["Cold Air Duct Insulation Thickness"].row] = ductInsul_s3
-    sys_df5 = sys_df4.reset_index(drop=True)
+    sys_df4 = sys_df3.reset_index(drop=True)
 
     # Add the breaks
     brk_env = pd.DataFrame(np.nan, index=["break"], columns=_df_main.columns.tolist())
@@ -246,7 +248,7 @@ def clean_variant_table_data(
     # --------------------------------------------------------------------------
     # -- Build the final df in the right order
     variants_data_df1 = pd.concat(
-        [brk_env, env_results_df2, brk_sys, sys_df5, brk_results, key_results_df]
+        [brk_env, env_results_df2, brk_sys, sys_df4, brk_results, key_results_df]
     )
     variants_data_df2 = variants_data_df1.fillna("")
     return variants_data_df2
@@ -256,7 +258,7 @@ def create_csv_variant_table(
     _df_main: pd.DataFrame,
     _variant_names: pd.Series,
     _file_path: pathlib.Path,
-) -> None:
+) -> list[pathlib.Path]:
     """Create the comprehensive Variant Data Table with bits from all over the place.
 
     Arguments:
@@ -267,13 +269,14 @@ def create_csv_variant_table(
 
     Returns:
     --------
-        * None
+        * (list[pathlib.Path]): The paths of the CSV files written: the full table, then each section.
     """
 
     # --------------------------------------------------------------------------
     # Export the full table to csv
     variants_data_complete = clean_variant_table_data(_df_main, _variant_names)
     variants_data_complete.to_csv(_file_path, index=False)
+    output_paths = [_file_path]
 
     # --------------------------------------------------------------------------
     # Break up the Table into 'sections'
@@ -282,3 +285,5 @@ def create_csv_variant_table(
     ).items():
         section_file_path = _file_path.parent / f"{_file_path.stem}_{section_name}.csv"
         section_df.to_csv(section_file_path, index=False)
+        output_paths.append(section_file_path)
+    return output_paths
@@ -6,6 +6,7 @@
 from pathlib import Path
 
 from honeybee_ph_plus_rhino.phpp.bt_web._types import PHPPData
+from honeybee_ph_plus_rhino.phpp.bt_web.write_csv.csv_bundle import create_csv_bundle
 from honeybee_ph_plus_rhino.phpp.bt_web.write_csv.csv_writers import (
     create_csv_airtightness,
     create_csv_bldg_basic_data_table,
@@ -44,75 +45,84 @@ def create_csv_files(_csv_file_path: Path, _phpp_data: PHPPData) -> None:
 
     print(f'> Writing out CSV files to: "{_csv_file_path}/..."')
 
+    # -- The CSV files written in this run (not just any .csv file already in the folder)
+    csv_files: list[Path] = []
+
+    def csv_file(_name: str) -> Path:
+        """Return the path for a new CSV file, and add it to the run's list of files."""
+        path = _csv_file_path / _name
+        csv_files.append(path)
+        return path
+
     # --- Heating and Cooling Data
     create_csv_heating_and_cooling_demand(
         _phpp_data.df_variants,
         _phpp_data.df_tfa,
         _phpp_data.df_certification_limits,
-        _csv_file_path / "demand_HeatAndCool.csv",
+        csv_file("demand_HeatAndCool.csv"),
     )
     create_csv_heating_demand(
         _phpp_data.df_variants,
         _phpp_data.df_tfa,
         _phpp_data.df_certification_limits,
-        _csv_file_path / "demand_Phius_heating.csv",
+        csv_file("demand_Phius_heating.csv"),
     )
     create_csv_cooling_demand(
         _phpp_data.df_variants,
         _phpp_data.df_tfa,
         _phpp_data.df_certification_limits,
-        _csv_file_path / "demand_Phius_cooling.csv",
+        csv_file("demand_Phius_cooling.csv"),
     )
     create_csv_heating_load(
         _phpp_data.df_variants,
         _phpp_data.df_tfa,
         _phpp_data.df_certification_limits,
-        _csv_file_path / "load_Phius_heating.csv",
+        csv_file("load_Phius_heating.csv"),
     )
     create_csv_cooling_load(
         _phpp_data.df_variants,
         _phpp_data.df_tfa,
         _phpp_data.df_certification_limits,
-        _csv_file_path / "load_Phius_cooling.csv",
+        csv_file("load_Phius_cooling.csv"),
     )
     create_csv_Phius_net_source_energy(
         _phpp_data.df_variants,
         _phpp_data.df_certification_limits,
-        _csv_file_path / "Phius_net_source_energy.csv",
+        csv_file("Phius_net_source_energy.csv"),
     )
     create_csv_SiteEnergy(
         _phpp_data.df_variants,
-        _csv_file_path / "energy_Site.csv",
+        csv_file("energy_Site.csv"),
     )
 
     # --- CO2 Emissions
     create_csv_CO2E(
         _phpp_data.df_variants,
-        _csv_file_path / "energy_TonsCO2.csv",
+        csv_file("energy_TonsCO2.csv"),
     )
     # --- PER
     create_csv_PER(
         _phpp_data.df_variants,
-        _csv_file_path / "energy_PER.csv",
+        csv_file("energy_PER.csv"),
     )
 
     # --- Get the Model Variants info
-    create_csv_variant_table(
+    csv_files += create_csv_variant_table(
         _phpp_data.df_variants,
         _phpp_data.variant_names,
         _csv_file_path / "variant_inputs.csv",
     )
     create_csv_bldg_basic_data_table(
-        _phpp_data.df_variants, _csv_file_path / "bldg_data.csv"
+        _phpp_data.df_variants, csv_file("bldg_data.csv")
     )
 
     # --- Create Detailed Heating, Cooling Demand
-    create_csv_detailed_heating_demand(
+    csv_files += create_csv_detailed_heating_demand(
         _phpp_data.df_variants,
         _phpp_data.df_certification_limits,
         _csv_file_path / "heating_demand.csv",
     )
-    create_csv_detailed_cooling_demand(
+    csv_files += create_csv_detailed_cooling_demand(
         _phpp_data.df_variants,
         _phpp_data.df_certification_limits,
         _csv_file_path / "cooling_demand.csv",
@@ -120,16 +130,20 @@ def create_csv_files(_csv_file_path: Path, _phpp_data: PHPPData) -> None:
 
     # --- Airtightness
     create_csv_airtightness(
-        _phpp_data.df_variants, _csv_file_path / "envelope_airflow.csv"
+        _phpp_data.df_variants, csv_file("envelope_airflow.csv")
     )
 
     # --- Climate
-    create_csv_radiation(_phpp_data.df_climate, _csv_file_path / "climate_radiation.csv")
-    create_csv_temperatures(_phpp_data.df_climate, _csv_file_path / "climate_temps.csv")
+    create_csv_radiation(_phpp_data.df_climate, csv_file("climate_radiation.csv"))
+    create_csv_temperatures(_phpp_data.df_climate, csv_file("climate_temps.csv"))
 
     # --- Mechanical
     create_csv_fresh_air_flowrates(
-        _phpp_data.df_room_vent, _csv_file_path / "room_airflows.csv"
+        _phpp_data.df_room_vent, csv_file("room_airflows.csv")
     )
 
     print(f"> Done writing CSV files.")
+
+    # --- Single-file bundle of all the CSV data, for the web-dashboard
+    bundle_file = create_csv_bundle(_csv_file_path, csv_files)
+    print(f'> Wrote CSV data bundle to: "{bundle_file}"')
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""CustomCollection secondary indexes: mixed value kinds, and items an index cannot hold."""
+
+import pytest
+
+# -- The modules import the GH component-IO package: skip if it is not installed.
+collection_index = pytest.importorskip(
+    "honeybee_ph_plus_rhino.gh_compo_io.collections.collection_index", exc_type=ImportError
+)
+new_collection = pytest.importorskip(
+    "honeybee_ph_plus_rhino.gh_compo_io.collections.create_new_collection", exc_type=ImportError
+)
+
+
+def make_collection(_num_items=5):
+    collection = new_collection.CustomCollection("test")
+    for i in range(_num_items):
+        collection["k{}".format(i)] = {"SIZE": i, "TYPE": "ERV" if i % 2 else "HRV"}
+    return collection
+
+
+def test_sorted_index_rejects_mixed_numbers_and_text_at_build():
+    index = collection_index.SortedIndex("SIZE")
+    with pytest.raises(ValueError, match="'SIZE'"):
+        index.build([("a", {"SIZE": 1}), ("b", {"SIZE": "2"}), ("c", {"SIZE": 3.5})])
+
+
+def test_sorted_index_rejects_mixed_values_on_add_and_query():
+    index = collection_index.SortedIndex("SIZE")
+    index.build([("a", {"SIZE": 1}), ("b", {"SIZE": True}), ("c", {"SIZE": 2.5})])
+
+    assert index.between(1, 2) == ["a", "b"]
+    with pytest.raises(ValueError, match="'SIZE'"):
+        index.add("x", {"SIZE": "big"})
+    with pytest.raises(ValueError, match="'SIZE'"):
+        index.between("1")
+    assert index.between() == ["a", "b", "c"]
+
+
+def test_set_item_with_unhashable_value_is_stored_and_drops_the_hash_index():
+    collection = make_collection()
+    assert collection.find("TYPE", _equals=["ERV"]) == ["k1", "k3"]
+    assert collection.find("SIZE", _min=3) == ["k3", "k4"]
+
+    collection["d"] = {"SIZE": 9, "TYPE": ["not", "hashable"]}
+
+    assert "d" in collection
+    assert collection["d"]["TYPE"] == ["not", "hashable"]
+    assert len(collection) == 6
+    # -- The other index was kept up to date
+    assert collection.find("SIZE", _min=3) == ["k3", "k4", "d"]
+    # -- The dropped index is rebuilt by the next query, which raises
+    with pytest.raises(TypeError):
+        collection.find("TYPE", _equals=["ERV"])
+
+
+def test_set_item_with_text_in_a_sorted_index_of_numbers():
+    collection = make_collection().with_item("k9", {"SIZE": 9})  # -- A collection with layers
+    assert collection.find("SIZE", _min=4) == ["k4", "k9"]
+
+    collection["k2"] = {"SIZE": "big"}
+    collection["new"] = {"SIZE": 1}
+
+    assert collection["k2"] == {"SIZE": "big"}
+    assert len(collection) == 7
+    with pytest.raises(ValueError, match="'SIZE'"):
+        collection.find("SIZE", _min=4)
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Create Objects From CSV: the dict-based CustomObject and the slotted CustomRecord types."""
+
+import copy
+
+import pytest
+
+# -- The module imports the GH component-IO package: skip if it is not installed.
+csv_objects = pytest.importorskip(
+    "honeybee_ph_plus_rhino.gh_compo_io.collections.create_items_from_csv", exc_type=ImportError
+)
+
+
+class MessageRecorder:
+    """Records the messages the component would add to the GH component."""
+
+    def __init__(self):
+        self.errors: list[str] = []
+        self.warnings: list[str] = []
+
+    def error(self, _message):
+        self.errors.append(_message)
+
+    def warning(self, _message):
+        self.warnings.append(_message)
+
+
+def read(_rows, _datatypes=()):
+    component = csv_objects.GHCompo_CreateObjectsFromCSV(MessageRecorder(), None, "Room", list(_datatypes))
+    return list(component.build_objects_from_data(_rows))
+
+
+def test_custom_object_kwargs_constructor():
+    obj = csv_objects.CustomObject(name=" x ", Area=" 12 ")
+
+    assert obj.NAME == "x"
+    assert obj.AREA == "12"
+    assert vars(obj) == {"NAME": "x", "AREA": "12"}
+    assert str(obj) in ("CustomObject({'NAME': 'x', 'AREA': '12'})", "CustomObject({'AREA': '12', 'NAME': 'x'})")
+
+
+def test_custom_object_from_values_and_later_attributes():
+    object_type = type("Room", (csv_objects.CustomObject,), {"fields": ("NAME", "AREA")})
+    obj = object_type.from_values(["a", 1.5])
+    obj.EXTRA = 1
+
+    assert vars(obj) == {"NAME": "a", "AREA": 1.5, "EXTRA": 1}
+
+
+def test_records_have_no_dict_or_weakref():
+    record = read([["NAME", "AREA"], ["a", "1.5"]], ["AREA:float"])[0]
+
+    assert not hasattr(record, "__dict__")
+    assert not hasattr(record, "__weakref__")
+    assert record.to_dict() == {"NAME": "a", "AREA": 1.5}
+    assert str(record) == "Room({'NAME': 'a', 'AREA': 1.5})"
+
+
+def test_header_which_cannot_be_a_slot_goes_in_the_dict():
+    record = read([["NAME", "room type"], ["a", "kitchen"]])[0]
+
+    assert record.NAME == "a"
+    assert getattr(record, "ROOM TYPE") == "kitchen"
+    assert vars(record) == {"ROOM TYPE": "kitchen"}
+    assert record.to_dict() == {"NAME": "a", "ROOM TYPE": "kitchen"}
+
+
+def test_copy_and_with_attribute():
+    record = read([["NAME", "AREA"], ["a", "1.5"]])[0]
+
+    copied = copy.copy(record)
+    assert copied is not record
+    assert type(copied) is type(record)
+    assert copied.to_dict() == record.to_dict()
+
+    # -- A slot: a copy of the same type. Any other key: a copy of the type with a __dict__.
+    changed = record.with_attribute("AREA", "2")
+    assert type(changed) is type(record)
+    assert changed.AREA == "2"
+    assert record.AREA == "1.5"
+
+    extended = record.with_attribute("NEW", 5)
+    assert isinstance(extended, type(record))
+    assert extended.to_dict() == {"NAME": "a", "AREA": "1.5", "NEW": 5}
+    assert type(extended.with_attribute("OTHER", 6)) is type(extended)
+    assert not hasattr(record, "NEW")
+
+
+def test_empty_typed_value_is_none_like_a_short_row():
+    blank, short = read([["NAME", "AREA"], ["a", ""], ["b"]], ["AREA:float"])
+
+    assert blank.AREA is None
+    assert short.AREA is None
+
+
+def test_empty_text_value_stays_text():
+    record = read([["NAME", "AREA"], ["", "1"]], ["AREA:int"])[0]
+
+    assert record.NAME == ""
+    assert record.AREA == 1
+
+
+def test_value_which_cannot_be_cast_names_its_row():
+    with pytest.raises(ValueError, match="Row 3"):
+        read([["NAME", "AREA"], ["a", "1"], ["b", "wide"]], ["AREA:float"])
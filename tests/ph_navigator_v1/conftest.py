@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Fixtures for the PHNavV1Client tests: a stub API server and clients pointed at it."""
+
+import pytest
+
+from tests.ph_navigator_v1.stub_server import BT_NUMBER, StubServer
+
+# -- The client module imports the GH component-IO package (and the plugin's package
+# -- `__init__` the rest of the GH components): skip if those are not installed.
+client_module = pytest.importorskip("honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.client", exc_type=ImportError)
+response_cache = pytest.importorskip(
+    "honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.response_cache", exc_type=ImportError
+)
+transport = pytest.importorskip("honeybee_ph_plus_rhino.gh_compo_io.ph_navigator.v1.transport", exc_type=ImportError)
+
+
+class MessageRecorder:
+    """Records the messages the client would add to the GH component."""
+
+    def __init__(self):
+        self.errors: list[str] = []
+        self.warnings: list[str] = []
+
+    def error(self, _message):
+        self.errors.append(_message)
+
+    def warning(self, _message):
+        self.warnings.append(_message)
+
+
+@pytest.fixture
+def stub():
+    server = StubServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return response_cache.PHNavResponseCache(str(tmp_path / "ph_navigator_cache"))
+
+
+@pytest.fixture
+def make_client(stub, cache):
+    """Return a function which makes a new client (ie: a new component solve) sharing one cache folder."""
+
+    def _make_client(_version=None):
+        client = client_module.PHNavV1Client(
+            MessageRecorder(), BT_NUMBER, stub.url_base, _version=_version, _transport=transport.PythonTransport(5)
+        )
+        client.cache = cache
+        return client
+
+    return _make_client
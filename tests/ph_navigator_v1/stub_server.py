@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""A local stand-in for the PH-Navigator V1 read API, for the client tests.
+
+Serves one project ("1234") with the V1 response envelope on each route, and
+answers conditional GETs the way the real server does: a `304 Not Modified` when
+the request's `If-None-Match` matches the current `ETag`, or (with no
+`If-None-Match`) when `If-Modified-Since` is not older than `Last-Modified`.
+Every request, and every full-body (200) response, is counted so a test can
+check what went over the wire.
+"""
+
+import hashlib
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+BT_NUMBER = "1234"
+
+
+class StubState:
+    """The project data the stub serves, and the counts of what it has sent."""
+
+    def __init__(self):
+        self.version_id = "v1"
+        self.modified_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.payloads = {
+            "/aperture-types": {"aperture_types": {"W-1": {"name": "W-1", "rows": [1, 2]}}},
+            "/tables/rooms": {"records": [{"id": "R-1", "name": "Kitchen"}], "field_defs": []},
+        }
+        self.send_etag = True
+        self.send_last_modified = True
+        self.requests: list[dict] = []
+        self.full_responses = 0
+        self.not_modified_responses = 0
+        self.lock = threading.Lock()
+
+    def change(self, _route, _payload):
+        """Replace a route's payload: a new saved version, with a later modified time."""
+        with self.lock:
+            self.payloads[_route] = _payload
+            self.version_id = f"v{int(self.version_id[1:]) + 1}"
+            self.modified_at += timedelta(hours=1)
+
+    def envelope(self, _route):
+        envelope = {
+            "schema_version": 1,
+            "project": {"bt_number": BT_NUMBER, "project_id": 1, "name": "Stub Project"},
+            "version_id": self.version_id,
+            "last_modified": self.modified_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "warnings": [],
+        }
+        envelope.update(self.payloads[_route])
+        return envelope
+
+
+class _Handler(BaseHTTPRequestHandler):
+    state: StubState
+
+    def log_message(self, *args):
+        pass  # -- Keep the test output quiet
+
+    def do_GET(self):
+        state = self.state
+        route = urlparse(self.path).path.split(f"/projects/{BT_NUMBER}", 1)[-1]
+        with state.lock:
+            state.requests.append(
+                {
+                    "path": self.path,
+                    "If-None-Match": self.headers.get("If-None-Match"),
+                    "If-Modified-Since": self.headers.get("If-Modified-Since"),
+                }
+            )
+            if route not in state.payloads:
+                self._send(404, json.dumps({"message": "Unknown route"}).encode("utf-8"), {})
+                return
+
+            body = json.dumps(state.envelope(route)).encode("utf-8")
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            last_modified = format_datetime(state.modified_at, usegmt=True)
+
+            if self._not_modified(state, etag):
+                state.not_modified_responses += 1
+                self._send(304, b"", {})
+                return
+
+            state.full_responses += 1
+            headers = {"Content-Type": "application/json"}
+            if state.send_etag:
+                headers["ETag"] = etag
+            if state.send_last_modified:
+                headers["Last-Modified"] = last_modified
+            self._send(200, body, headers)
+
+    def _not_modified(self, _state, _etag):
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            return _state.send_etag and if_none_match == _etag
+
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since is not None and _state.send_last_modified:
+            try:
+                return parsedate_to_datetime(if_modified_since) >= _state.modified_at
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _send(self, _status, _body, _headers):
+        self.send_response(_status)
+        for name, value in _headers.items():
+            self.send_header(name, value)
+        if _status != 304:
+            self.send_header("Content-Length", str(len(_body)))
+        self.end_headers()
+        self.wfile.write(_body)
+
+
+class StubServer:
+    """The stub API on a free local port, served from a background thread."""
+
+    def __init__(self):
+        self.state = StubState()
+        handler = type("Handler", (_Handler,), {"state": self.state})
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url_base(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}/api/v1/gh"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
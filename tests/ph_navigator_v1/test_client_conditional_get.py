@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""PHNavV1Client conditional GETs: ETag / If-Modified-Since revalidation of cached responses."""
+
+import os
+
+APERTURE_TYPES = {"W-1": {"name": "W-1", "rows": [1, 2]}}
+
+
+def test_first_get_downloads_in_full_and_caches_the_validators(stub, cache, make_client):
+    client = make_client()
+
+    assert client.get_aperture_types() == APERTURE_TYPES
+    assert stub.state.full_responses == 1
+    assert stub.state.requests[0]["If-None-Match"] is None
+
+    meta = cache.load_meta(client._cache_key("/aperture-types"))
+    assert meta["etag"]
+    assert meta["http_last_modified"]
+    assert meta["version_id"] == "v1"
+
+
+def test_etag_round_trip_304_reuses_the_cached_envelope(stub, make_client):
+    make_client().get_aperture_types()
+    first_request = stub.state.requests[0]
+
+    client = make_client()
+    assert client.get_aperture_types() == APERTURE_TYPES
+    assert client.version_id == "v1"
+    assert client.last_modified == "2026-01-01T00:00:00Z"
+    assert not client.IGH.errors
+
+    # -- One full body, then one 304: no probe of the versions route.
+    assert stub.state.full_responses == 1
+    assert stub.state.not_modified_responses == 1
+    assert len(stub.state.requests) == 2
+    assert stub.state.requests[1]["If-None-Match"] is not None
+    assert stub.state.requests[1]["path"] == first_request["path"]
+
+
+def test_if_modified_since_round_trip_without_an_etag(stub, make_client):
+    stub.state.send_etag = False
+    make_client().get_table("rooms")
+
+    client = make_client()
+    records, _ = client.get_table("rooms")
+
+    assert records == [{"id": "R-1", "name": "Kitchen"}]
+    assert stub.state.full_responses == 1
+    assert stub.state.not_modified_responses == 1
+    assert stub.state.requests[1]["If-None-Match"] is None
+    assert stub.state.requests[1]["If-Modified-Since"] == "Thu, 01 Jan 2026 00:00:00 GMT"
+
+
+def test_changed_body_forces_a_full_refetch(stub, cache, make_client):
+    make_client().get_aperture_types()
+
+    new_types = {"W-2": {"name": "W-2", "rows": [3]}}
+    stub.state.change("/aperture-types", {"aperture_types": new_types})
+
+    client = make_client()
+    assert client.get_aperture_types() == new_types
+    assert client.version_id == "v2"
+    assert stub.state.full_responses == 2
+    assert stub.state.not_modified_responses == 0
+
+    # -- The new response replaced the cached one: the next solve is a 304 again.
+    assert make_client().get_aperture_types() == new_types
+    assert stub.state.full_responses == 2
+    assert stub.state.not_modified_responses == 1
+    assert cache.load_meta(client._cache_key("/aperture-types"))["version_id"] == "v2"
+
+
+def test_304_with_the_cached_body_gone_downloads_in_full(stub, cache, make_client):
+    client = make_client()
+    client.get_aperture_types()
+    os.remove(cache._body_path(client._cache_key("/aperture-types")))
+
+    client = make_client()
+    assert client.get_aperture_types() == APERTURE_TYPES
+    assert stub.state.not_modified_responses == 1
+    assert stub.state.full_responses == 2
+    assert not client.IGH.errors
+
+
+def test_pinned_version_is_served_from_the_cache_with_no_request(stub, make_client):
+    make_client("v1").get_aperture_types()
+    requests_sent = len(stub.state.requests)
+
+    assert make_client("v1").get_aperture_types() == APERTURE_TYPES
+    assert len(stub.state.requests) == requests_sent